@@ -0,0 +1,29 @@
+"""
+Optional Numba JIT support.
+
+Numba is an optional dependency. When it is installed, ``njit`` and
+``prange`` are re-exported from it; otherwise ``njit`` degrades to a
+no-op decorator and ``prange`` to ``range`` so kernels still import and
+run as plain Python.
+"""
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for ``numba.njit`` (bare or with options)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+__all__ = ["njit", "prange", "NUMBA_AVAILABLE"]
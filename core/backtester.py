@@ -8,9 +8,16 @@ NOTE: Uses FractionalBacktest from backtesting.lib to support crypto
 trading where asset prices may exceed account balance.
 """
 
+import functools
+import importlib
 import logging
+import math
+import os
+import weakref
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional, Tuple, Any
 
+import numpy as np
 import pandas as pd
 from backtesting import Backtest
 from backtesting.lib import SignalStrategy, TrailingStrategy
@@ -27,12 +34,74 @@ from .data_source import DataSource
 from .sql_data_source import SQLDataSource
 from .ccxt_data_source import CCXTDataSource
 from .exchange_client import ExchangeClient
+from db.persistence import save_backtest_to_db
 from strategies.trend_ema import TrendEmaBacktest
 
 logger = logging.getLogger(__name__)
 
+# Column mapping to Backtesting.py's capitalized OHLCV names
+_OHLCV_COLUMNS = {
+    "open": "Open",
+    "high": "High",
+    "low": "Low",
+    "close": "Close",
+    "volume": "Volume",
+}
+_BACKTEST_COLUMNS = list(_OHLCV_COLUMNS.values())
 
-def prepare_ohlcv_for_backtesting(df: pd.DataFrame) -> pd.DataFrame:
+_BANNER = "=" * 60
+
+# Recently prepared frames: id(input) -> (weakref to input, key, prepared)
+_PREP_CACHE_SIZE = 16
+_prep_cache: dict[int, tuple[weakref.ref, tuple, pd.DataFrame]] = {}
+
+# Strategy registry: name -> (module, Backtesting.py strategy class).
+# Classes are imported on first use by _get_strategy.
+_STRATEGY_PATHS = {
+    "TREND_EMA": ("strategies.trend_ema", "TrendEmaBacktest"),
+    "MR_BB": ("strategies.mean_reversion_bb", "MeanReversionBBBacktest"),
+    "SQZ_BO": ("strategies.squeeze_breakout", "SqueezeBreakoutBacktest"),
+    "GRID_LR": ("strategies.grid_ladder", "GridLadderBacktest"),
+    "SUPERTREND": ("strategies.supertrend", "SuperTrendBacktest"),
+    "RSI_DIV": ("strategies.rsi_divergence", "RSIDivergenceBacktest"),
+    "MACD_X": ("strategies.macd_crossover", "MACDCrossoverBacktest"),
+    "ICHI": ("strategies.ichimoku", "IchimokuBacktest"),
+    "VWAP": ("strategies.vwap_bounce", "VWAPBounceBacktest"),
+    "DUAL_T": ("strategies.dual_thrust", "DualThrustBacktest"),
+    "TURTLE": ("strategies.turtle", "TurtleBacktest"),
+    "TRIPLE_MOMO": ("strategies.triple_momentum", "TripleMomentumBacktest"),
+    "TRIPLE_V2": ("strategies.triple_momentum_v2", "TripleMomentumV2Backtest"),
+    "VOL_HUNT": ("strategies.volatility_hunter", "VolatilityHunterBacktest"),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _get_strategy(name: str) -> type:
+    """Import and return the Backtesting.py strategy class registered as ``name``."""
+    if name not in _STRATEGY_PATHS:
+        raise ValueError(
+            f"Unknown strategy: {name}. "
+            f"Available: {', '.join(_STRATEGY_PATHS.keys())}"
+        )
+    module_name, class_name = _STRATEGY_PATHS[name]
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+@functools.lru_cache(maxsize=128)
+def _configured_strategy(base: type, name: str, params: tuple) -> type:
+    """
+    Subclass ``base`` with class-level parameter overrides.
+
+    Cached on (base, name, params) so repeated runs with the same
+    parameters reuse one class instead of building a new one per call.
+    """
+    return type(name, (base,), dict(params))
+
+
+def prepare_ohlcv_for_backtesting(
+    df: pd.DataFrame,
+    dtype: np.dtype = np.float64,
+) -> pd.DataFrame:
     """
     Prepare OHLCV DataFrame for Backtesting.py.
     
@@ -41,21 +110,44 @@ def prepare_ohlcv_for_backtesting(df: pd.DataFrame) -> pd.DataFrame:
     
     Args:
         df: DataFrame with lowercase columns (open, high, low, close, volume)
+        dtype: Column dtype. Pass np.float32 to halve memory traffic on large
+            backtests where ~7 significant digits of price are enough.
         
     Returns:
-        DataFrame with capitalized column names ready for Backtesting.py
+        DataFrame with only the capitalized OHLCV columns, ready for Backtesting.py
+
+    Preparing the same input frame again returns the cached result, so
+    input frames must not be modified in place between calls.
     """
-    # Make a copy to avoid modifying original
-    df = df.copy()
+    key = (len(df), getattr(df.index, "tz", None), np.dtype(dtype))
+    cached = _prep_cache.get(id(df))
+    if cached is not None and cached[0]() is df and cached[1] == key:
+        return cached[2]
+
+    prepared = _prepare_ohlcv(df, dtype)
+
+    if len(_prep_cache) >= _PREP_CACHE_SIZE:
+        _prep_cache.pop(next(iter(_prep_cache)))
+    # Evict as soon as the input frame is garbage-collected
+    ref = weakref.ref(df, lambda _ref, k=id(df): _prep_cache.pop(k, None))
+    _prep_cache[id(df)] = (ref, key, prepared)
+    return prepared
+
+
+def _prepare_ohlcv(df: pd.DataFrame, dtype: np.dtype) -> pd.DataFrame:
+    # Shallow copy: relabelling below must not touch the caller's frame,
+    # but the column data itself is shared rather than duplicated
+    df = df.copy(deep=False)
     
     # Rename columns to match Backtesting.py expectations
-    df = df.rename(columns={
-        "open": "Open",
-        "high": "High",
-        "low": "Low",
-        "close": "Close",
-        "volume": "Volume",
-    })
+    df.rename(columns=_OHLCV_COLUMNS, inplace=True)
+    
+    # Keep only what Backtesting.py consumes; extra source columns would
+    # otherwise be carried (and copied) through every backtest. Selecting
+    # columns copies on pandas < 3, so only do it when there is something
+    # to drop.
+    if list(df.columns) != _BACKTEST_COLUMNS:
+        df = df[_BACKTEST_COLUMNS]
     
     # Ensure index is datetime
     if not isinstance(df.index, pd.DatetimeIndex):
@@ -65,6 +157,9 @@ def prepare_ohlcv_for_backtesting(df: pd.DataFrame) -> pd.DataFrame:
     if df.index.tz is not None:
         df.index = df.index.tz_localize(None)
     
+    if dtype != np.float64:
+        df = df.astype(dtype)
+    
     return df
 
 
@@ -107,38 +202,37 @@ def run_trend_ema_backtest(
     Returns:
         Tuple of (stats, Backtest object)
     """
-    logger.info("=" * 60)
-    logger.info(f"Running Trend EMA Backtest")
-    logger.info(f"Symbol: {symbol}, Timeframe: {timeframe}")
-    logger.info(f"Cash: ${cash:,.2f}, Commission: {commission*100:.3f}%")
-    logger.info("=" * 60)
+    _log_header("Trend EMA", symbol, timeframe, cash, commission)
     
     # Get data source
     if use_sql:
-        logger.info(f"Using SQL data source")
+        logger.info("Using SQL data source")
         data_source: DataSource = SQLDataSource(db_url=db_url)
     else:
-        logger.info(f"Using CCXT data source (live)")
+        logger.info("Using CCXT data source (live)")
         client = ExchangeClient()
         data_source = CCXTDataSource(client)
     
     # Fetch OHLCV data
     df = data_source.get_ohlcv(symbol=symbol, timeframe=timeframe, limit=limit)
-    logger.info(f"Loaded {len(df)} candles")
+    logger.info("Loaded %d candles", len(df))
     
     # Prepare for backtesting
     df = prepare_ohlcv_for_backtesting(df)
     
-    # Create and configure strategy class with parameters
-    class ConfiguredTrendEma(TrendEmaBacktest):
-        pass
-    
-    ConfiguredTrendEma.ema_fast = ema_fast
-    ConfiguredTrendEma.ema_slow = ema_slow
-    ConfiguredTrendEma.atr_period = atr_period
-    ConfiguredTrendEma.atr_stop_mult = atr_stop_mult
-    ConfiguredTrendEma.rr_ratio = rr_ratio
-    ConfiguredTrendEma.risk_per_trade = risk_per_trade
+    # Configured strategy class (cached per parameter set)
+    ConfiguredTrendEma = _configured_strategy(
+        TrendEmaBacktest,
+        "ConfiguredTrendEma",
+        (
+            ("ema_fast", ema_fast),
+            ("ema_slow", ema_slow),
+            ("atr_period", atr_period),
+            ("atr_stop_mult", atr_stop_mult),
+            ("rr_ratio", rr_ratio),
+            ("risk_per_trade", risk_per_trade),
+        ),
+    )
     
     # Run backtest - use FractionalBacktest for crypto (price > cash)
     bt = FractionalBacktest(
@@ -151,18 +245,7 @@ def run_trend_ema_backtest(
     
     stats = bt.run()
     
-    # Log results
-    logger.info("=" * 60)
-    logger.info("BACKTEST RESULTS")
-    logger.info("=" * 60)
-    logger.info(f"Final Equity: ${stats['Equity Final [$]']:,.2f}")
-    logger.info(f"Return: {stats['Return [%]']:.2f}%")
-    logger.info(f"Max Drawdown: {stats['Max. Drawdown [%]']:.2f}%")
-    logger.info(f"# Trades: {stats['# Trades']}")
-    if stats['# Trades'] > 0:
-        logger.info(f"Win Rate: {stats['Win Rate [%]']:.1f}%")
-        logger.info(f"Avg Trade: {stats['Avg. Trade [%]']:.2f}%")
-    logger.info("=" * 60)
+    _log_results(stats)
     
     if persist:
         logger.warning("Persistence not yet implemented (Phase 5)")
@@ -199,111 +282,216 @@ def run_single_backtest(
         Tuple of (stats, Backtest object)
     """
     strategy_name = strategy_name.upper()
+    strategy_class = _get_strategy(strategy_name)
     
-    # Import strategies
-    from strategies.trend_ema import TrendEmaBacktest
-    from strategies.mean_reversion_bb import MeanReversionBBBacktest
-    from strategies.squeeze_breakout import SqueezeBreakoutBacktest
-    from strategies.grid_ladder import GridLadderBacktest
-    from strategies.supertrend import SuperTrendBacktest
-    from strategies.rsi_divergence import RSIDivergenceBacktest
-    from strategies.macd_crossover import MACDCrossoverBacktest
-    from strategies.ichimoku import IchimokuBacktest
-    from strategies.vwap_bounce import VWAPBounceBacktest
-    from strategies.dual_thrust import DualThrustBacktest
-    from strategies.turtle import TurtleBacktest
-    from strategies.triple_momentum import TripleMomentumBacktest
-    from strategies.triple_momentum_v2 import TripleMomentumV2Backtest
-    from strategies.volatility_hunter import VolatilityHunterBacktest
+    _log_header(strategy_name, symbol, timeframe, cash, commission)
     
-    STRATEGIES = {
-        "TREND_EMA": TrendEmaBacktest,
-        "MR_BB": MeanReversionBBBacktest,
-        "SQZ_BO": SqueezeBreakoutBacktest,
-        "GRID_LR": GridLadderBacktest,
-        "SUPERTREND": SuperTrendBacktest,
-        "RSI_DIV": RSIDivergenceBacktest,
-        "MACD_X": MACDCrossoverBacktest,
-        "ICHI": IchimokuBacktest,
-        "VWAP": VWAPBounceBacktest,
-        "DUAL_T": DualThrustBacktest,
-        "TURTLE": TurtleBacktest,
-        "TRIPLE_MOMO": TripleMomentumBacktest,
-        "TRIPLE_V2": TripleMomentumV2Backtest,
-        "VOL_HUNT": VolatilityHunterBacktest,
-    }
+    df = _get_prepared_ohlcv(use_sql, db_url, symbol, timeframe, limit)
     
-    if strategy_name not in STRATEGIES:
-        raise ValueError(
-            f"Unknown strategy: {strategy_name}. "
-            f"Available: {', '.join(STRATEGIES.keys())}"
-        )
+    # Run backtest
+    bt = FractionalBacktest(
+        df,
+        strategy_class,
+        cash=cash,
+        commission=commission,
+        exclusive_orders=True,
+    )
     
-    strategy_class = STRATEGIES[strategy_name]
+    stats = bt.run()
+    
+    _log_results(stats)
     
-    logger.info("=" * 60)
-    logger.info(f"Running {strategy_name} Backtest")
-    logger.info(f"Symbol: {symbol}, Timeframe: {timeframe}")
-    logger.info(f"Cash: ${cash:,.2f}, Commission: {commission*100:.3f}%")
-    logger.info("=" * 60)
+    if persist:
+        _persist_result(stats, symbol, timeframe, strategy_name, cash, db_url)
     
+    return stats, bt
+
+
+def run_backtests_parallel(
+    configs: list[dict],
+    max_workers: Optional[int] = None,
+) -> list[Tuple[Any, Backtest]]:
+    """
+    Run many single-strategy backtests across worker processes.
+
+    Each config holds keyword arguments for run_single_backtest. OHLCV is
+    fetched once per distinct (source, symbol, timeframe, limit) in this
+    process and handed to each worker at startup, so workers never hit
+    SQL/CCXT. Runs with persist=True are saved from this process.
+
+    Args:
+        configs: List of run_single_backtest keyword-argument dicts
+        max_workers: Worker process count (default: os.cpu_count())
+
+    Returns:
+        List of (stats, Backtest object), in the same order as configs
+    """
+    # Validate names up front rather than inside a worker
+    for cfg in configs:
+        _get_strategy(cfg["strategy_name"].upper())
+
+    frames: dict[tuple, pd.DataFrame] = {}
+    for cfg in configs:
+        key = _data_key(cfg)
+        if key not in frames:
+            frames[key] = _get_prepared_ohlcv(*key)
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers or os.cpu_count(),
+        initializer=_init_worker,
+        initargs=(frames,),
+    ) as executor:
+        results = list(executor.map(_run_one, configs))
+
+    for cfg, (stats, _bt) in zip(configs, results):
+        if cfg.get("persist", False):
+            _persist_result(
+                stats,
+                cfg["symbol"],
+                cfg.get("timeframe", "4h"),
+                cfg["strategy_name"].upper(),
+                cfg.get("cash", 10000.0),
+                cfg.get("db_url"),
+            )
+
+    return results
+
+
+def _log_header(
+    title: str, symbol: str, timeframe: str, cash: float, commission: float
+) -> None:
+    """Log the run banner as a single record."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    logger.info(
+        "%s\nRunning %s Backtest\nSymbol: %s, Timeframe: %s\n"
+        "Cash: $%s, Commission: %.3f%%\n%s",
+        _BANNER, title, symbol, timeframe,
+        format(cash, ",.2f"), commission * 100, _BANNER,
+    )
+
+
+def _log_results(stats: Any) -> None:
+    """Log the results banner as a single record."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    lines = [
+        _BANNER,
+        "BACKTEST RESULTS",
+        _BANNER,
+        f"Final Equity: ${stats['Equity Final [$]']:,.2f}",
+        f"Return: {stats['Return [%]']:.2f}%",
+        f"Max Drawdown: {stats['Max. Drawdown [%]']:.2f}%",
+        f"# Trades: {stats['# Trades']}",
+    ]
+    if stats['# Trades'] > 0:
+        win_rate = stats['Win Rate [%]']
+        avg_trade = stats['Avg. Trade [%]']
+        if not math.isnan(win_rate):
+            lines.append(f"Win Rate: {win_rate:.1f}%")
+        if not math.isnan(avg_trade):
+            lines.append(f"Avg Trade: {avg_trade:.2f}%")
+    lines.append(_BANNER)
+    logger.info("\n".join(lines))
+
+
+def clear_ohlcv_cache() -> None:
+    """
+    Drop OHLCV cached by run_single_backtest / run_backtests_parallel.
+
+    Call before re-running against a live source to pick up new candles.
+    """
+    _get_prepared_ohlcv.cache_clear()
+
+
+@functools.lru_cache(maxsize=32)
+def _get_prepared_ohlcv(
+    use_sql: bool,
+    db_url: Optional[str],
+    symbol: str,
+    timeframe: str,
+    limit: int,
+) -> pd.DataFrame:
+    """
+    Cached _load_ohlcv, so parameter sweeps fetch each series once.
+
+    The returned frame is shared between callers and must not be mutated.
+    """
+    return _load_ohlcv(symbol, timeframe, limit, use_sql, db_url)
+
+
+def _load_ohlcv(
+    symbol: str,
+    timeframe: str,
+    limit: int,
+    use_sql: bool,
+    db_url: Optional[str],
+) -> pd.DataFrame:
+    """Fetch OHLCV from the selected data source and prepare it for Backtesting.py."""
     # Get data source
     if use_sql:
-        logger.info(f"Using SQL data source")
+        logger.info("Using SQL data source")
         data_source: DataSource = SQLDataSource(db_url=db_url)
     else:
-        logger.info(f"Using CCXT data source (live)")
+        logger.info("Using CCXT data source (live)")
         client = ExchangeClient()
         data_source = CCXTDataSource(client)
     
     # Fetch OHLCV data
     df = data_source.get_ohlcv(symbol=symbol, timeframe=timeframe, limit=limit)
-    logger.info(f"Loaded {len(df)} candles")
+    logger.info("Loaded %d candles", len(df))
     
     # Prepare for backtesting
-    df = prepare_ohlcv_for_backtesting(df)
-    
-    # Run backtest
+    return prepare_ohlcv_for_backtesting(df)
+
+
+def _persist_result(
+    stats: Any,
+    symbol: str,
+    timeframe: str,
+    strategy_name: str,
+    cash: float,
+    db_url: Optional[str],
+) -> None:
+    # Trades are stored in stats['_trades'], not bt._trades
+    trades_df = stats.get('_trades')
+    run_id = save_backtest_to_db(
+        stats=stats,
+        trades_df=trades_df,
+        symbol=symbol,
+        timeframe=timeframe,
+        strategy_name=strategy_name,
+        initial_cash=cash,
+        db_url=db_url,
+    )
+    logger.info("Saved to database as run #%s", run_id)
+
+
+# Prepared OHLCV frames shared with parallel backtest workers
+_WORKER_FRAMES: dict[tuple, pd.DataFrame] = {}
+
+
+def _data_key(cfg: dict) -> tuple:
+    return (
+        cfg.get("use_sql", False),
+        cfg.get("db_url"),
+        cfg["symbol"],
+        cfg.get("timeframe", "4h"),
+        cfg.get("limit", 1000),
+    )
+
+
+def _init_worker(frames: dict[tuple, pd.DataFrame]) -> None:
+    global _WORKER_FRAMES
+    _WORKER_FRAMES = frames
+
+
+def _run_one(cfg: dict) -> Tuple[Any, Backtest]:
     bt = FractionalBacktest(
-        df,
-        strategy_class,
-        cash=cash,
-        commission=commission,
+        _WORKER_FRAMES[_data_key(cfg)],
+        _get_strategy(cfg["strategy_name"].upper()),
+        cash=cfg.get("cash", 10000.0),
+        commission=cfg.get("commission", 0.0005),
         exclusive_orders=True,
     )
-    
-    stats = bt.run()
-    
-    # Log results
-    logger.info("=" * 60)
-    logger.info("BACKTEST RESULTS")
-    logger.info("=" * 60)
-    logger.info(f"Final Equity: ${stats['Equity Final [$]']:,.2f}")
-    logger.info(f"Return: {stats['Return [%]']:.2f}%")
-    logger.info(f"Max Drawdown: {stats['Max. Drawdown [%]']:.2f}%")
-    logger.info(f"# Trades: {stats['# Trades']}")
-    if stats['# Trades'] > 0:
-        win_rate = stats['Win Rate [%]']
-        avg_trade = stats['Avg. Trade [%]']
-        if not pd.isna(win_rate):
-            logger.info(f"Win Rate: {win_rate:.1f}%")
-        if not pd.isna(avg_trade):
-            logger.info(f"Avg Trade: {avg_trade:.2f}%")
-    logger.info("=" * 60)
-    
-    if persist:
-        from db.persistence import save_backtest_to_db
-        # Trades are stored in stats['_trades'], not bt._trades
-        trades_df = stats.get('_trades', pd.DataFrame())
-        run_id = save_backtest_to_db(
-            stats=stats,
-            trades_df=trades_df,
-            symbol=symbol,
-            timeframe=timeframe,
-            strategy_name=strategy_name,
-            initial_cash=cash,
-            db_url=db_url,
-        )
-        logger.info(f"Saved to database as run #{run_id}")
-    
-    return stats, bt
+    return bt.run(), bt
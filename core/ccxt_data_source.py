@@ -29,7 +29,7 @@ class CCXTDataSource(DataSource):
             exchange_client: Configured ExchangeClient for API access
         """
         self.client = exchange_client
-        logger.info(f"CCXTDataSource initialized for {exchange_client.exchange_name}")
+        logger.info("CCXTDataSource initialized for %s", exchange_client.exchange_name)
 
     def get_ohlcv(
         self,
@@ -48,7 +48,7 @@ class CCXTDataSource(DataSource):
         Returns:
             DataFrame indexed by timestamp with OHLCV columns
         """
-        logger.info(f"Fetching {limit} {timeframe} candles for {symbol} via CCXT")
+        logger.info("Fetching %d %s candles for %s via CCXT", limit, timeframe, symbol)
         
         df = self.client.fetch_ohlcv(
             symbol=symbol,
@@ -14,13 +14,163 @@ from __future__ import annotations
 
 import logging
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
+from functools import cached_property
 from typing import Optional
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# Initial per-symbol capacity of the price history buffers
+_HISTORY_CAPACITY = 4096
+
+# How long price ticks are retained (seconds)
+_HISTORY_RETENTION_SECONDS = 7200
+
+# Max trip records kept for get_active_trips / get_status
+_MAX_TRIPS = 1024
+
+
+@dataclass
+class PriceRing:
+    """
+    Price ticks for one symbol in struct-of-arrays layout.
+
+    Live entries occupy ``t[head:tail]`` / ``p[head:tail]``. Pruning only
+    advances ``head``; the live region is shifted back to the front (or the
+    buffers grown) when ``tail`` reaches the end, so appends are amortized
+    O(1) and the window stays contiguous.
+
+    Window queries are O(1) amortized as well: ``max_idx`` is a monotonic
+    deque of tick indices with strictly decreasing prices (its front is the
+    running window high), and ``flash_idx`` tracks the earliest tick inside
+    the flash window. Both hold absolute tick numbers; slot ``i`` of the
+    arrays is absolute tick ``offset + i``.
+    """
+
+    t: np.ndarray
+    p: np.ndarray
+    head: int = 0
+    tail: int = 0
+    offset: int = 0
+    max_idx: deque = field(default_factory=deque)
+    flash_idx: int = 0
+
+    @classmethod
+    def empty(cls, capacity: int = _HISTORY_CAPACITY) -> "PriceRing":
+        return cls(
+            t=np.empty(capacity, dtype=np.float64),
+            p=np.empty(capacity, dtype=np.float64),
+        )
+
+    def __len__(self) -> int:
+        return self.tail - self.head
+
+    @property
+    def cap(self) -> int:
+        return self.t.shape[0]
+
+    def append(self, ts: float, price: float, keep_after: float) -> None:
+        """Append a tick and drop entries at or before ``keep_after``."""
+        if self.tail == self.cap:
+            self._compact()
+        self.t[self.tail] = ts
+        self.p[self.tail] = price
+
+        # Ticks priced at or below the new one can never be a window high again
+        p, off, d = self.p, self.offset, self.max_idx
+        while d and p[d[-1] - off] <= price:
+            d.pop()
+        d.append(off + self.tail)
+
+        self.tail += 1
+        t = self.t
+        head = self.head
+        while t[head] <= keep_after and head < self.tail - 1:
+            head += 1
+        self.head = head
+        self._drop_pruned()
+
+    def extend(self, ts: np.ndarray, prices: np.ndarray, keep_after: float) -> None:
+        """Append a batch of ticks (ascending ``ts``) and prune once."""
+        n = ts.shape[0]
+        if n == 0:
+            return
+        if self.tail + n > self.cap:
+            self._compact(extra=n)
+        start = self.tail
+        self.t[start:start + n] = ts
+        self.p[start:start + n] = prices
+
+        # A batch tick survives in max_idx only if it beats every later one
+        suffix_max = np.maximum.accumulate(prices[::-1])[::-1]
+        survivors = np.empty(n, dtype=bool)
+        survivors[-1] = True
+        survivors[:-1] = prices[:-1] > suffix_max[1:]
+        p, off, d = self.p, self.offset, self.max_idx
+        while d and p[d[-1] - off] <= suffix_max[0]:
+            d.pop()
+        d.extend((np.flatnonzero(survivors) + off + start).tolist())
+
+        self.tail += n
+        drop = int(np.searchsorted(self.t[self.head:self.tail], keep_after, side="right"))
+        # Always keep the newest tick, as append() does
+        self.head = min(self.head + drop, self.tail - 1)
+        self._drop_pruned()
+
+    def window_high(self, cutoff: float) -> float:
+        """
+        Highest price recorded after ``cutoff`` (0.0 if the window is empty).
+
+        ``cutoff`` must not decrease between calls: ticks that fall out of
+        the window are discarded from ``max_idx`` for good.
+        """
+        t, off, d = self.t, self.offset, self.max_idx
+        while d and t[d[0] - off] <= cutoff:
+            d.popleft()
+        return float(self.p[d[0] - off]) if d else 0.0
+
+    def flash_start(self, cutoff: float) -> int:
+        """
+        Slot of the earliest live tick recorded after ``cutoff``.
+
+        Returns ``tail`` when no tick is in the window. Like
+        :meth:`window_high`, ``cutoff`` must not decrease between calls.
+        """
+        lo = max(self.flash_idx - self.offset, self.head)
+        # Timestamps are ascending, so a C-level binary search replaces
+        # stepping the pointer tick by tick (e.g. after a record_prices batch)
+        i = lo + int(np.searchsorted(self.t[lo:self.tail], cutoff, side="right"))
+        self.flash_idx = i + self.offset
+        return i
+
+    def _drop_pruned(self) -> None:
+        d = self.max_idx
+        first = self.offset + self.head
+        while d[0] < first:
+            d.popleft()
+
+    def _compact(self, extra: int = 1) -> None:
+        n = self.tail - self.head
+        if (n + extra) * 2 > self.cap:
+            # Mostly live data: grow instead of shifting every few ticks
+            cap = self.cap * 2
+            while cap < n + extra:
+                cap *= 2
+            t = np.empty(cap, dtype=np.float64)
+            p = np.empty(cap, dtype=np.float64)
+            t[:n] = self.t[self.head:self.tail]
+            p[:n] = self.p[self.head:self.tail]
+            self.t, self.p = t, p
+        else:
+            self.t[:n] = self.t[self.head:self.tail]
+            self.p[:n] = self.p[self.head:self.tail]
+        self.offset += self.head
+        self.head, self.tail = 0, n
+
 
 @dataclass
 class BreakerTrip:
@@ -29,12 +179,25 @@ class BreakerTrip:
     breaker_type: str  # "asset", "portfolio", "consecutive", "flash"
     symbol: Optional[str]
     triggered_at: datetime
-    expires_at: datetime
+    expires_at: datetime  # wall-clock expiry, for logging/serialization
     reason: str
+    # time.monotonic() deadline used for the hot is_active check;
+    # derived from expires_at when not given
+    expires_mono: Optional[float] = None
+
+    def __post_init__(self) -> None:
+        if self.expires_mono is None:
+            remaining = (self.expires_at - datetime.now(timezone.utc)).total_seconds()
+            self.expires_mono = time.monotonic() + remaining
 
     @property
     def is_active(self) -> bool:
-        return datetime.now(timezone.utc) < self.expires_at
+        return time.monotonic() < self.expires_mono
+
+    @cached_property
+    def blocked_reason(self) -> str:
+        """Message returned by CircuitBreaker.check while this trip is active."""
+        return f"Circuit breaker active: {self.reason} (expires {self.expires_at.isoformat()})"
 
 
 class CircuitBreaker:
@@ -77,14 +240,19 @@ class CircuitBreaker:
         self.flash_crash_pct = flash_crash_pct
         self.flash_crash_window_seconds = flash_crash_window_seconds
 
-        # Price history per symbol: list of (timestamp, price)
-        self._price_history: dict[str, list[tuple[float, float]]] = defaultdict(list)
+        # Price history per symbol (last 2 hours of ticks)
+        self._price_history: dict[str, PriceRing] = defaultdict(PriceRing.empty)
 
         # Consecutive loss tracking per symbol (None = per-portfolio)
         self._consecutive_losses: int = 0
 
-        # Active trips
-        self._trips: list[BreakerTrip] = []
+        # Trip records, oldest first (bounded; blocking uses the index below)
+        self._trips: deque[BreakerTrip] = deque(maxlen=_MAX_TRIPS)
+
+        # Trip index for check(): the longest-lived global (portfolio /
+        # consecutive) trip and the longest-lived trip per symbol
+        self._global_trip: Optional[BreakerTrip] = None
+        self._symbol_trip: dict[str, BreakerTrip] = {}
 
         # Start-of-day portfolio value (set via reset_daily)
         self._sod_portfolio_value: Optional[float] = None
@@ -97,18 +265,41 @@ class CircuitBreaker:
         """Reset daily tracking. Call at start of each trading day."""
         self._sod_portfolio_value = portfolio_value
         # Purge expired trips
-        self._trips = [t for t in self._trips if t.is_active]
+        self._trips = deque((t for t in self._trips if t.is_active), maxlen=_MAX_TRIPS)
+        if self._global_trip is not None and not self._global_trip.is_active:
+            self._global_trip = None
+        for sym in [s for s, t in self._symbol_trip.items() if not t.is_active]:
+            del self._symbol_trip[sym]
         logger.info("Circuit breakers reset. SOD portfolio: $%.2f", portfolio_value)
 
-    def record_price(self, symbol: str, price: float) -> None:
+    def record_price(
+        self, symbol: str, price: float, now: Optional[float] = None
+    ) -> None:
         """Record a price tick for a symbol (for asset/flash checks)."""
-        now = time.time()
-        self._price_history[symbol].append((now, price))
-        # Prune old entries (keep last 2 hours)
-        cutoff = now - 7200
-        self._price_history[symbol] = [
-            (t, p) for t, p in self._price_history[symbol] if t > cutoff
-        ]
+        if now is None:
+            now = time.time()
+        self._price_history[symbol].append(
+            now, price, now - _HISTORY_RETENTION_SECONDS
+        )
+
+    def record_prices(
+        self, symbol: str, ts: np.ndarray, prices: np.ndarray
+    ) -> None:
+        """
+        Record a batch of price ticks for a symbol in one call.
+
+        Args:
+            symbol: Trading pair.
+            ts: Tick timestamps (epoch seconds, ascending).
+            prices: Prices matching ``ts``.
+        """
+        ts = np.asarray(ts, dtype=np.float64)
+        prices = np.asarray(prices, dtype=np.float64)
+        if ts.shape != prices.shape:
+            raise ValueError("ts and prices must have the same shape")
+        self._price_history[symbol].extend(
+            ts, prices, time.time() - _HISTORY_RETENTION_SECONDS
+        )
 
     def register_trade_result(self, pnl: float) -> None:
         """Register a trade result for consecutive-loss tracking."""
@@ -138,22 +329,30 @@ class CircuitBreaker:
         Returns:
             (allowed, reason) — allowed=True if trading is OK.
         """
+        # One clock read per check, shared by every window below
+        now = time.time()
+
         # Record price tick
-        self.record_price(symbol, current_price)
+        self.record_price(symbol, current_price, now)
 
-        # Check active trips first
-        for trip in self._trips:
-            if trip.is_active:
-                if trip.symbol is None or trip.symbol == symbol:
-                    return False, f"Circuit breaker active: {trip.reason} (expires {trip.expires_at.isoformat()})"
+        # Check active trips first: while one is in force, skip all detection
+        # so a persistent drawdown doesn't keep stacking duplicate trips
+        trip = self._active_trip(symbol)
+        if trip is not None:
+            return False, trip.blocked_reason
+
+        # Lazily drop expired trip records from the front
+        trips = self._trips
+        while trips and not trips[0].is_active:
+            trips.popleft()
 
         # 1. Asset-level drop check
-        ok, reason = self._check_asset_drop(symbol, current_price)
+        ok, reason = self._check_asset_drop(symbol, current_price, now)
         if not ok:
             return False, reason
 
         # 2. Flash crash check
-        ok, reason = self._check_flash_crash(symbol, current_price)
+        ok, reason = self._check_flash_crash(symbol, current_price, now)
         if not ok:
             return False, reason
 
@@ -191,20 +390,32 @@ class CircuitBreaker:
     # Internal checks
     # ------------------------------------------------------------------
 
+    def _active_trip(self, symbol: str) -> Optional[BreakerTrip]:
+        """Return the active trip blocking ``symbol``, dropping expired ones."""
+        trip = self._global_trip
+        if trip is not None:
+            if trip.is_active:
+                return trip
+            self._global_trip = None
+
+        trip = self._symbol_trip.get(symbol)
+        if trip is not None:
+            if trip.is_active:
+                return trip
+            del self._symbol_trip[symbol]
+
+        return None
+
     def _check_asset_drop(
-        self, symbol: str, current_price: float
+        self, symbol: str, current_price: float, now: float
     ) -> tuple[bool, Optional[str]]:
         """Check if a single asset has dropped too far in the window."""
-        history = self._price_history.get(symbol, [])
-        if not history:
+        ring = self._price_history.get(symbol)
+        if ring is None or not len(ring):
             return True, None
 
-        cutoff = time.time() - self.asset_window_seconds
-        window_prices = [p for t, p in history if t > cutoff]
-        if not window_prices:
-            return True, None
-
-        window_high = max(window_prices)
+        cutoff = now - self.asset_window_seconds
+        window_high = ring.window_high(cutoff)
         if window_high <= 0:
             return True, None
 
@@ -220,20 +431,20 @@ class CircuitBreaker:
         return True, None
 
     def _check_flash_crash(
-        self, symbol: str, current_price: float
+        self, symbol: str, current_price: float, now: float
     ) -> tuple[bool, Optional[str]]:
         """Check for abnormally fast price movement."""
-        history = self._price_history.get(symbol, [])
-        if len(history) < 2:
+        ring = self._price_history.get(symbol)
+        if ring is None or len(ring) < 2:
             return True, None
 
-        cutoff = time.time() - self.flash_crash_window_seconds
-        recent = [p for t, p in history if t > cutoff]
-        if len(recent) < 2:
+        cutoff = now - self.flash_crash_window_seconds
+        start = ring.flash_start(cutoff)
+        if ring.tail - start < 2:
             return True, None
 
-        # Check max absolute move within the flash window
-        earliest_in_window = recent[0]
+        # Move of the current price vs the earliest tick in the flash window
+        earliest_in_window = ring.p[start]
         if earliest_in_window <= 0:
             return True, None
 
@@ -270,51 +481,47 @@ class CircuitBreaker:
     # Trip handlers
     # ------------------------------------------------------------------
 
-    def _trip_asset(self, symbol: str, reason: str) -> None:
+    def _add_trip(
+        self, breaker_type: str, symbol: Optional[str], duration: timedelta, reason: str
+    ) -> None:
         now = datetime.now(timezone.utc)
         trip = BreakerTrip(
-            breaker_type="asset",
+            breaker_type=breaker_type,
             symbol=symbol,
             triggered_at=now,
-            expires_at=now + timedelta(hours=1),
+            expires_at=now + duration,
             reason=reason,
+            expires_mono=time.monotonic() + duration.total_seconds(),
         )
         self._trips.append(trip)
-        logger.critical("🚨 CIRCUIT BREAKER [asset]: %s", reason)
+
+        if symbol is None:
+            current = self._global_trip
+        else:
+            current = self._symbol_trip.get(symbol)
+        if current is None or trip.expires_mono > current.expires_mono:
+            if symbol is None:
+                self._global_trip = trip
+            else:
+                self._symbol_trip[symbol] = trip
+
+        logger.critical("🚨 CIRCUIT BREAKER [%s]: %s", breaker_type, reason)
+
+    def _trip_asset(self, symbol: str, reason: str) -> None:
+        self._add_trip("asset", symbol, timedelta(hours=1), reason)
 
     def _trip_portfolio(self, reason: str) -> None:
-        now = datetime.now(timezone.utc)
-        trip = BreakerTrip(
-            breaker_type="portfolio",
-            symbol=None,  # affects all symbols
-            triggered_at=now,
-            expires_at=now + timedelta(hours=24),  # rest of day
-            reason=reason,
-        )
-        self._trips.append(trip)
-        logger.critical("🚨 CIRCUIT BREAKER [portfolio]: %s", reason)
+        # Affects all symbols for the rest of the day
+        self._add_trip("portfolio", None, timedelta(hours=24), reason)
 
     def _trip_consecutive(self) -> None:
-        now = datetime.now(timezone.utc)
         reason = f"{self._consecutive_losses} consecutive losing trades"
-        trip = BreakerTrip(
-            breaker_type="consecutive",
-            symbol=None,
-            triggered_at=now,
-            expires_at=now + timedelta(minutes=self.consecutive_cooldown_minutes),
-            reason=reason,
+        self._add_trip(
+            "consecutive",
+            None,
+            timedelta(minutes=self.consecutive_cooldown_minutes),
+            reason,
         )
-        self._trips.append(trip)
-        logger.critical("🚨 CIRCUIT BREAKER [consecutive]: %s", reason)
 
     def _trip_flash(self, symbol: str, reason: str) -> None:
-        now = datetime.now(timezone.utc)
-        trip = BreakerTrip(
-            breaker_type="flash",
-            symbol=symbol,
-            triggered_at=now,
-            expires_at=now + timedelta(minutes=15),
-            reason=reason,
-        )
-        self._trips.append(trip)
-        logger.critical("🚨 CIRCUIT BREAKER [flash]: %s", reason)
+        self._add_trip("flash", symbol, timedelta(minutes=15), reason)
@@ -9,19 +9,56 @@ Reference: doc/Crypto Algo Trading System Research.md (Section 2)
 
 from __future__ import annotations
 
+import functools
 import logging
+import re
+import sys
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Optional
 
 from core.regime_detector import Regime, RegimeState
 
 logger = logging.getLogger(__name__)
 
+# Strategy-name normalization patterns (class-style name -> affinity key)
+_SUFFIX = re.compile(r"(Live|Strategy|Backtest)$")
+_CAMEL1 = re.compile(r"([A-Z]+)([A-Z][a-z])")
+_CAMEL2 = re.compile(r"([a-z0-9])([A-Z])")
+
+# Interned action names, so comparisons and dict keys hit the identity fast path
+HOLD = sys.intern("HOLD")
+OPEN_LONG = sys.intern("OPEN_LONG")
+CLOSE_LONG = sys.intern("CLOSE_LONG")
+OPEN_SHORT = sys.intern("OPEN_SHORT")
+
+
+def _intern(value) -> str:
+    """
+    Intern ``value`` as a plain str.
+
+    sys.intern rejects str subclasses, and ``str()`` of a ``(str, Enum)``
+    member is ``"Cls.NAME"``, so str subclasses are interned by their value.
+    """
+    return sys.intern(str.__str__(value) if isinstance(value, str) else str(value))
+
 
 # ---------------------------------------------------------------------------
 # Strategy-to-regime affinity weights (0.0–1.0)
 # ---------------------------------------------------------------------------
 
+# Weight for strategies missing from the affinity map
+_DEFAULT_REGIME_WEIGHT = 0.3
+
+# Actions on the sell side of a BUY/SELL conflict
+_SELL_ACTIONS = frozenset({OPEN_SHORT, CLOSE_LONG})
+
+# Shared read-only stand-in for signals that carry no extra data
+_EMPTY_EXTRA = MappingProxyType({})
+
+# Shared empty voter sequence when no action scores above zero
+_NO_VOTERS: tuple = ()
+
 # Each strategy gets a weight based on how well it performs in each regime.
 # These are the default weights; can be overridden via config.
 DEFAULT_AFFINITY: dict[Regime, dict[str, float]] = {
@@ -76,7 +113,7 @@ DEFAULT_AFFINITY: dict[Regime, dict[str, float]] = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class StrategyVote:
     """A single strategy's signal with its regime-adjusted weight."""
 
@@ -85,13 +122,18 @@ class StrategyVote:
     confidence: float  # strategy's own confidence (0.0–1.0)
     regime_weight: float  # affinity weight for current regime
     extra: dict = field(default_factory=dict)  # stop, tp, atr, etc.
+    score: float = field(init=False)  # confidence × regime_weight at creation
+
+    def __post_init__(self) -> None:
+        self.score = self.confidence * self.regime_weight
 
     @property
     def weighted_score(self) -> float:
+        """confidence × regime_weight, reflecting any later changes to either."""
         return self.confidence * self.regime_weight
 
 
-@dataclass
+@dataclass(slots=True)
 class EnsembleSignal:
     """Aggregated signal from the ensemble."""
 
@@ -134,6 +176,12 @@ class Ensemble:
         self.consensus_threshold = consensus_threshold
         self.min_weighted_confidence = min_weighted_confidence
         self.affinity_map = affinity_map or DEFAULT_AFFINITY
+        # Flat (regime value, strategy) -> weight view: one hash lookup per vote
+        self._flat_affinity: dict[tuple[str, str], float] = {
+            (regime.value, _intern(name)): weight
+            for regime, weights in self.affinity_map.items()
+            for name, weight in weights.items()
+        }
 
     def aggregate(
         self,
@@ -153,16 +201,36 @@ class Ensemble:
         """
         votes: list[StrategyVote] = []
 
+        # The regime is invariant across the vote loop
+        regime_value = regime_state.regime.value
+        flat_affinity = self._flat_affinity
+        normalize = self._normalize_strategy_name
+
+        # Tabulate voters and running weighted totals per action (excluding
+        # HOLD), plus the buy/sell side totals, in the same pass
+        action_voters: dict[str, list[StrategyVote]] = {}
+        action_total_score: dict[str, float] = {}
+        buy_score = 0.0
+        sell_score = 0.0
+        hold_count = 0
+
         for strat_name, signal in signals.items():
-            action = getattr(signal, "action", "HOLD")
+            action = _intern(getattr(signal, "action", HOLD))
             confidence = getattr(signal, "confidence", 0.5)
-            extra = getattr(signal, "extra", {}) or {}
+            extra = getattr(signal, "extra", None) or _EMPTY_EXTRA
+
+            if action == HOLD:
+                # HOLD never scores: record it without the affinity lookup
+                votes.append(
+                    StrategyVote(strat_name, action, confidence, 0.0, extra)
+                )
+                hold_count += 1
+                continue
 
-            # Get regime affinity weight
-            regime_weights = self.affinity_map.get(regime_state.regime, {})
             # Normalize the strategy name to match affinity keys
-            norm_name = self._normalize_strategy_name(strat_name)
-            regime_weight = regime_weights.get(norm_name, 0.3)  # default 0.3
+            regime_weight = flat_affinity.get(
+                (regime_value, normalize(strat_name)), _DEFAULT_REGIME_WEIGHT
+            )
 
             vote = StrategyVote(
                 strategy_name=strat_name,
@@ -173,17 +241,23 @@ class Ensemble:
             )
             votes.append(vote)
 
-        # Count votes by action (excluding HOLD)
-        action_scores: dict[str, list[StrategyVote]] = {}
-        for vote in votes:
-            if vote.action == "HOLD":
-                continue
-            action_scores.setdefault(vote.action, []).append(vote)
-
-        if not action_scores:
+            score = vote.score
+            # No setdefault: it would build a throwaway list for every vote
+            voters = action_voters.get(action)
+            if voters is None:
+                action_voters[action] = [vote]
+            else:
+                voters.append(vote)
+            action_total_score[action] = action_total_score.get(action, 0.0) + score
+            if action == OPEN_LONG:
+                buy_score += score
+            elif action in _SELL_ACTIONS:
+                sell_score += score
+
+        if not action_voters:
             # Everyone says HOLD
             return EnsembleSignal(
-                action="HOLD",
+                action=HOLD,
                 confidence=0.0,
                 votes_for=0,
                 votes_total=0,
@@ -192,78 +266,55 @@ class Ensemble:
                 strategy_votes=votes,
             )
 
-        # Find the action with the most / highest-weighted votes
-        best_action = None
-        best_score = 0.0
-        best_voters: list[StrategyVote] = []
-
-        for action, voters in action_scores.items():
-            total_score = sum(v.weighted_score for v in voters)
-            if total_score > best_score:
-                best_score = total_score
-                best_action = action
-                best_voters = voters
+        # Find the action with the highest weighted score (ties keep the
+        # first action seen; an all-zero score selects nothing)
+        best_action: Optional[str] = max(
+            action_total_score, key=action_total_score.get
+        )
+        if action_total_score[best_action] > 0.0:
+            best_voters = action_voters[best_action]
+        else:
+            best_action = None
+            best_voters = _NO_VOTERS
 
         # Check for conflict: if there are opposing actions (BUY vs SELL)
-        has_buy = any(
-            a in ("OPEN_LONG",) for a in action_scores
-        )
-        has_sell = any(
-            a in ("OPEN_SHORT", "CLOSE_LONG") for a in action_scores
-        )
+        has_buy = OPEN_LONG in action_voters
+        has_sell = not _SELL_ACTIONS.isdisjoint(action_voters)
 
         if has_buy and has_sell:
             # Conflict → HOLD unless one side has overwhelming consensus
-            buy_score = sum(
-                v.weighted_score
-                for a, vs in action_scores.items()
-                if a == "OPEN_LONG"
-                for v in vs
-            )
-            sell_score = sum(
-                v.weighted_score
-                for a, vs in action_scores.items()
-                if a in ("OPEN_SHORT", "CLOSE_LONG")
-                for v in vs
-            )
-
-            if buy_score > sell_score * 2:
-                best_action = "OPEN_LONG"
-                best_voters = action_scores.get("OPEN_LONG", [])
-            elif sell_score > buy_score * 2:
+            two_buy = buy_score * 2.0
+            two_sell = sell_score * 2.0
+            if buy_score > two_sell:
+                side = OPEN_LONG
+            elif sell_score > two_buy:
                 # Pick the dominant sell action
-                if "CLOSE_LONG" in action_scores:
-                    best_action = "CLOSE_LONG"
-                    best_voters = action_scores["CLOSE_LONG"]
-                else:
-                    best_action = "OPEN_SHORT"
-                    best_voters = action_scores.get("OPEN_SHORT", [])
+                side = CLOSE_LONG if CLOSE_LONG in action_voters else OPEN_SHORT
             else:
                 logger.info(
                     "Ensemble conflict: BUY(%.2f) vs SELL(%.2f) → HOLD",
                     buy_score, sell_score,
                 )
                 return EnsembleSignal(
-                    action="HOLD",
+                    action=HOLD,
                     confidence=0.0,
                     votes_for=0,
-                    votes_total=len(action_scores),
+                    votes_total=len(action_voters),
                     consensus_met=False,
                     regime=regime_state.regime,
                     strategy_votes=votes,
                 )
+            best_action, best_voters = side, action_voters[side]
 
         votes_for = len(best_voters)
-        votes_total = sum(len(vs) for vs in action_scores.values())
+        votes_total = len(votes) - hold_count
 
         # Check consensus threshold
         consensus_met = votes_for >= self.consensus_threshold
 
         # Compute aggregate confidence
         if best_voters:
-            avg_confidence = sum(v.weighted_score for v in best_voters) / len(
-                best_voters
-            )
+            avg_confidence = action_total_score[best_action] / votes_for
         else:
             avg_confidence = 0.0
 
@@ -271,14 +322,12 @@ class Ensemble:
         if avg_confidence < self.min_weighted_confidence:
             consensus_met = False
 
-        final_action = best_action if consensus_met else "HOLD"
+        final_action = best_action if consensus_met else HOLD
 
         # Merge extra data from the best voters (prefer first voter's values)
         merged_extra = {}
-        for voter in best_voters:
-            for k, v in voter.extra.items():
-                if k not in merged_extra:
-                    merged_extra[k] = v
+        for voter in reversed(best_voters):
+            merged_extra.update(voter.extra)
 
         result = EnsembleSignal(
             action=final_action,
@@ -301,14 +350,11 @@ class Ensemble:
         return result
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def _normalize_strategy_name(name: str) -> str:
         """Normalize strategy name to match affinity keys."""
         # Convert class-style names like "SqueezeBreakoutLive" to "squeeze_breakout"
-        # and strip common suffixes
-        import re
-        # Remove "Live", "Strategy" suffixes
-        cleaned = re.sub(r"(Live|Strategy|Backtest)$", "", name)
+        # and strip common suffixes ("Live", "Strategy", "Backtest")
+        cleaned = _SUFFIX.sub("", name)
         # CamelCase to snake_case
-        s1 = re.sub(r"([A-Z]+)([A-Z][a-z])", r"\1_\2", cleaned)
-        result = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
-        return result
+        return _CAMEL2.sub(r"\1_\2", _CAMEL1.sub(r"\1_\2", cleaned)).lower()
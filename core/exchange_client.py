@@ -8,13 +8,15 @@ Provides a thin abstraction over ccxt for exchange operations:
 - Rate-limited API calls
 """
 
+import asyncio
 import logging
 import os
 import time
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
 import ccxt
+import numpy as np
 import pandas as pd
 
 from core.rate_limiter import RateLimiter
@@ -24,6 +26,10 @@ logger = logging.getLogger(__name__)
 # Default minimum order value for Kraken (most pairs require ~$10 minimum)
 DEFAULT_MIN_NOTIONAL = 10.0
 
+# Cap on how long a "latest candles" fetch (since=None) is reused, since its
+# last bar is still forming; historical windows live for one full bar
+LIVE_OHLCV_TTL = 60.0
+
 
 class ExchangeClient:
     """
@@ -61,9 +67,15 @@ class ExchangeClient:
         self._min_notional_cache: dict[str, float] = {}
         self._markets_loaded = False
 
+        # OHLCV cache: (symbol, timeframe, limit, since) -> (expires_at, df)
+        self._ohlcv_cache: dict[tuple, tuple[float, pd.DataFrame]] = {}
+
         # Initialize the ccxt exchange
-        exchange_class = getattr(ccxt, exchange_name)
-        self.exchange = exchange_class({
+        self.exchange = self._make_exchange(ccxt)
+
+    def _make_exchange(self, ccxt_module):
+        """Instantiate this client's exchange from a ccxt (or ccxt async) module."""
+        exchange = getattr(ccxt_module, self.exchange_name)({
             "apiKey": self.api_key,
             "secret": self.api_secret,
             "enableRateLimit": True,
@@ -73,22 +85,43 @@ class ExchangeClient:
         })
 
         # Enable sandbox mode if requested and supported
-        if sandbox:
+        if self.sandbox:
             try:
-                self.exchange.set_sandbox_mode(True)
-                logger.info(f"Sandbox mode enabled for {exchange_name}")
+                exchange.set_sandbox_mode(True)
+                logger.info(f"Sandbox mode enabled for {self.exchange_name}")
             except Exception as e:
-                logger.warning(f"Sandbox not supported for {exchange_name}: {e}")
+                logger.warning(f"Sandbox not supported for {self.exchange_name}: {e}")
+        return exchange
+
+    def _throttle(self, weight: int) -> None:
+        """Take ``weight`` rate-limit tokens, blocking only if the bucket is full."""
+        if not self.rate_limiter.try_acquire(weight):
+            self.rate_limiter.acquire(weight)
 
     def _ensure_markets(self) -> None:
         """Load markets if not already loaded (for min notional info)."""
         if not self._markets_loaded:
             try:
-                self.rate_limiter.acquire(weight=5)
+                self._throttle(5)
                 self.exchange.load_markets()
                 self._markets_loaded = True
             except Exception as e:
                 logger.warning("Failed to load markets: %s", e)
+                return
+
+            # Populate every market's minimum in one sweep
+            for symbol, market in (self.exchange.markets or {}).items():
+                self._min_notional_cache[symbol] = self._market_min_notional(market)
+
+    @staticmethod
+    def _market_min_notional(market: dict) -> float:
+        """A market's minimum order value, or the default if it has none."""
+        try:
+            # ccxt stores limits in market['limits']; any level may be None
+            min_cost = ((market.get("limits") or {}).get("cost") or {}).get("min")
+            return float(min_cost) if min_cost else DEFAULT_MIN_NOTIONAL
+        except (AttributeError, TypeError, ValueError):
+            return DEFAULT_MIN_NOTIONAL
 
     def fetch_ohlcv(
         self,
@@ -106,13 +139,23 @@ class ExchangeClient:
             limit: Number of candles to fetch
             since: Timestamp in milliseconds to start from
 
+        Results are cached per (symbol, timeframe, limit, since) for one
+        bar of ``timeframe``, or at most LIVE_OHLCV_TTL seconds when
+        ``since`` is None, because the latest bar is still forming.
+        Callers receive their own copy of the cached frame.
+
         Returns:
             DataFrame indexed by timestamp (UTC) with columns:
             open, high, low, close, volume
         """
+        key = (symbol, timeframe, limit, since)
+        cached = self._get_cached_ohlcv(key)
+        if cached is not None:
+            return cached
+
         logger.info(f"Fetching {limit} {timeframe} candles for {symbol}")
 
-        self.rate_limiter.acquire(weight=5)
+        self._throttle(5)
 
         ohlcv = self.exchange.fetch_ohlcv(
             symbol=symbol,
@@ -120,21 +163,120 @@ class ExchangeClient:
             limit=limit,
             since=since,
         )
+        return self._store_ohlcv(key, ohlcv)
 
+    async def fetch_ohlcv_many(
+        self,
+        symbols: list[str],
+        timeframe: str = "4h",
+        limit: int = 500,
+        since: Optional[int] = None,
+        max_concurrency: int = 4,
+    ) -> dict[str, pd.DataFrame]:
+        """
+        Fetch OHLCV candles for several symbols concurrently.
+
+        Uses ccxt's async client so round trips overlap instead of running
+        back to back. At most ``max_concurrency`` requests are in flight,
+        and each one still draws from the shared rate limiter. The cache
+        is the one used by fetch_ohlcv.
+
+        Args:
+            symbols: Trading pairs to fetch
+            timeframe: Candle timeframe (e.g., "1h", "4h", "1d")
+            limit: Number of candles per symbol
+            since: Timestamp in milliseconds to start from
+            max_concurrency: Maximum simultaneous requests
+
+        Returns:
+            Dict of {symbol: DataFrame} in the order of ``symbols``.
+        """
+        results: dict[str, pd.DataFrame] = {}
+        pending = []
+        for symbol in dict.fromkeys(symbols):
+            cached = self._get_cached_ohlcv((symbol, timeframe, limit, since))
+            if cached is not None:
+                results[symbol] = cached
+            else:
+                pending.append(symbol)
+
+        if pending:
+            import ccxt.async_support as ccxt_async
+
+            # A fresh async client per call: its HTTP session is bound to the
+            # running event loop
+            aexchange = self._make_exchange(ccxt_async)
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def fetch_one(symbol: str) -> list:
+                async with semaphore:
+                    if not self.rate_limiter.try_acquire(5):
+                        await asyncio.to_thread(self.rate_limiter.acquire, 5)
+                    return await aexchange.fetch_ohlcv(
+                        symbol, timeframe, since=since, limit=limit
+                    )
+
+            logger.info(
+                "Fetching %d %s candles for %d symbols", limit, timeframe, len(pending)
+            )
+            try:
+                fetched = await asyncio.gather(*(fetch_one(s) for s in pending))
+            finally:
+                await aexchange.close()
+
+            for symbol, ohlcv in zip(pending, fetched):
+                results[symbol] = self._store_ohlcv(
+                    (symbol, timeframe, limit, since), ohlcv
+                )
+
+        return {symbol: results[symbol] for symbol in dict.fromkeys(symbols)}
+
+    def _get_cached_ohlcv(self, key: tuple) -> Optional[pd.DataFrame]:
+        """Return a copy of the cached frame for ``key`` if still fresh."""
+        cached = self._ohlcv_cache.get(key)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1].copy()
+        return None
+
+    def _store_ohlcv(self, key: tuple, ohlcv: list) -> pd.DataFrame:
+        """Convert raw ccxt candles for ``key``, cache them, and return a copy."""
+        symbol, timeframe, _, since = key
         if not ohlcv:
             logger.warning(f"No data returned for {symbol} {timeframe}")
             return pd.DataFrame(columns=["open", "high", "low", "close", "volume"])
 
-        df = pd.DataFrame(
-            ohlcv,
-            columns=["timestamp", "open", "high", "low", "close", "volume"]
-        )
+        df = self._to_df(ohlcv)
+        logger.info(f"Fetched {len(df)} candles from {df.index.min()} to {df.index.max()}")
 
-        df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms", utc=True)
-        df.set_index("timestamp", inplace=True)
+        ttl = self.exchange.parse_timeframe(timeframe)
+        if since is None:
+            ttl = min(ttl, LIVE_OHLCV_TTL)
+        self._ohlcv_cache[key] = (time.monotonic() + ttl, df)
+        return df.copy()
 
-        logger.info(f"Fetched {len(df)} candles from {df.index.min()} to {df.index.max()}")
-        return df
+    @staticmethod
+    def _to_df(ohlcv: list) -> pd.DataFrame:
+        """Build a timestamp-indexed OHLCV frame from raw ccxt candles."""
+        # Convert once to a float64 block and build typed columns from it
+        arr = np.asarray(ohlcv, dtype=np.float64)
+        # Epoch ms -> ns straight into the index (no to_datetime parsing)
+        index = pd.DatetimeIndex(
+            arr[:, 0].astype(np.int64) * 1_000_000, tz="UTC", name="timestamp"
+        )
+        return pd.DataFrame(
+            {
+                "open": arr[:, 1],
+                "high": arr[:, 2],
+                "low": arr[:, 3],
+                "close": arr[:, 4],
+                "volume": arr[:, 5],
+            },
+            index=index,
+        )
+
+    def clear_ohlcv_cache(self) -> None:
+        """Drop all cached OHLCV frames so the next fetch hits the exchange."""
+        self._ohlcv_cache.clear()
 
     def get_balance(self, asset: str = "USDT") -> float:
         """
@@ -146,7 +288,7 @@ class ExchangeClient:
         Returns:
             Available balance as float
         """
-        self.rate_limiter.acquire(weight=1)
+        self._throttle(1)
         balance = self.exchange.fetch_balance()
         return balance.get(asset, {}).get("free", 0.0)
 
@@ -163,23 +305,14 @@ class ExchangeClient:
         Returns:
             Minimum order value in quote currency.
         """
-        if symbol in self._min_notional_cache:
-            return self._min_notional_cache[symbol]
+        cached = self._min_notional_cache.get(symbol)
+        if cached is not None:
+            return cached
 
+        # Loading markets fills the cache for every listed symbol; unknown
+        # symbols (or a failed load) fall back to the default
         self._ensure_markets()
-
-        try:
-            market = self.exchange.market(symbol)
-            # ccxt stores limits in market['limits']
-            min_cost = market.get("limits", {}).get("cost", {}).get("min")
-            if min_cost:
-                self._min_notional_cache[symbol] = float(min_cost)
-                return float(min_cost)
-        except Exception as e:
-            logger.debug("Could not fetch min_notional for %s: %s", symbol, e)
-
-        self._min_notional_cache[symbol] = DEFAULT_MIN_NOTIONAL
-        return DEFAULT_MIN_NOTIONAL
+        return self._min_notional_cache.setdefault(symbol, DEFAULT_MIN_NOTIONAL)
 
     def create_order(
         self,
@@ -224,7 +357,7 @@ class ExchangeClient:
                     f"${min_notional:.2f} for {symbol}"
                 )
 
-        self.rate_limiter.acquire(weight=1)
+        self._throttle(1)
 
         logger.info(
             "📝 Creating %s %s order: %s %.6f @ %s  params=%s",
@@ -266,7 +399,7 @@ class ExchangeClient:
         """
         for attempt in range(1, max_retries + 1):
             try:
-                self.rate_limiter.acquire(weight=1)
+                self._throttle(1)
                 result = self.exchange.cancel_order(order_id, symbol)
                 logger.info("❌ Cancelled order %s on %s", order_id, symbol)
                 return result
@@ -294,7 +427,7 @@ class ExchangeClient:
         Returns:
             List of open order dicts
         """
-        self.rate_limiter.acquire(weight=1)
+        self._throttle(1)
         try:
             orders = self.exchange.fetch_open_orders(symbol)
             logger.debug("Found %d open orders%s",
@@ -315,7 +448,7 @@ class ExchangeClient:
         Returns:
             Order dict or None if not found
         """
-        self.rate_limiter.acquire(weight=1)
+        self._throttle(1)
         try:
             return self.exchange.fetch_order(order_id, symbol)
         except ccxt.OrderNotFound:
@@ -328,7 +461,7 @@ class ExchangeClient:
     def _get_ticker_price(self, symbol: str) -> Optional[float]:
         """Get last price for MIN_NOTIONAL estimation."""
         try:
-            self.rate_limiter.acquire(weight=1)
+            self._throttle(1)
             ticker = self.exchange.fetch_ticker(symbol)
             return ticker.get("last")
         except Exception:
@@ -336,5 +469,10 @@ class ExchangeClient:
 
     @staticmethod
     def now() -> datetime:
-        """Get current UTC time."""
-        return datetime.utcnow()
+        """Get current UTC time (timezone-aware)."""
+        return datetime.now(timezone.utc)
+
+    @staticmethod
+    def now_ms() -> int:
+        """Get current UTC time as epoch milliseconds (ccxt ``since`` format)."""
+        return int(time.time() * 1000)
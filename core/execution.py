@@ -11,6 +11,7 @@ Key features:
   - clientOrderId generation for idempotency
   - Chase logic: cancel + resubmit unfilled limit orders (up to N attempts)
   - Timeout reconciliation via order query
+  - Push-based order updates from a WebSocket stream (ccxt.pro watch_orders)
   - Paper mode (delegates to Portfolio) and live mode (delegates to ExchangeClient)
 
 Reference: doc/research_images/image4.png (Order State Machine)
@@ -18,27 +19,46 @@ Reference: doc/research_images/image4.png (Order State Machine)
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import itertools
 import logging
+import random
+import threading
+import time
 import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from enum import Enum
-from typing import Optional, TYPE_CHECKING
+from enum import StrEnum
+from typing import Callable, Optional, TypeVar, TYPE_CHECKING
+
+from ccxt import RateLimitExceeded, RequestTimeout
 
 if TYPE_CHECKING:
     from core.exchange_client import ExchangeClient
     from core.portfolio import Portfolio
     from core.risk_manager import RiskManager
     from core.circuit_breaker import CircuitBreaker
+    from core.order_store import OrderStore
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# How long an indexed open-orders snapshot is reused for reconciliation
+OPEN_ORDERS_TTL_SECONDS = 0.5
+
+# Upper bound on concurrent cancel requests in cancel_all_open_orders
+CANCEL_MAX_WORKERS = 8
+
 
 # ---------------------------------------------------------------------------
 # Order state machine
 # ---------------------------------------------------------------------------
 
-class OrderStatus(Enum):
+class OrderStatus(StrEnum):
     PENDING = "pending"
     SUBMITTED = "submitted"
     FILLED = "filled"
@@ -48,17 +68,62 @@ class OrderStatus(Enum):
     ERROR = "error"
 
 
-class OrderSide(Enum):
+TERMINAL_STATUSES = frozenset({
+    OrderStatus.FILLED,
+    OrderStatus.CANCELLED,
+    OrderStatus.ERROR,
+})
+
+# Orders a restart must reconcile against the exchange
+ACTIONABLE_STATUSES = frozenset({
+    OrderStatus.PENDING,
+    OrderStatus.SUBMITTED,
+    OrderStatus.PARTIAL,
+})
+
+# Page size when reloading actionable orders from the order store
+RECONCILE_PAGE_SIZE = 100
+
+# Order submission retries after RateLimitExceeded: capped exponential
+# backoff with full jitter, so concurrent signals don't retry in lockstep
+ORDER_RETRIES = 3
+ORDER_RETRY_BASE_SECONDS = 0.1
+ORDER_RETRY_CAP_SECONDS = 2.0
+
+# Pause before re-subscribing after the order stream errors
+WS_RETRY_SECONDS = 1.0
+
+# Pushed order states that settle an order without a fill
+_WS_SETTLED_STATES = {
+    "canceled": OrderStatus.CANCELLED,
+    "expired": OrderStatus.CANCELLED,
+    "rejected": OrderStatus.ERROR,
+}
+
+
+class OrderSide(StrEnum):
     BUY = "buy"
     SELL = "sell"
 
 
-class OrderType(Enum):
+class OrderType(StrEnum):
     LIMIT = "limit"
     MARKET = "market"
 
 
-@dataclass
+# Upper-cased names for log lines and result actions, computed once
+_STATUS_UPPER = {s: s.value.upper() for s in OrderStatus}
+_SIDE_UPPER = {s: s.value.upper() for s in OrderSide}
+
+# Per-trade log templates; callers check isEnabledFor(INFO) before
+# gathering arguments, so suppressed lines cost one level comparison
+_LOG_PAPER_OPEN = "📈 PAPER %s %s %.6f @ $%.2f (fees=%.4f)"
+_LOG_LIVE_OPEN = "📤 LIVE %s %s %.6f @ $%.2f [%s] id=%s"
+_LOG_PAPER_CLOSE = "%s PAPER CLOSE %s %s @ $%.2f  PnL=$%.2f"
+_LOG_LIVE_CLOSE = "📤 LIVE CLOSE %s %s @ $%.2f  PnL=$%.2f"
+
+
+@dataclass(slots=True)
 class ManagedOrder:
     """Tracks a single order through its lifecycle."""
 
@@ -87,34 +152,42 @@ class ManagedOrder:
     filled_at: Optional[datetime] = None
     updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
+    # Memoized immutable part of to_dict()
+    _static_dict: Optional[dict] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     @property
     def is_terminal(self) -> bool:
-        return self.status in (
-            OrderStatus.FILLED,
-            OrderStatus.CANCELLED,
-            OrderStatus.ERROR,
-        )
+        return self.status in TERMINAL_STATUSES
 
     @property
     def remaining_qty(self) -> float:
         return max(0.0, self.qty - self.filled_qty)
 
     def to_dict(self) -> dict:
+        static = self._static_dict
+        if static is None:
+            # Identity fields never change after creation
+            static = self._static_dict = {
+                "client_order_id": self.client_order_id,
+                "symbol": self.symbol,
+                "side": self.side,
+                "type": self.order_type,
+                "qty": self.qty,
+                "strategy": self.strategy,
+                "created_at": self.created_at.isoformat(),
+            }
+        # Price stays live: a chase re-prices the same order
         return {
-            "client_order_id": self.client_order_id,
+            **static,
+            "price": self.price,
             "exchange_order_id": self.exchange_order_id,
-            "symbol": self.symbol,
-            "side": self.side.value,
-            "type": self.order_type.value,
-            "qty": self.qty,
             "filled_qty": self.filled_qty,
-            "price": self.price,
             "avg_fill_price": self.avg_fill_price,
-            "status": self.status.value,
-            "strategy": self.strategy,
+            "status": self.status,
             "fees": self.fees,
             "chase_attempts": self.chase_attempts,
-            "created_at": self.created_at.isoformat(),
         }
 
 
@@ -122,18 +195,57 @@ class ManagedOrder:
 # clientOrderId generator
 # ---------------------------------------------------------------------------
 
+# Random per-process tag (unique across restarts) plus a counter (unique
+# within the process), so ids never collide and need no clock or RNG call
+_INSTANCE_ID = uuid.uuid4().hex[:6]
+_ORDER_SEQ = itertools.count()
+
+
+@functools.lru_cache(maxsize=512)
+def _client_order_id_prefix(strategy: str, symbol: str) -> str:
+    """Build the constant ``HOT_{strategy}_{symbol}_{instance}_`` part of an id."""
+    sym_clean = symbol.replace("/", "").replace("-", "")
+    strat_clean = strategy.replace("_", "").upper()[:6]
+    return f"HOT_{strat_clean}_{sym_clean}_{_INSTANCE_ID}_"
+
+
 def generate_client_order_id(strategy: str, symbol: str) -> str:
     """
-    Generate a unique, deterministic-ish client order ID.
+    Generate a unique client order ID.
 
-    Format: HOT_{strategy}_{symbol}_{ts}_{uuid8}
-    Example: HOT_SQZBO_BTCUSDT_20260217T1557_a1b2c3d4
+    Format: HOT_{strategy}_{symbol}_{instance}_{seq}
+    Example: HOT_SQZBO_BTCUSDT_3f9a1c_0000002a
     """
-    sym_clean = symbol.replace("/", "").replace("-", "")
-    strat_clean = strategy.replace("_", "").upper()[:6]
-    ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M")
-    short_uuid = uuid.uuid4().hex[:8]
-    return f"HOT_{strat_clean}_{sym_clean}_{ts}_{short_uuid}"
+    return _client_order_id_prefix(strategy, symbol) + format(next(_ORDER_SEQ), "08x")
+
+
+# ---------------------------------------------------------------------------
+# Rate-limit retry
+# ---------------------------------------------------------------------------
+
+def _retry_with_backoff(
+    fn: Callable[[], T],
+    retries: int = ORDER_RETRIES,
+    base: float = ORDER_RETRY_BASE_SECONDS,
+    cap: float = ORDER_RETRY_CAP_SECONDS,
+) -> T:
+    """
+    Call ``fn``, retrying up to ``retries`` times on RateLimitExceeded.
+
+    Attempt ``n`` first sleeps ``uniform(0, min(cap, base * 2**n))``.
+    The final failure propagates.
+    """
+    for attempt in range(retries + 1):
+        try:
+            return fn()
+        except RateLimitExceeded:
+            if attempt == retries:
+                raise
+            delay = random.uniform(0, min(cap, base * 2 ** attempt))
+            logger.warning(
+                "Rate limited — retry %d/%d in %.2fs", attempt + 1, retries, delay
+            )
+            time.sleep(delay)
 
 
 # ---------------------------------------------------------------------------
@@ -156,6 +268,9 @@ class Executor:
         circuit_breaker: CircuitBreaker for safety checks
         chase_timeout_seconds: Max time to wait for limit fill before chasing
         chase_max_attempts: Max chase attempts before switching to market
+        order_store: Optional OrderStore for crash-safe order state
+        ws_client: Optional ccxt.pro exchange whose watch_orders() stream
+            drives order updates (see watch_order_updates)
     """
 
     def __init__(
@@ -167,6 +282,8 @@ class Executor:
         circuit_breaker: Optional["CircuitBreaker"] = None,
         chase_timeout_seconds: int = 30,
         chase_max_attempts: int = 3,
+        order_store: Optional["OrderStore"] = None,
+        ws_client: Optional[object] = None,
     ):
         self.mode = mode
         self.portfolio = portfolio
@@ -175,9 +292,60 @@ class Executor:
         self.circuit_breaker = circuit_breaker
         self.chase_timeout_seconds = chase_timeout_seconds
         self.chase_max_attempts = chase_max_attempts
+        self.order_store = order_store
+        self.ws_client = ws_client
+
+        # Whether the venue takes stop/tp on the entry order (lazy, see
+        # _supports_bracket)
+        self._bracket_supported: Optional[bool] = None
 
-        # Track all orders in this session
+        # Track all orders in this session, with running per-status counts
+        # (maintained by _track/_transition so get_status never scans)
         self.orders: dict[str, ManagedOrder] = {}
+        self._status_counts: Counter[OrderStatus] = Counter()
+
+        # symbol -> (fetched_at, {clientOrderId: open order}); cleared on submit
+        self._open_orders_cache: dict[Optional[str], tuple[float, dict[str, dict]]] = {}
+
+        # Guards order bookkeeping and the shared risk/breaker state when
+        # live signals execute concurrently (see execute_signals)
+        self._lock = threading.RLock()
+
+    async def execute_signal_async(
+        self,
+        symbol: str,
+        signal: object,
+        latest_candle: dict,
+        strategy_name: str,
+    ) -> Optional[dict]:
+        """
+        Awaitable ``execute_signal`` that keeps the event loop free.
+
+        In live mode the pipeline runs in a worker thread. Its blocking
+        exchange round trips then overlap with other symbols' work instead
+        of stalling the loop. Paper mode does no I/O and runs inline.
+        """
+        if self.mode != "live":
+            return self.execute_signal(symbol, signal, latest_candle, strategy_name)
+        return await asyncio.to_thread(
+            self.execute_signal, symbol, signal, latest_candle, strategy_name
+        )
+
+    async def execute_signals(
+        self, batch: list[tuple[str, object, dict, str]]
+    ) -> list[Optional[dict]]:
+        """
+        Execute several signals concurrently.
+
+        Args:
+            batch: (symbol, signal, latest_candle, strategy_name) tuples
+
+        Returns:
+            One execute_signal result per entry, in input order.
+        """
+        return list(await asyncio.gather(
+            *(self.execute_signal_async(*args) for args in batch)
+        ))
 
     def execute_signal(
         self,
@@ -224,6 +392,7 @@ class Executor:
                 tp=extra.get("tp"),
                 atr=extra.get("atr"),
                 risk_r=getattr(signal, "risk_r", 1.0),
+                now=datetime.now(timezone.utc),
             )
         elif action in ("CLOSE_LONG", "CLOSE_SHORT"):
             return self._execute_close(
@@ -250,63 +419,122 @@ class Executor:
         tp: Optional[float] = None,
         atr: Optional[float] = None,
         risk_r: float = 1.0,
+        now: Optional[datetime] = None,
     ) -> Optional[dict]:
-        """Execute an order to open a new position."""
-
-        # 1. Circuit breaker check
-        if self.circuit_breaker:
-            portfolio_value = None
-            if self.portfolio:
-                portfolio_value = self.portfolio.get_equity({symbol: price})
-            allowed, reason = self.circuit_breaker.check(
-                symbol, price, portfolio_value=portfolio_value,
-            )
-            if not allowed:
-                logger.warning("Trade blocked by circuit breaker: %s", reason)
-                return {"action": "REJECTED", "reason": reason}
-
-        # 2. Risk manager evaluation
-        if self.risk_manager and atr:
-            from strategies.indicators import ATR as ATR_func  # avoid circular
-            decision = self.risk_manager.evaluate_trade(
+        """
+        Execute an order to open a new position.
+
+        ``now`` is the signal's timestamp, shared by every timestamp set
+        before the order reaches the exchange.
+        """
+        if now is None:
+            now = datetime.now(timezone.utc)
+
+        # Steps 1-3 read and update shared risk state: serialize them so
+        # concurrent signals (execute_signals) see each other's trades
+        with self._lock:
+            # 1. Circuit breaker check
+            if self.circuit_breaker:
+                portfolio_value = None
+                if self.portfolio:
+                    portfolio_value = self.portfolio.get_equity({symbol: price})
+                allowed, reason = self.circuit_breaker.check(
+                    symbol, price, portfolio_value=portfolio_value,
+                )
+                if not allowed:
+                    logger.warning("Trade blocked by circuit breaker: %s", reason)
+                    return {"action": "REJECTED", "reason": reason}
+
+            # 2. Risk manager evaluation
+            if self.risk_manager and atr:
+                from strategies.indicators import ATR as ATR_func  # avoid circular
+                decision = self.risk_manager.evaluate_trade(
+                    symbol=symbol,
+                    price=price,
+                    atr_value=atr,
+                )
+                if not decision.approved:
+                    logger.warning("Trade rejected by risk manager: %s", decision.reason)
+                    return {"action": "REJECTED", "reason": decision.reason}
+                position_size = decision.position_size
+            else:
+                # Fallback: use a nominal size
+                position_size = 0.001  # minimum for paper testing
+                logger.warning("No risk manager — using fallback size %.6f", position_size)
+
+            # 3. Create managed order
+            client_id = generate_client_order_id(strategy_name, symbol)
+            order = ManagedOrder(
+                client_order_id=client_id,
                 symbol=symbol,
+                side=side,
+                order_type=OrderType.LIMIT if self.mode == "live" else OrderType.MARKET,
+                qty=position_size,
                 price=price,
-                atr_value=atr,
+                strategy=strategy_name,
+                created_at=now,
+                updated_at=now,
             )
-            if not decision.approved:
-                logger.warning("Trade rejected by risk manager: %s", decision.reason)
-                return {"action": "REJECTED", "reason": decision.reason}
-            position_size = decision.position_size
-        else:
-            # Fallback: use a nominal size
-            position_size = 0.001  # minimum for paper testing
-            logger.warning("No risk manager — using fallback size %.6f", position_size)
-
-        # 3. Create managed order
-        client_id = generate_client_order_id(strategy_name, symbol)
-        order = ManagedOrder(
-            client_order_id=client_id,
-            symbol=symbol,
-            side=side,
-            order_type=OrderType.LIMIT if self.mode == "live" else OrderType.MARKET,
-            qty=position_size,
-            price=price,
-            strategy=strategy_name,
-        )
-        self.orders[client_id] = order
+            self._track(order, persist=False)
+        # Saved after releasing the lock so other signals don't wait on I/O
+        self._persist(order)
 
         # 4. Execute
         if self.mode == "paper":
-            return self._execute_paper_open(order, stop, tp)
+            result = self._execute_paper_open(order, stop, tp, now=now)
         else:
-            return self._execute_live_open(order, stop, tp)
+            result = self._execute_live_open(order, stop, tp)
+        self._persist(order)
+        return result
+
+    def _track(self, order: ManagedOrder, persist: bool = True) -> ManagedOrder:
+        """
+        Register a new order with the session (and the store, if any).
+
+        Idempotent per clientOrderId: if the id is already tracked, the
+        existing order is returned and nothing is registered.
+        """
+        # setdefault is a single atomic dict operation, so concurrent
+        # registrations of one id cannot both win without taking the lock
+        existing = self.orders.setdefault(order.client_order_id, order)
+        if existing is not order:
+            logger.warning("Order %s already tracked", order.client_order_id)
+            return existing
+        with self._lock:
+            self._status_counts[order.status] += 1
+        if persist:
+            # PENDING hits disk before the API request, so a crash mid-submit
+            # leaves a record for reconcile_on_startup to resolve
+            self._persist(order)
+        return order
+
+    def _persist(self, order: ManagedOrder) -> None:
+        """Write the order's current state through to the order store."""
+        if self.order_store is None:
+            return
+        try:
+            self.order_store.save(order)
+        except Exception as e:
+            logger.error("Failed to persist order %s: %s", order.client_order_id, e)
+
+    def _transition(self, order: ManagedOrder, status: OrderStatus) -> None:
+        """Move an order to ``status``, keeping the status counts in sync."""
+        with self._lock:
+            if self.orders.get(order.client_order_id) is order:
+                self._status_counts[order.status] -= 1
+                self._status_counts[status] += 1
+            order.status = status
 
     def _execute_paper_open(
-        self, order: ManagedOrder, stop: Optional[float], tp: Optional[float]
+        self,
+        order: ManagedOrder,
+        stop: Optional[float],
+        tp: Optional[float],
+        now: Optional[datetime] = None,
     ) -> dict:
         """Execute open order in paper mode via Portfolio."""
         if not self.portfolio:
-            order.status = OrderStatus.ERROR
+            self._transition(order, OrderStatus.ERROR)
             order.error_message = "No portfolio configured for paper mode"
             return {"action": "ERROR", "reason": order.error_message}
 
@@ -330,29 +558,31 @@ class Executor:
                     strategy=order.strategy,
                 )
 
-            order.status = OrderStatus.FILLED
+            self._transition(order, OrderStatus.FILLED)
             order.filled_qty = order.qty
             order.avg_fill_price = fill_price
             order.fees = fees
-            order.filled_at = datetime.now(timezone.utc)
+            # Simulated fills are instantaneous: reuse the signal timestamp
+            order.filled_at = order.updated_at = now or datetime.now(timezone.utc)
 
             if self.risk_manager:
                 self.risk_manager.register_trade_open()
 
-            logger.info(
-                "📈 PAPER %s %s %.6f @ $%.2f (fees=%.4f)",
-                order.side.value.upper(),
-                order.symbol,
-                order.qty,
-                fill_price,
-                fees,
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    _LOG_PAPER_OPEN,
+                    _SIDE_UPPER[order.side],
+                    order.symbol,
+                    order.qty,
+                    fill_price,
+                    fees,
+                )
 
             return {
                 "action": "FILLED",
                 "client_order_id": order.client_order_id,
                 "symbol": order.symbol,
-                "side": order.side.value,
+                "side": order.side,
                 "qty": order.qty,
                 "fill_price": fill_price,
                 "fees": fees,
@@ -361,70 +591,95 @@ class Executor:
             }
 
         except ValueError as e:
-            order.status = OrderStatus.ERROR
+            self._transition(order, OrderStatus.ERROR)
             order.error_message = str(e)
             logger.error("Paper trade failed: %s", e)
             return {"action": "ERROR", "reason": str(e)}
 
+    def _supports_bracket(self) -> bool:
+        """True if create_order accepts stopLoss/takeProfit params natively."""
+        if self._bracket_supported is None:
+            try:
+                has = self.exchange_client.exchange.has
+                self._bracket_supported = (
+                    has.get("createOrderWithTakeProfitAndStopLoss") is True
+                )
+            except AttributeError:
+                self._bracket_supported = False
+        return self._bracket_supported
+
     def _execute_live_open(
         self, order: ManagedOrder, stop: Optional[float], tp: Optional[float]
     ) -> dict:
         """Execute open order in live mode via ExchangeClient."""
         if not self.exchange_client:
-            order.status = OrderStatus.ERROR
+            self._transition(order, OrderStatus.ERROR)
             order.error_message = "No exchange client configured for live mode"
             return {"action": "ERROR", "reason": order.error_message}
 
         try:
-            import ccxt
-
             # Submit limit order with clientOrderId
             params = {"clientOrderId": order.client_order_id}
             if order.order_type == OrderType.LIMIT:
                 params["postOnly"] = True  # Maker only to avoid taker fees
-
-            response = self.exchange_client.create_order(
-                symbol=order.symbol,
-                side=order.side.value,
-                order_type=order.order_type.value,
-                amount=order.qty,
-                price=order.price,
-                params=params,
+            if (stop or tp) and self._supports_bracket():
+                # Attach the bracket to the entry: one request instead of three
+                if stop:
+                    params["stopLoss"] = {"triggerPrice": stop}
+                if tp:
+                    params["takeProfit"] = {"triggerPrice": tp}
+
+            # Any open-orders snapshot predates this order
+            self._open_orders_cache.clear()
+
+            # Resubmitting is safe: the clientOrderId makes it idempotent
+            response = _retry_with_backoff(
+                lambda: self.exchange_client.create_order(
+                    symbol=order.symbol,
+                    side=order.side,
+                    order_type=order.order_type,
+                    amount=order.qty,
+                    price=order.price,
+                    params=params,
+                )
             )
 
             order.exchange_order_id = response.get("id")
-            order.status = OrderStatus.SUBMITTED
-            order.submitted_at = datetime.now(timezone.utc)
+            self._transition(order, OrderStatus.SUBMITTED)
+            # One timestamp for everything the response tells us
+            acked_at = datetime.now(timezone.utc)
+            order.submitted_at = order.updated_at = acked_at
 
             # Check immediate fill
             resp_status = response.get("status", "open")
             if resp_status == "closed":
-                order.status = OrderStatus.FILLED
+                self._transition(order, OrderStatus.FILLED)
                 order.filled_qty = float(response.get("filled", order.qty))
                 order.avg_fill_price = float(
                     response.get("average", order.price)
                 )
-                order.filled_at = datetime.now(timezone.utc)
+                order.filled_at = acked_at
             elif resp_status == "partially_filled":
-                order.status = OrderStatus.PARTIAL
+                self._transition(order, OrderStatus.PARTIAL)
                 order.filled_qty = float(response.get("filled", 0))
 
-            logger.info(
-                "📤 LIVE %s %s %.6f @ $%.2f [%s] id=%s",
-                order.side.value.upper(),
-                order.symbol,
-                order.qty,
-                order.price,
-                order.status.value,
-                order.exchange_order_id,
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    _LOG_LIVE_OPEN,
+                    _SIDE_UPPER[order.side],
+                    order.symbol,
+                    order.qty,
+                    order.price,
+                    order.status,
+                    order.exchange_order_id,
+                )
 
             return {
-                "action": order.status.value.upper(),
+                "action": _STATUS_UPPER[order.status],
                 "client_order_id": order.client_order_id,
                 "exchange_order_id": order.exchange_order_id,
                 "symbol": order.symbol,
-                "side": order.side.value,
+                "side": order.side,
                 "qty": order.qty,
                 "filled_qty": order.filled_qty,
                 "price": order.price,
@@ -432,7 +687,7 @@ class Executor:
                 "strategy": order.strategy,
             }
 
-        except ccxt.RequestTimeout:
+        except RequestTimeout:
             # Reconciliation: query the order by clientOrderId
             logger.warning(
                 "⏱ Timeout submitting order %s — attempting reconciliation",
@@ -440,14 +695,14 @@ class Executor:
             )
             return self._reconcile_order(order)
 
-        except ccxt.RateLimitExceeded:
-            order.status = OrderStatus.ERROR
+        except RateLimitExceeded:
+            self._transition(order, OrderStatus.ERROR)
             order.error_message = "Rate limit exceeded"
-            logger.error("Rate limit hit while placing order")
+            logger.error("Rate limit persisted after %d retries", ORDER_RETRIES)
             return {"action": "ERROR", "reason": "Rate limit exceeded"}
 
         except Exception as e:
-            order.status = OrderStatus.ERROR
+            self._transition(order, OrderStatus.ERROR)
             order.error_message = str(e)
             logger.error("Live order failed: %s", e, exc_info=True)
             return {"action": "ERROR", "reason": str(e)}
@@ -497,11 +752,11 @@ class Executor:
             if self.circuit_breaker:
                 self.circuit_breaker.register_trade_result(pnl)
 
-            pnl_emoji = "💰" if pnl >= 0 else "💸"
-            logger.info(
-                "%s PAPER CLOSE %s %s @ $%.2f  PnL=$%.2f",
-                pnl_emoji, pos.side, symbol, fill_price, pnl,
-            )
+            if logger.isEnabledFor(logging.INFO):
+                pnl_emoji = "💰" if pnl >= 0 else "💸"
+                logger.info(
+                    _LOG_PAPER_CLOSE, pnl_emoji, pos.side, symbol, fill_price, pnl,
+                )
 
             return {
                 "action": "CLOSED",
@@ -536,12 +791,14 @@ class Executor:
         side = "sell" if pos.side == "LONG" else "buy"
 
         try:
-            response = self.exchange_client.create_order(
-                symbol=symbol,
-                side=side,
-                order_type="market",
-                amount=pos.size,
-                params={"clientOrderId": client_id},
+            response = _retry_with_backoff(
+                lambda: self.exchange_client.create_order(
+                    symbol=symbol,
+                    side=side,
+                    order_type="market",
+                    amount=pos.size,
+                    params={"clientOrderId": client_id},
+                )
             )
 
             fill_price = float(response.get("average", price))
@@ -550,15 +807,14 @@ class Executor:
             if pos.side == "SHORT":
                 pnl = -pnl
 
-            if self.risk_manager:
-                self.risk_manager.register_trade_close(pnl)
-            if self.circuit_breaker:
-                self.circuit_breaker.register_trade_result(pnl)
+            with self._lock:
+                if self.risk_manager:
+                    self.risk_manager.register_trade_close(pnl)
+                if self.circuit_breaker:
+                    self.circuit_breaker.register_trade_result(pnl)
 
-            logger.info(
-                "📤 LIVE CLOSE %s %s @ $%.2f  PnL=$%.2f",
-                pos.side, symbol, fill_price, pnl,
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(_LOG_LIVE_CLOSE, pos.side, symbol, fill_price, pnl)
 
             return {
                 "action": "CLOSED",
@@ -589,7 +845,7 @@ class Executor:
         we received the exchange response.
         """
         if not self.exchange_client:
-            order.status = OrderStatus.ORPHANED
+            self._transition(order, OrderStatus.ORPHANED)
             return {"action": "ORPHANED", "reason": "No exchange client for reconciliation"}
 
         try:
@@ -600,44 +856,139 @@ class Executor:
                 )
             else:
                 # Fall back to checking open orders
-                open_orders = self.exchange_client.get_open_orders(order.symbol)
-                result = None
-                for oo in open_orders:
-                    if oo.get("clientOrderId") == order.client_order_id:
-                        result = oo
-                        break
+                result = self._get_open_orders_indexed(order.symbol).get(
+                    order.client_order_id
+                )
 
             if result is None:
-                order.status = OrderStatus.ORPHANED
+                self._transition(order, OrderStatus.ORPHANED)
                 logger.warning("Order %s not found on exchange — orphaned", order.client_order_id)
                 return {"action": "ORPHANED", "client_order_id": order.client_order_id}
 
-            status = result.get("status", "unknown")
-            if status == "closed":
-                order.status = OrderStatus.FILLED
-                order.filled_qty = float(result.get("filled", order.qty))
-                order.avg_fill_price = float(result.get("average", order.price))
-                order.filled_at = datetime.now(timezone.utc)
-                return {"action": "FILLED", **order.to_dict()}
-            elif status in ("open", "partially_filled"):
-                order.filled_qty = float(result.get("filled", 0))
-                order.status = OrderStatus.PARTIAL if order.filled_qty > 0 else OrderStatus.SUBMITTED
-                return {"action": order.status.value.upper(), **order.to_dict()}
-            else:
-                order.status = OrderStatus.ORPHANED
-                return {"action": "ORPHANED", **order.to_dict()}
+            applied = self._apply_order_state(order, result)
+            if applied is not None:
+                return applied
+            self._transition(order, OrderStatus.ORPHANED)
+            return {"action": "ORPHANED", **order.to_dict()}
 
         except Exception as e:
             logger.error("Reconciliation failed for %s: %s", order.client_order_id, e)
-            order.status = OrderStatus.ORPHANED
+            self._transition(order, OrderStatus.ORPHANED)
             return {"action": "ORPHANED", "reason": str(e)}
 
+    def _apply_order_state(self, order: ManagedOrder, result: dict) -> Optional[dict]:
+        """
+        Apply the fill state of a ccxt order structure to ``order``.
+
+        Returns the execution result, or None if the exchange status is
+        neither open nor closed.
+        """
+        status = result.get("status", "unknown")
+        # ccxt sends filled/average as None when the venue omits them
+        filled = result.get("filled")
+        average = result.get("average")
+        if status == "closed":
+            order.filled_qty = float(filled) if filled is not None else order.qty
+            order.avg_fill_price = (
+                float(average) if average is not None else (order.price or 0.0)
+            )
+            order.filled_at = datetime.now(timezone.utc)
+            self._transition(order, OrderStatus.FILLED)
+            return {"action": "FILLED", **order.to_dict()}
+        if status in ("open", "partially_filled"):
+            order.filled_qty = float(filled) if filled is not None else 0.0
+            self._transition(
+                order,
+                OrderStatus.PARTIAL if order.filled_qty > 0 else OrderStatus.SUBMITTED,
+            )
+            return {"action": _STATUS_UPPER[order.status], **order.to_dict()}
+        return None
+
+    async def _on_order_update(self, msg: dict) -> Optional[dict]:
+        """
+        Apply one pushed order update (a ccxt order structure).
+
+        Updates for orders this session does not track, or that are
+        already terminal, are ignored.
+        """
+        client_id = msg.get("clientOrderId")
+        with self._lock:
+            order = self.orders.get(client_id) if client_id else None
+            if order is None or order.is_terminal:
+                return None
+            if not order.exchange_order_id:
+                order.exchange_order_id = msg.get("id")
+
+            settled = _WS_SETTLED_STATES.get(msg.get("status"))
+            if settled is not None:
+                self._transition(order, settled)
+                result = {"action": _STATUS_UPPER[settled], **order.to_dict()}
+            else:
+                result = self._apply_order_state(order, msg)
+                if result is None:
+                    return None
+            order.updated_at = datetime.now(timezone.utc)
+        if self.order_store is not None:
+            # The store write is blocking I/O: keep it off the event loop
+            await asyncio.to_thread(self._persist, order)
+        return result
+
+    async def watch_order_updates(self, symbol: Optional[str] = None) -> None:
+        """
+        Drive order state from the ``ws_client`` order stream.
+
+        Fills arrive as they happen instead of being discovered by
+        fetch_order, which remains the fallback after a submit timeout.
+        Runs until the task is cancelled; stream errors re-subscribe
+        after WS_RETRY_SECONDS.
+        """
+        if self.ws_client is None:
+            raise ValueError("No ws_client configured for order updates")
+
+        while True:
+            try:
+                updates = await self.ws_client.watch_orders(symbol)
+            except Exception as e:
+                logger.warning("Order stream error: %s — re-subscribing", e)
+                await asyncio.sleep(WS_RETRY_SECONDS)
+                continue
+            for msg in updates:
+                # One bad message must not stop the stream for every order
+                try:
+                    await self._on_order_update(msg)
+                except Exception as e:
+                    logger.error(
+                        "Failed to apply order update %s: %s", msg.get("clientOrderId"), e
+                    )
+
+    def _get_open_orders_indexed(
+        self, symbol: Optional[str] = None
+    ) -> dict[str, dict]:
+        """
+        Open orders keyed by clientOrderId, reused for OPEN_ORDERS_TTL_SECONDS.
+
+        The snapshot is stamped when the query returns, so its own latency
+        does not shorten the reuse window.
+        """
+        cached = self._open_orders_cache.get(symbol)
+        if cached is not None and time.monotonic() - cached[0] < OPEN_ORDERS_TTL_SECONDS:
+            return cached[1]
+
+        open_orders = self.exchange_client.get_open_orders(symbol)
+        index = {
+            oo["clientOrderId"]: oo for oo in open_orders if oo.get("clientOrderId")
+        }
+        self._open_orders_cache[symbol] = (time.monotonic(), index)
+        return index
+
     def reconcile_on_startup(self) -> list[dict]:
         """
         On startup, check for any open orders from previous sessions.
 
         Should be called once at the beginning of a live trading session.
-        Fetches all open orders from the exchange and logs them.
+        With an order store, actionable orders from earlier sessions are
+        reloaded and reconciled first (terminal history is never read).
+        Then fetches all open orders from the exchange and logs them.
 
         Returns:
             List of open order dicts found on the exchange.
@@ -645,6 +996,9 @@ class Executor:
         if self.mode != "live" or not self.exchange_client:
             return []
 
+        if self.order_store is not None:
+            self._reconcile_stored_orders()
+
         try:
             open_orders = self.exchange_client.get_open_orders()
             if open_orders:
@@ -667,6 +1021,32 @@ class Executor:
             logger.error("Startup reconciliation failed: %s", e)
             return []
 
+    def _reconcile_stored_orders(self) -> int:
+        """Reload actionable orders from the store and reconcile each one."""
+        try:
+            # Read every page before reconciling: reconciliation moves orders
+            # out of the actionable set, which would shift later offsets
+            pending: list[ManagedOrder] = []
+            while True:
+                page = self.order_store.get_pending(
+                    limit=RECONCILE_PAGE_SIZE, offset=len(pending)
+                )
+                pending.extend(page)
+                if len(page) < RECONCILE_PAGE_SIZE:
+                    break
+        except Exception as e:
+            logger.error("Failed to load stored orders: %s", e)
+            return 0
+
+        for order in pending:
+            if self._track(order, persist=False) is not order:
+                continue
+            self._reconcile_order(order)
+            self._persist(order)
+        if pending:
+            logger.info("Reconciled %d stored orders", len(pending))
+        return len(pending)
+
     def cancel_all_open_orders(self, symbol: Optional[str] = None) -> int:
         """
         Cancel all open orders on the exchange.
@@ -682,24 +1062,39 @@ class Executor:
         cancelled = 0
         try:
             open_orders = self.exchange_client.get_open_orders(symbol)
-            for oo in open_orders:
+        except Exception as e:
+            logger.error("Failed to fetch open orders for cancellation: %s", e)
+            return 0
+        if not open_orders:
+            return 0
+
+        # Cancel concurrently: each cancel is a blocking round trip, and the
+        # client's rate limiter is thread-safe
+        workers = min(CANCEL_MAX_WORKERS, len(open_orders))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(self.exchange_client.cancel_order, oo["id"], oo["symbol"]): oo
+                for oo in open_orders
+            }
+            for future in as_completed(futures):
+                oo = futures[future]
                 try:
-                    self.exchange_client.cancel_order(oo["id"], oo["symbol"])
+                    future.result()
                     cancelled += 1
                     logger.info("Cancelled order %s on %s", oo["id"], oo["symbol"])
                 except Exception as e:
                     logger.error("Failed to cancel order %s: %s", oo["id"], e)
-        except Exception as e:
-            logger.error("Failed to fetch open orders for cancellation: %s", e)
 
+        self._open_orders_cache.clear()
         return cancelled
 
     def get_status(self) -> dict:
         """Get executor status summary."""
+        counts = self._status_counts
         total = len(self.orders)
-        filled = sum(1 for o in self.orders.values() if o.status == OrderStatus.FILLED)
-        pending = sum(1 for o in self.orders.values() if not o.is_terminal)
-        errors = sum(1 for o in self.orders.values() if o.status == OrderStatus.ERROR)
+        filled = counts[OrderStatus.FILLED]
+        pending = total - sum(counts[s] for s in TERMINAL_STATUSES)
+        errors = counts[OrderStatus.ERROR]
 
         return {
             "mode": self.mode,
@@ -0,0 +1,115 @@
+"""
+Compiled indicator kernels.
+
+Loop-based implementations of the hot indicators (EMA, ATR, RSI) that
+Numba compiles to machine code. They take and return float64 NumPy
+arrays and reproduce the pandas formulations in strategies/indicators.py
+bar for bar, so strategies can pass ``.values`` straight through
+(Backtesting.py's ``self.I`` accepts any function returning an array).
+
+Without numba installed the kernels still run, as plain Python.
+"""
+
+import numpy as np
+
+from ._njit import njit
+
+
+@njit(cache=True)
+def ema(x, n):
+    """
+    EMA with span ``n``; matches ``ewm(span=n, adjust=False).mean()``.
+
+    NaN inputs are handled as pandas does (``ignore_na=False``): the
+    previous value is carried through the gap, and its weight keeps
+    decaying, so the next observation counts for more.
+    """
+    out = np.empty_like(x)
+    k = 2.0 / (n + 1)
+    weighted = np.nan
+    old_wt = 1.0
+    for i in range(x.size):
+        cur = x[i]
+        if weighted == weighted:
+            old_wt *= 1.0 - k
+            if cur == cur:
+                if weighted != cur:
+                    # pandas special-cases com == 1 (span 3): the new value
+                    # takes all the weight the old one has lost
+                    new_wt = 1.0 - old_wt if k == 0.5 else k
+                    weighted = (old_wt * weighted + new_wt * cur) / (old_wt + new_wt)
+                old_wt = 1.0
+        elif cur == cur:
+            weighted = cur
+        out[i] = weighted
+    return out
+
+
+@njit(cache=True)
+def atr(high, low, close, n):
+    """
+    Simple-average true range over ``n`` bars (NaN until ``n`` bars).
+
+    Like ``rolling(n).mean()``, a window containing a NaN true range is
+    NaN, and values resume once the gap has left the window.
+    """
+    size = close.size
+    out = np.full(size, np.nan)
+    total = 0.0
+    valid = 0  # non-NaN true ranges in the window
+    tr = np.empty(size)
+    for i in range(size):
+        t = high[i] - low[i]
+        if i > 0:
+            # Max skipping NaN, as DataFrame.max(axis=1) does
+            for v in (abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1])):
+                if t != t or v > t:
+                    t = v
+        tr[i] = t
+        if t == t:
+            total += t
+            valid += 1
+        if i >= n:
+            old = tr[i - n]
+            if old == old:
+                total -= old
+                valid -= 1
+        if i >= n - 1 and valid == n:
+            out[i] = total / n
+    return out
+
+
+@njit(cache=True)
+def rsi(close, n):
+    """
+    Wilder-style RSI matching ``ewm(alpha=1/n, min_periods=n)`` smoothing.
+
+    NaN for the first ``n - 1`` bars and wherever there has been no
+    movement at all.
+    """
+    size = close.size
+    out = np.full(size, np.nan)
+    decay = 1.0 - 1.0 / n
+    gain_num = 0.0
+    loss_num = 0.0
+    weight = 0.0
+    for i in range(size):
+        gain = 0.0
+        loss = 0.0
+        if i > 0:
+            delta = close[i] - close[i - 1]
+            if delta > 0:
+                gain = delta
+            elif delta < 0:
+                loss = -delta
+        gain_num = gain + decay * gain_num
+        loss_num = loss + decay * loss_num
+        weight = 1.0 + decay * weight
+        if i >= n - 1:
+            avg_loss = loss_num / weight
+            if avg_loss == 0.0:
+                if gain_num > 0.0:
+                    out[i] = 100.0
+            else:
+                out[i] = 100.0 - 100.0 / (1.0 + (gain_num / weight) / avg_loss)
+    return out
@@ -8,63 +8,118 @@ Specialized scanner for 100x potential gems:
 """
 
 import logging
-import requests
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
 
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+
 logger = logging.getLogger(__name__)
 
+# Gems returned per scan
+TOP_GEMS = 10
+
 class MoonshotScanner:
     def __init__(self):
         self.cg_url = "https://api.coingecko.com/api/v3"
         self.min_vol_mcap_ratio = 0.1  # High volume relative to size
         self.max_mcap = 100_000_000    # $100M Cap (Small Cap)
-        
-    def find_moonshots(self) -> List[Dict]:
-        """Find potential 100x gems."""
+        self.pages = 3                 # Pages of 100 coins to scan
+
+        # (max_mcap, min_vol_mcap_ratio) -> (fetched_at, gems)
+        self._cache: dict[tuple, tuple[float, List[Dict]]] = {}
+
+        # Keep-alive session: pages reuse one pooled TLS connection set
+        self.session = requests.Session()
+        self.session.mount(
+            "https://", HTTPAdapter(pool_connections=8, pool_maxsize=8)
+        )
+
+    def find_moonshots(self, ttl_s: float = 60.0) -> List[Dict]:
+        """
+        Find potential 100x gems.
+
+        A scan is reused for ``ttl_s`` seconds per (max_mcap,
+        min_vol_mcap_ratio); pass 0 to force a fresh scan. Failed scans
+        are not cached.
+        """
+        key = (self.max_mcap, self.min_vol_mcap_ratio)
+        cached = self._cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < ttl_s:
+            return list(cached[1])
+
         try:
-            # Get coins with market data (Top 250 per page)
-            # We want smaller ones, so maybe page 3-4? 
-            # Actually, let's get markets and filter
-            url = f"{self.cg_url}/coins/markets"
-            params = {
-                "vs_currency": "usd",
-                "order": "volume_desc", # High volume
-                "per_page": 100,
-                "page": 1,
-                "sparkline": False
-            }
-            
-            gems = []
-            
-            # Scan top 300 by volume to find low cap high volume
-            for page in range(1, 4):
-                params["page"] = page
-                response = requests.get(url, params=params, timeout=10)
-                if response.status_code != 200:
-                    break
-                    
-                data = response.json()
-                for coin in data:
-                    mcap = coin.get("market_cap") or 0
-                    vol = coin.get("total_volume") or 0
-                    
-                    if mcap > 0 and mcap < self.max_mcap:
-                        ratio = vol / mcap
-                        if ratio > self.min_vol_mcap_ratio:
-                            gems.append({
-                                "symbol": coin["symbol"].upper(),
-                                "name": coin["name"],
-                                "price": coin["current_price"],
-                                "mcap": mcap,
-                                "volume": vol,
-                                "ratio": ratio,
-                                "change_24h": coin["price_change_percentage_24h"]
-                            })
-                            
-            # Sort by "Hype Ratio" (Volume/Mcap)
-            gems.sort(key=lambda x: x["ratio"], reverse=True)
-            return gems[:10]
-            
+            gems = self._scan()
         except Exception as e:
             logger.error(f"Moonshot scan failed: {e}")
             return []
+
+        # Stamp after the scan returns so its latency doesn't eat the window
+        self._cache[key] = (time.monotonic(), gems)
+        return list(gems)
+
+    def _scan(self) -> List[Dict]:
+        """Query CoinGecko and return the top TOP_GEMS by volume/mcap ratio."""
+        # Get coins with market data (Top 250 per page)
+        # We want smaller ones, so maybe page 3-4? 
+        # Actually, let's get markets and filter
+        url = f"{self.cg_url}/coins/markets"
+        params = {
+            "vs_currency": "usd",
+            "order": "volume_desc", # High volume
+            "per_page": 100,
+            "page": 1,
+            "sparkline": False
+        }
+        
+        gems = []
+
+        def fetch_page(page: int) -> requests.Response:
+            return self.session.get(
+                url, params={**params, "page": page}, timeout=10
+            )
+
+        # Scan top 300 by volume to find low cap high volume; the pages
+        # are fetched concurrently and processed in order
+        with ThreadPoolExecutor(max_workers=self.pages) as pool:
+            responses = list(pool.map(fetch_page, range(1, self.pages + 1)))
+
+        coins = []
+        for response in responses:
+            if response.status_code != 200:
+                break
+            coins.extend(response.json())
+
+        if coins:
+            # Filter the whole universe at once instead of coin by coin
+            mcaps = np.fromiter(
+                (c.get("market_cap") or 0 for c in coins), np.float64, len(coins)
+            )
+            vols = np.fromiter(
+                (c.get("total_volume") or 0 for c in coins), np.float64, len(coins)
+            )
+            small = (mcaps > 0) & (mcaps < self.max_mcap)
+            ratios = np.divide(vols, mcaps, out=np.zeros_like(vols), where=small)
+            hits = np.flatnonzero(small & (ratios > self.min_vol_mcap_ratio))
+            if len(hits) > TOP_GEMS:
+                # Partial selection: only the top slice needs ordering
+                hits = np.sort(
+                    hits[np.argpartition(ratios[hits], -TOP_GEMS)[-TOP_GEMS:]]
+                )
+            # Sort by "Hype Ratio" (Volume/Mcap), ties in scan order
+            hits = hits[np.argsort(-ratios[hits], kind="stable")]
+            for i in hits:
+                coin = coins[i]
+                gems.append({
+                    "symbol": coin["symbol"].upper(),
+                    "name": coin["name"],
+                    "price": coin["current_price"],
+                    "mcap": coin.get("market_cap"),
+                    "volume": coin.get("total_volume") or 0,
+                    "ratio": float(ratios[i]),
+                    "change_24h": coin["price_change_percentage_24h"]
+                })
+
+        return gems
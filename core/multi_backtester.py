@@ -6,8 +6,11 @@ returning a comparison DataFrame of results.
 """
 
 import logging
-from typing import Optional
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Optional
 
+import numpy as np
 import pandas as pd
 from backtesting import Backtest
 
@@ -16,11 +19,8 @@ try:
 except ImportError:
     FractionalBacktest = Backtest
 
-from .data_source import DataSource
-from .sql_data_source import SQLDataSource
-from .ccxt_data_source import CCXTDataSource
-from .exchange_client import ExchangeClient
-from .backtester import prepare_ohlcv_for_backtesting
+from .backtester import _get_prepared_ohlcv
+from db.persistence import save_backtest_batch
 
 # Import all strategies
 from strategies.trend_ema import TrendEmaBacktest
@@ -74,10 +74,20 @@ def run_all_backtests(
     use_sql: bool = False,
     db_url: Optional[str] = None,
     persist: bool = False,
+    max_workers: Optional[int] = None,
+    use_float32: bool = False,
 ) -> pd.DataFrame:
     """
     Run all strategies (TREND_EMA, MR_BB, SQZ_BO, GRID_LR) for each symbol.
 
+    OHLCV is fetched once per symbol in this process and handed to each
+    worker at startup; the (symbol, strategy) backtests then run across
+    worker processes. Results are persisted from this process.
+
+    Fetches share the process-level cache of core.backtester, so repeated
+    comparisons reuse the same candles; call
+    core.backtester.clear_ohlcv_cache() to pick up new ones.
+
     Args:
         symbols: List of trading pairs (e.g., ["BTC/USDT", "ETH/USDT"])
         timeframe: Candle timeframe to use
@@ -86,7 +96,10 @@ def run_all_backtests(
         commission: Commission rate
         use_sql: Use SQLDataSource if True, else CCXTDataSource
         db_url: Database URL override
-        persist: If True, save each run to DB via save_backtest_to_db() (Phase 5)
+        persist: If True, save each symbol's runs to DB via save_backtest_batch() (Phase 5)
+        max_workers: Worker process count (default: os.cpu_count())
+        use_float32: Run on float32 OHLCV, halving the memory traffic of the
+            strategies' indicator loops (results differ slightly from float64)
 
     Returns:
         DataFrame with columns: symbol, strategy, final_equity,
@@ -100,23 +113,17 @@ def run_all_backtests(
     logger.info("=" * 60)
     
     results = []
+    frames: dict[str, pd.DataFrame] = {}
+    spans: dict[str, tuple[str, str, int]] = {}
     
     for symbol in symbols:
         logger.info(f"\n{'='*40}")
         logger.info(f"Processing {symbol}")
         logger.info(f"{'='*40}")
         
-        # Get data source
-        if use_sql:
-            data_source: DataSource = SQLDataSource(db_url=db_url)
-        else:
-            client = ExchangeClient()
-            data_source = CCXTDataSource(client)
-        
-        # Fetch OHLCV data once per symbol
+        # Fetch OHLCV data once per symbol (cached across invocations)
         try:
-            df = data_source.get_ohlcv(symbol=symbol, timeframe=timeframe, limit=limit)
-            df = prepare_ohlcv_for_backtesting(df)
+            df = _get_prepared_ohlcv(use_sql, db_url, symbol, timeframe, limit)
             
             # Extract date range info
             start_date = df.index.min().strftime('%Y-%m-%d') if len(df) > 0 else 'N/A'
@@ -128,68 +135,81 @@ def run_all_backtests(
         except Exception as e:
             logger.error(f"Failed to load data for {symbol}: {e}")
             continue
-            start_date, end_date, days_span = 'N/A', 'N/A', 0
-        
-        # Run each strategy
-        for strategy_name, strategy_class in STRATEGIES.items():
-            try:
-                logger.info(f"  Running {strategy_name}...")
-                
-                bt = FractionalBacktest(
-                    df,
-                    strategy_class,
-                    cash=cash,
-                    commission=commission,
-                    exclusive_orders=True,
+
+        frames[symbol] = df.astype(np.float32) if use_float32 else df
+        spans[symbol] = (start_date, end_date, days_span)
+
+    # Run each strategy on each loaded symbol
+    tasks = [(symbol, name) for symbol in frames for name in STRATEGIES]
+    if tasks:
+        logger.info(f"Running {len(tasks)} backtests...")
+        with ProcessPoolExecutor(
+            max_workers=max_workers or os.cpu_count(),
+            initializer=_init_worker,
+            initargs=(frames,),
+        ) as executor:
+            futures = {
+                (symbol, name): executor.submit(
+                    _run_one, symbol, STRATEGIES[name], cash, commission
                 )
-                
-                stats = bt.run()
-                
-                results.append({
-                    "symbol": symbol,
-                    "strategy": strategy_name,
-                    "final_equity": stats["Equity Final [$]"],
-                    "return_pct": stats["Return [%]"],
-                    "max_drawdown_pct": stats["Max. Drawdown [%]"],
-                    "sharpe_ratio": stats["Sharpe Ratio"] if not pd.isna(stats["Sharpe Ratio"]) else 0.0,
-                    "trades_count": stats["# Trades"],
-                    "win_rate": stats["Win Rate [%]"] if not pd.isna(stats["Win Rate [%]"]) else 0.0,
-                    "start_date": start_date,
-                    "end_date": end_date,
-                    "days_span": days_span,
-                })
-                
-                logger.info(f"    -> {strategy_name}: ${stats['Equity Final [$]']:,.2f} "
-                           f"({stats['Return [%]']:.2f}%), {stats['# Trades']} trades")
-                
-                # Save to database if persist=True
-                if persist:
-                    from db.persistence import save_backtest_to_db
-                    # Trades are stored in stats['_trades']
-                    trades_df = stats.get('_trades', pd.DataFrame())
-                    run_id = save_backtest_to_db(
-                        stats=stats,
-                        trades_df=trades_df,
-                        symbol=symbol,
-                        timeframe=timeframe,
-                        strategy_name=strategy_name,
-                        initial_cash=cash,
-                        db_url=db_url,
-                    )
-                    logger.info(f"      Saved as run #{run_id}")
-                
-            except Exception as e:
-                logger.error(f"  Failed to run {strategy_name}: {e}")
-                results.append({
-                    "symbol": symbol,
-                    "strategy": strategy_name,
-                    "final_equity": cash,
-                    "return_pct": 0.0,
-                    "max_drawdown_pct": 0.0,
-                    "sharpe_ratio": 0.0,
-                    "trades_count": 0,
-                    "win_rate": 0.0,
-                })
+                for symbol, name in tasks
+            }
+            # Collect symbol by symbol; later runs keep going meanwhile
+            for symbol in frames:
+                start_date, end_date, days_span = spans[symbol]
+                to_persist = []
+                for strategy_name in STRATEGIES:
+                    try:
+                        stats = futures[(symbol, strategy_name)].result()
+                        
+                        results.append({
+                            "symbol": symbol,
+                            "strategy": strategy_name,
+                            "final_equity": stats["Equity Final [$]"],
+                            "return_pct": stats["Return [%]"],
+                            "max_drawdown_pct": stats["Max. Drawdown [%]"],
+                            "sharpe_ratio": stats["Sharpe Ratio"] if not pd.isna(stats["Sharpe Ratio"]) else 0.0,
+                            "trades_count": stats["# Trades"],
+                            "win_rate": stats["Win Rate [%]"] if not pd.isna(stats["Win Rate [%]"]) else 0.0,
+                            "start_date": start_date,
+                            "end_date": end_date,
+                            "days_span": days_span,
+                        })
+                        
+                        logger.info(f"    -> {symbol} {strategy_name}: ${stats['Equity Final [$]']:,.2f} "
+                                   f"({stats['Return [%]']:.2f}%), {stats['# Trades']} trades")
+                        
+                        if persist:
+                            to_persist.append({
+                                "stats": stats,
+                                # Trades are stored in stats['_trades']
+                                "trades_df": stats.get('_trades'),
+                                "symbol": symbol,
+                                "timeframe": timeframe,
+                                "strategy_name": strategy_name,
+                                "initial_cash": cash,
+                            })
+                        
+                    except Exception as e:
+                        logger.error(f"  Failed to run {strategy_name} on {symbol}: {e}")
+                        results.append({
+                            "symbol": symbol,
+                            "strategy": strategy_name,
+                            "final_equity": cash,
+                            "return_pct": 0.0,
+                            "max_drawdown_pct": 0.0,
+                            "sharpe_ratio": 0.0,
+                            "trades_count": 0,
+                            "win_rate": 0.0,
+                        })
+
+                # Save the symbol's runs to database in one transaction
+                if to_persist:
+                    try:
+                        run_ids = save_backtest_batch(to_persist, db_url=db_url)
+                        logger.info(f"      Saved {symbol} as runs {run_ids}")
+                    except Exception as e:
+                        logger.error(f"  Failed to save {symbol} runs: {e}")
     
     # Create results DataFrame
     results_df = pd.DataFrame(results)
@@ -205,6 +225,36 @@ def run_all_backtests(
     return results_df
 
 
+# Prepared OHLCV frames (by symbol) shared with run_all_backtests workers
+_WORKER_FRAMES: dict[str, pd.DataFrame] = {}
+
+
+def _init_worker(frames: dict[str, pd.DataFrame]) -> None:
+    global _WORKER_FRAMES
+    _WORKER_FRAMES = frames
+
+
+def _run_one(symbol: str, strategy_class: type, cash: float, commission: float) -> Any:
+    bt = FractionalBacktest(
+        _WORKER_FRAMES[symbol],
+        strategy_class,
+        cash=cash,
+        commission=commission,
+        exclusive_orders=True,
+    )
+    return bt.run()
+
+
+# Display formats for numeric columns of the results table
+_TABLE_FORMATTERS = {
+    "final_equity": "${:,.2f}".format,
+    "return_pct": "{:.2f}%".format,
+    "max_drawdown_pct": "{:.2f}%".format,
+    "sharpe_ratio": "{:.3f}".format,
+    "win_rate": "{:.1f}%".format,
+}
+
+
 def format_results_table(df: pd.DataFrame) -> str:
     """
     Format results DataFrame as a readable table.
@@ -218,12 +268,5 @@ def format_results_table(df: pd.DataFrame) -> str:
     if df.empty:
         return "No results to display"
     
-    # Format for display
-    display_df = df.copy()
-    display_df["final_equity"] = display_df["final_equity"].apply(lambda x: f"${x:,.2f}")
-    display_df["return_pct"] = display_df["return_pct"].apply(lambda x: f"{x:.2f}%")
-    display_df["max_drawdown_pct"] = display_df["max_drawdown_pct"].apply(lambda x: f"{x:.2f}%")
-    display_df["sharpe_ratio"] = display_df["sharpe_ratio"].apply(lambda x: f"{x:.3f}")
-    display_df["win_rate"] = display_df["win_rate"].apply(lambda x: f"{x:.1f}%")
-    
-    return display_df.to_string(index=False)
+    # Formatters are applied by to_string; df itself is left untouched
+    return df.to_string(index=False, formatters=_TABLE_FORMATTERS)
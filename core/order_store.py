@@ -0,0 +1,141 @@
+"""
+Durable order store for the execution engine.
+
+Write-through persistence of ManagedOrder state to the ``live_orders``
+table, so a crash does not lose idempotency state. Reconciliation reads
+only actionable orders through the ``(status, created_at)`` index, in
+pages, so restart cost scales with pending orders rather than the whole
+order history.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from db.init_db import init_db
+from db.models import LiveOrder
+
+from .execution import (
+    ACTIONABLE_STATUSES,
+    ManagedOrder,
+    OrderSide,
+    OrderStatus,
+    OrderType,
+)
+
+logger = logging.getLogger(__name__)
+
+# ManagedOrder fields persisted one-to-one as LiveOrder columns
+_COLUMNS = (
+    "client_order_id",
+    "exchange_order_id",
+    "symbol",
+    "side",
+    "order_type",
+    "qty",
+    "filled_qty",
+    "price",
+    "avg_fill_price",
+    "status",
+    "strategy",
+    "fees",
+    "error_message",
+    "chase_attempts",
+    "created_at",
+    "submitted_at",
+    "filled_at",
+    "updated_at",
+)
+_TIMESTAMPS = ("created_at", "submitted_at", "filled_at", "updated_at")
+
+
+def _to_naive_utc(ts: Optional[datetime]) -> Optional[datetime]:
+    """SQLite DateTime columns are naive; store UTC wall time."""
+    if ts is None or ts.tzinfo is None:
+        return ts
+    return ts.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _to_aware_utc(ts: Optional[datetime]) -> Optional[datetime]:
+    return ts.replace(tzinfo=timezone.utc) if ts is not None else None
+
+
+class OrderStore:
+    """
+    SQLite-backed persistence for ManagedOrder.
+
+    Args:
+        db_url: Database URL override (defaults to the project database)
+    """
+
+    def __init__(self, db_url: Optional[str] = None):
+        self.engine = init_db(db_url)
+
+    @staticmethod
+    def _row(order: ManagedOrder) -> dict:
+        row = {col: getattr(order, col) for col in _COLUMNS}
+        row["side"] = str(order.side)
+        row["order_type"] = str(order.order_type)
+        row["status"] = str(order.status)
+        for col in _TIMESTAMPS:
+            row[col] = _to_naive_utc(row[col])
+        return row
+
+    @staticmethod
+    def _order(rec: LiveOrder) -> ManagedOrder:
+        return ManagedOrder(
+            client_order_id=rec.client_order_id,
+            symbol=rec.symbol,
+            side=OrderSide(rec.side),
+            order_type=OrderType(rec.order_type),
+            qty=rec.qty,
+            price=rec.price,
+            strategy=rec.strategy,
+            status=OrderStatus(rec.status),
+            exchange_order_id=rec.exchange_order_id,
+            filled_qty=rec.filled_qty or 0.0,
+            avg_fill_price=rec.avg_fill_price or 0.0,
+            fees=rec.fees or 0.0,
+            error_message=rec.error_message,
+            chase_attempts=rec.chase_attempts or 0,
+            created_at=_to_aware_utc(rec.created_at),
+            submitted_at=_to_aware_utc(rec.submitted_at),
+            filled_at=_to_aware_utc(rec.filled_at),
+            updated_at=_to_aware_utc(rec.updated_at),
+        )
+
+    def save(self, order: ManagedOrder) -> None:
+        """Insert or update an order, keyed by client_order_id."""
+        with Session(self.engine) as session:
+            session.execute(LiveOrder.upsert_stmt([self._row(order)]))
+            session.commit()
+
+    def get(self, client_order_id: str) -> Optional[ManagedOrder]:
+        """Load a single order, or None if it was never stored."""
+        with Session(self.engine) as session:
+            rec = session.scalars(
+                select(LiveOrder).where(LiveOrder.client_order_id == client_order_id)
+            ).first()
+            return self._order(rec) if rec is not None else None
+
+    def get_pending(self, limit: int = 100, offset: int = 0) -> list[ManagedOrder]:
+        """
+        Actionable (not yet settled) orders, oldest first.
+
+        Served by the ``(status, created_at)`` index; page with
+        ``limit``/``offset``.
+        """
+        stmt = (
+            select(LiveOrder)
+            .where(LiveOrder.status.in_([str(s) for s in ACTIONABLE_STATUSES]))
+            .order_by(LiveOrder.created_at)
+            .limit(limit)
+            .offset(offset)
+        )
+        with Session(self.engine) as session:
+            return [self._order(rec) for rec in session.scalars(stmt)]
@@ -3,23 +3,120 @@ Paper trading persistence: Save paper runs, events, and trades to database.
 
 Provides functions to:
 - Create and manage paper trading sessions
-- Log events during paper trading
+- Log events during paper trading (batched by a background writer)
 - Record simulated trades
 """
 
+import atexit
+import functools
 import json
 import logging
-from datetime import datetime
+import queue
+import threading
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime, timezone
 from typing import Any, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session, sessionmaker
 
-from db.init_db import get_engine
+from db.init_db import get_db_url, get_engine
 from db.models import PaperRun, PaperEvent, PaperTrade
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=8)
+def _session_factory(url: str) -> sessionmaker:
+    """One engine, and so one connection pool, per database URL."""
+    return sessionmaker(bind=get_engine(url))
+
+
+def _session(db_url: Optional[str] = None) -> Session:
+    """Open a session on the cached engine for ``db_url``."""
+    return _session_factory(get_db_url(db_url))()
+
+
+def _utcnow() -> datetime:
+    """Current UTC time, naive like the models' DateTime columns."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+# Event batching: write when this many events are queued, or when the
+# oldest queued event has waited EVENT_MAX_WAIT_S
+EVENT_BATCH_SIZE = 100
+EVENT_MAX_WAIT_S = 0.25
+# Producers block (backpressure) once this many events are unwritten
+EVENT_QUEUE_SIZE = 10_000
+
+
+class _PaperWriter:
+    """Background thread that inserts queued event rows in batches."""
+
+    def __init__(self):
+        self._queue: queue.Queue = queue.Queue(maxsize=EVENT_QUEUE_SIZE)
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+    def put(self, url: str, row: dict) -> None:
+        if self._thread is None:
+            with self._start_lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name="paper-writer", daemon=True
+                    )
+                    self._thread.start()
+        self._queue.put((url, row))
+
+    def flush(self) -> None:
+        """Block until every queued event has been written."""
+        self._queue.join()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + EVENT_MAX_WAIT_S
+            while len(batch) < EVENT_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            try:
+                self._write(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    @staticmethod
+    def _write(batch: list[tuple[str, dict]]) -> None:
+        by_url: dict[str, list[dict]] = defaultdict(list)
+        for url, row in batch:
+            by_url[url].append(row)
+        for url, rows in by_url.items():
+            try:
+                with _session_factory(url)() as session:
+                    session.execute(insert(PaperEvent), rows)
+                    session.commit()
+            except Exception as e:
+                logger.error("Failed to write %d paper events: %s", len(rows), e)
+
+
+_writer = _PaperWriter()
+
+
+def flush() -> None:
+    """Write all queued paper events now (also runs at interpreter exit)."""
+    _writer.flush()
+
+
+atexit.register(flush)
+
+
 def create_paper_run(
     symbols: list[str],
     timeframe: str,
@@ -38,9 +135,7 @@ def create_paper_run(
     Returns:
         The ID of the created PaperRun
     """
-    engine = get_engine(db_url)
-    
-    with Session(engine) as session:
+    with _session(db_url) as session:
         run = PaperRun(
             symbols=json.dumps(symbols),
             timeframe=timeframe,
@@ -62,9 +157,10 @@ def update_paper_run(
     db_url: Optional[str] = None,
 ) -> None:
     """Update a paper run's status or final equity."""
-    engine = get_engine(db_url)
-    
-    with Session(engine) as session:
+    if status in ("stopped", "error"):
+        # A finished run's event log is complete once it is marked ended
+        flush()
+    with _session(db_url) as session:
         run = session.get(PaperRun, run_id)
         if run:
             if status:
@@ -72,7 +168,7 @@ def update_paper_run(
             if final_equity is not None:
                 run.final_equity = final_equity
             if status in ("stopped", "error"):
-                run.ended_at = datetime.utcnow()
+                run.ended_at = _utcnow()
             session.commit()
 
 
@@ -85,10 +181,15 @@ def log_event(
     strategy: Optional[str] = None,
     extra: Optional[dict] = None,
     db_url: Optional[str] = None,
-) -> int:
+) -> str:
     """
     Log an event during paper trading.
 
+    The database row is queued and written in batches by a background
+    thread; call flush() to wait for it. Its row id is not known until
+    then, so the event gets a UUID up front, stored in json_blob as
+    ``event_id``.
+
     Args:
         run_id: Paper run ID
         event_type: Type of event (SIGNAL, REJECT, FILL, etc.)
@@ -100,23 +201,19 @@ def log_event(
         db_url: Database URL override
 
     Returns:
-        The event ID
+        The event's UUID (hex)
     """
-    engine = get_engine(db_url)
-    
-    with Session(engine) as session:
-        event = PaperEvent(
-            run_id=run_id,
-            level=level,
-            symbol=symbol,
-            strategy=strategy,
-            event_type=event_type,
-            message=message,
-            json_blob=json.dumps(extra) if extra else None,
-        )
-        session.add(event)
-        session.commit()
-        event_id = event.id
+    event_id = uuid.uuid4().hex
+    _writer.put(get_db_url(db_url), {
+        "run_id": run_id,
+        "ts": _utcnow(),
+        "level": level,
+        "symbol": symbol,
+        "strategy": strategy,
+        "event_type": event_type,
+        "message": message,
+        "json_blob": json.dumps({**(extra or {}), "event_id": event_id}),
+    })
     
     # Also log to console
     log_msg = f"[{event_type}] {symbol or ''} {strategy or ''}: {message}"
@@ -126,7 +223,7 @@ def log_event(
         logger.warning(log_msg)
     else:
         logger.info(log_msg)
-    
+
     return event_id
 
 
@@ -164,9 +261,7 @@ def log_trade(
     Returns:
         The trade ID
     """
-    engine = get_engine(db_url)
-    
-    with Session(engine) as session:
+    with _session(db_url) as session:
         trade = PaperTrade(
             run_id=run_id,
             symbol=symbol,
@@ -191,21 +286,17 @@ def log_trade(
 
 def get_run_trades(run_id: int, db_url: Optional[str] = None) -> list[dict]:
     """Get all trades for a paper run."""
-    engine = get_engine(db_url)
-    
-    with Session(engine) as session:
-        trades = session.query(PaperTrade).filter(PaperTrade.run_id == run_id).all()
-        return [
-            {
-                "id": t.id,
-                "ts": t.ts,
-                "symbol": t.symbol,
-                "strategy": t.strategy,
-                "side": t.side,
-                "qty": t.qty,
-                "price": t.price,
-                "fill_price": t.fill_price,
-                "fees": t.fees,
-            }
-            for t in trades
-        ]
+    stmt = select(
+        PaperTrade.id,
+        PaperTrade.ts,
+        PaperTrade.symbol,
+        PaperTrade.strategy,
+        PaperTrade.side,
+        PaperTrade.qty,
+        PaperTrade.price,
+        PaperTrade.fill_price,
+        PaperTrade.fees,
+    ).where(PaperTrade.run_id == run_id)
+    with _session(db_url) as session:
+        # Plain column rows - no ORM instances to build and track
+        return [row._asdict() for row in session.execute(stmt)]
@@ -3,22 +3,81 @@ Portfolio: Paper trading portfolio tracker.
 
 Manages cash, positions, and equity calculations for the paper trading simulator.
 Simulates order execution with slippage and commission.
+
+Open positions are stored column-wise (one NumPy array per field) so
+mark-to-market and stop/TP checks run as array operations rather than a
+Python loop over position objects. With numba installed those two run as
+compiled kernels instead.
 """
 
 import logging
-from dataclasses import dataclass, field
-from datetime import datetime
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from enum import IntEnum
 from typing import Optional
 
+import numpy as np
+
+from ._njit import NUMBA_AVAILABLE, njit
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+class Side(IntEnum):
+    """Position side, valued as the sign applied to price moves."""
+    LONG = 1
+    SHORT = -1
+
+
+# Initial slot count of the position arrays (doubled when full)
+_INITIAL_SLOTS = 8
+
+# Below this many open positions, a plain loop beats NumPy's per-call
+# overhead for stop/TP checks
+VECTOR_MIN_POSITIONS = 64
+
+
+def _utc_from_ns(ns: int) -> datetime:
+    """Naive UTC datetime (as datetime.utcnow() gives) for a time_ns() stamp."""
+    return datetime.fromtimestamp(ns / 1e9, timezone.utc).replace(tzinfo=None)
+
+
+@njit(cache=True)
+def _unrealized_pnl(sizes, signs, entries, prices):
+    """Sum of size * sign * (price - entry), skipping NaN prices."""
+    total = 0.0
+    for i in range(prices.size):
+        price = prices[i]
+        if price == price:  # NaN: no price, marked at entry
+            total += sizes[i] * signs[i] * (price - entries[i])
+    return total
+
+
+@njit(cache=True)
+def _stop_tp_codes(signs, prices, stops, tps):
+    """Per position: 0 no exit, 1 stop loss hit, 2 take profit hit."""
+    codes = np.zeros(prices.size, np.int8)
+    for i in range(prices.size):
+        # NaN (no price, or no stop/tp) fails both comparisons
+        if signs[i] * (prices[i] - stops[i]) <= 0:
+            codes[i] = 1
+        elif signs[i] * (prices[i] - tps[i]) >= 0:
+            codes[i] = 2
+    return codes
+
+
+@dataclass(slots=True)
 class Position:
-    """Represents an open position."""
+    """
+    Represents an open position.
+
+    Returned by Portfolio as a snapshot of its arrays; changing it does not
+    change the portfolio.
+    """
     id: int
     symbol: str
-    side: str  # "LONG" or "SHORT"
+    side: str  # "LONG" or "SHORT" (Side member name)
     size: float
     entry_price: float
     stop: Optional[float] = None
@@ -53,10 +112,129 @@ class Portfolio:
         self.initial_cash = initial_cash
         self.commission = commission
         self.slippage_bps = slippage_bps
-        self.positions: dict[str, Position] = {}
         self._next_position_id = 1
         self.trade_history: list[dict] = []
 
+        # Bumped on every open/close; invalidates the get_equity memo
+        self._trade_version = 0
+        self._equity_memo: Optional[tuple[int, tuple, float]] = None
+
+        # Open positions, one slot per position: symbol -> slot index, and
+        # per-slot columns. Slots [0, len(_symbols)) are live; closing swaps
+        # the last slot into the freed one.
+        self._sym_index: dict[str, int] = {}
+        self._symbols: list[str] = []
+        self._entry_ns: list[int] = []   # time.time_ns() at entry
+        self._strategy: list[Optional[str]] = []
+        self._id = np.zeros(_INITIAL_SLOTS, dtype=np.int64)
+        self._size = np.zeros(_INITIAL_SLOTS)
+        self._entry = np.zeros(_INITIAL_SLOTS)
+        self._stop = np.full(_INITIAL_SLOTS, np.nan)   # NaN: no stop
+        self._tp = np.full(_INITIAL_SLOTS, np.nan)     # NaN: no take profit
+        self._side_sign = np.zeros(_INITIAL_SLOTS)     # Side value per slot
+
+    # ------------------------------------------------------------------
+    # Position storage
+    # ------------------------------------------------------------------
+
+    def _add_position(
+        self,
+        symbol: str,
+        side: Side,
+        size: float,
+        entry_price: float,
+        stop: Optional[float],
+        tp: Optional[float],
+        strategy: Optional[str],
+    ) -> int:
+        """Store a new position in the next free slot; returns its id."""
+        slot = len(self._symbols)
+        if slot == len(self._size):
+            grow = slot or _INITIAL_SLOTS
+            self._id = np.concatenate([self._id, np.zeros(grow, dtype=np.int64)])
+            self._size = np.concatenate([self._size, np.zeros(grow)])
+            self._entry = np.concatenate([self._entry, np.zeros(grow)])
+            self._stop = np.concatenate([self._stop, np.full(grow, np.nan)])
+            self._tp = np.concatenate([self._tp, np.full(grow, np.nan)])
+            self._side_sign = np.concatenate([self._side_sign, np.zeros(grow)])
+
+        position_id = self._next_position_id
+        self._next_position_id += 1
+
+        self._sym_index[symbol] = slot
+        self._symbols.append(symbol)
+        self._entry_ns.append(time.time_ns())
+        self._strategy.append(strategy)
+        self._id[slot] = position_id
+        self._size[slot] = size
+        self._entry[slot] = entry_price
+        # A zero stop/tp means "none", as it always has
+        self._stop[slot] = stop if stop else np.nan
+        self._tp[slot] = tp if tp else np.nan
+        self._side_sign[slot] = side
+        self._trade_version += 1
+        return position_id
+
+    def _remove_position(self, symbol: str) -> None:
+        """Free a symbol's slot by moving the last live slot into it."""
+        slot = self._sym_index.pop(symbol)
+        last = len(self._symbols) - 1
+        if slot != last:
+            moved = self._symbols[last]
+            self._sym_index[moved] = slot
+            self._symbols[slot] = moved
+            self._entry_ns[slot] = self._entry_ns[last]
+            self._strategy[slot] = self._strategy[last]
+            for arr in (self._id, self._size, self._entry, self._stop,
+                        self._tp, self._side_sign):
+                arr[slot] = arr[last]
+        self._symbols.pop()
+        self._entry_ns.pop()
+        self._strategy.pop()
+        self._stop[last] = np.nan
+        self._tp[last] = np.nan
+        self._trade_version += 1
+
+    def _position_at(self, slot: int) -> Position:
+        stop = self._stop[slot]
+        tp = self._tp[slot]
+        return Position(
+            id=int(self._id[slot]),
+            symbol=self._symbols[slot],
+            side=Side(int(self._side_sign[slot])).name,
+            size=float(self._size[slot]),
+            entry_price=float(self._entry[slot]),
+            stop=None if np.isnan(stop) else float(stop),
+            tp=None if np.isnan(tp) else float(tp),
+            entry_time=_utc_from_ns(self._entry_ns[slot]),
+            strategy=self._strategy[slot],
+        )
+
+    @property
+    def positions(self) -> dict[str, Position]:
+        """Open positions by symbol, in the order they were opened (snapshots)."""
+        slots = sorted(self._sym_index.values(), key=self._id.__getitem__)
+        return {self._symbols[i]: self._position_at(i) for i in slots}
+
+    def _prices(self, current_prices: dict[str, float]) -> np.ndarray:
+        """Price per live slot, NaN where ``current_prices`` has none."""
+        n = len(self._symbols)
+        get = current_prices.get
+        return np.fromiter(
+            (get(sym, np.nan) for sym in self._symbols), np.float64, n
+        )
+
+    @property
+    def slippage_bps(self) -> float:
+        return self._slippage_bps
+
+    @slippage_bps.setter
+    def slippage_bps(self, bps: float) -> None:
+        self._slippage_bps = bps
+        slippage_pct = bps / 10000.0
+        # Fill price multipliers: buyers pay more, sellers receive less
+        self._slip = {"BUY": 1 + slippage_pct, "SELL": 1 - slippage_pct}
+
     def _apply_slippage(self, price: float, side: str) -> float:
         """
         Apply slippage to execution price.
@@ -68,15 +246,7 @@ class Portfolio:
         Returns:
             Adjusted price with slippage
         """
-        slippage_pct = self.slippage_bps / 10000.0
-        if side == "BUY":
-            return price * (1 + slippage_pct)  # Pay more
-        else:
-            return price * (1 - slippage_pct)  # Receive less
-
-    def _calculate_fees(self, notional: float) -> float:
-        """Calculate commission fees for a trade."""
-        return notional * self.commission
+        return price * self._slip[side]
 
     def get_equity(self, current_prices: dict[str, float]) -> float:
         """
@@ -87,30 +257,46 @@ class Portfolio:
 
         Returns:
             Total portfolio equity
+
+        The unrealized part is memoized on the open positions' prices until
+        the next open or close, so repeated calls on an unchanged tick skip
+        the PnL computation (updating the dict in place is fine).
         """
-        equity = self.cash
-        
-        for symbol, pos in self.positions.items():
-            price = current_prices.get(symbol, pos.entry_price)
-            
-            if pos.side == "LONG":
-                # Long position value = size * (current - entry)
-                unrealized_pnl = pos.size * (price - pos.entry_price)
-            else:
-                # Short position value = size * (entry - current)
-                unrealized_pnl = pos.size * (pos.entry_price - price)
-            
-            equity += unrealized_pnl
-        
-        return equity
+        # Comparing the open symbols' prices is far cheaper than the PnL pass
+        key = tuple(map(current_prices.get, self._symbols))
+        if self._equity_memo is not None:
+            version, prices_seen, unrealized = self._equity_memo
+            if version == self._trade_version and prices_seen == key:
+                return self.cash + unrealized
+
+        unrealized = self._unrealized(current_prices)
+        self._equity_memo = (self._trade_version, key, unrealized)
+        return self.cash + unrealized
+
+    def _unrealized(self, current_prices: dict[str, float]) -> float:
+        n = len(self._symbols)
+        if n == 0:
+            return 0.0
+
+        prices = self._prices(current_prices)
+        if NUMBA_AVAILABLE:
+            return _unrealized_pnl(
+                self._size[:n], self._side_sign[:n], self._entry[:n], prices
+            )
+
+        # size * (current - entry), sign-flipped for shorts; positions
+        # without a price are marked at entry (zero unrealized PnL)
+        unrealized = self._size[:n] * self._side_sign[:n] * (prices - self._entry[:n])
+        return float(np.nansum(unrealized))
 
     def has_position(self, symbol: str) -> bool:
         """Check if there's an open position for a symbol."""
-        return symbol in self.positions
+        return symbol in self._sym_index
 
     def get_position(self, symbol: str) -> Optional[Position]:
         """Get the current position for a symbol."""
-        return self.positions.get(symbol)
+        slot = self._sym_index.get(symbol)
+        return self._position_at(slot) if slot is not None else None
 
     def open_long(
         self,
@@ -135,7 +321,7 @@ class Portfolio:
         Returns:
             Tuple of (fill_price, fees, slippage)
         """
-        if symbol in self.positions:
+        if symbol in self._sym_index:
             raise ValueError(f"Position already exists for {symbol}")
         
         # Apply slippage
@@ -144,7 +330,7 @@ class Portfolio:
         
         # Calculate cost and fees
         notional = size * fill_price
-        fees = self._calculate_fees(notional)
+        fees = notional * self.commission
         total_cost = notional + fees
         
         if total_cost > self.cash:
@@ -154,20 +340,7 @@ class Portfolio:
         self.cash -= total_cost
         
         # Create position
-        position_id = self._next_position_id
-        self._next_position_id += 1
-        
-        self.positions[symbol] = Position(
-            id=position_id,
-            symbol=symbol,
-            side="LONG",
-            size=size,
-            entry_price=fill_price,
-            stop=stop,
-            tp=tp,
-            entry_time=datetime.utcnow(),
-            strategy=strategy,
-        )
+        self._add_position(symbol, Side.LONG, size, fill_price, stop, tp, strategy)
         
         logger.info(f"Opened LONG {size:.6f} {symbol} @ ${fill_price:.2f} (fees: ${fees:.4f})")
         
@@ -184,12 +357,13 @@ class Portfolio:
         Returns:
             Tuple of (fill_price, pnl, fees, slippage)
         """
-        if symbol not in self.positions:
+        slot = self._sym_index.get(symbol)
+        if slot is None:
             raise ValueError(f"No position exists for {symbol}")
         
-        pos = self.positions[symbol]
-        if pos.side != "LONG":
+        if self._side_sign[slot] != Side.LONG:
             raise ValueError(f"Position for {symbol} is not LONG")
+        pos = self._position_at(slot)
         
         # Apply slippage (selling)
         fill_price = self._apply_slippage(price, "SELL")
@@ -197,7 +371,7 @@ class Portfolio:
         
         # Calculate proceeds
         notional = pos.size * fill_price
-        fees = self._calculate_fees(notional)
+        fees = notional * self.commission
         proceeds = notional - fees
         
         # Calculate PnL
@@ -221,7 +395,7 @@ class Portfolio:
         })
         
         # Remove position
-        del self.positions[symbol]
+        self._remove_position(symbol)
         
         logger.info(f"Closed LONG {pos.size:.6f} {symbol} @ ${fill_price:.2f} (PnL: ${pnl:.2f})")
         
@@ -250,7 +424,7 @@ class Portfolio:
         Returns:
             Tuple of (fill_price, fees, slippage)
         """
-        if symbol in self.positions:
+        if symbol in self._sym_index:
             raise ValueError(f"Position already exists for {symbol}")
         
         # Apply slippage (selling to open short)
@@ -259,26 +433,13 @@ class Portfolio:
         
         # For shorts, we receive cash (margin not simulated in simple model)
         notional = size * fill_price
-        fees = self._calculate_fees(notional)
+        fees = notional * self.commission
         
         # Deduct fees from cash (margin requirement simplified)
         self.cash -= fees
         
         # Create position
-        position_id = self._next_position_id
-        self._next_position_id += 1
-        
-        self.positions[symbol] = Position(
-            id=position_id,
-            symbol=symbol,
-            side="SHORT",
-            size=size,
-            entry_price=fill_price,
-            stop=stop,
-            tp=tp,
-            entry_time=datetime.utcnow(),
-            strategy=strategy,
-        )
+        self._add_position(symbol, Side.SHORT, size, fill_price, stop, tp, strategy)
         
         logger.info(f"Opened SHORT {size:.6f} {symbol} @ ${fill_price:.2f} (fees: ${fees:.4f})")
         
@@ -295,12 +456,13 @@ class Portfolio:
         Returns:
             Tuple of (fill_price, pnl, fees, slippage)
         """
-        if symbol not in self.positions:
+        slot = self._sym_index.get(symbol)
+        if slot is None:
             raise ValueError(f"No position exists for {symbol}")
         
-        pos = self.positions[symbol]
-        if pos.side != "SHORT":
+        if self._side_sign[slot] != Side.SHORT:
             raise ValueError(f"Position for {symbol} is not SHORT")
+        pos = self._position_at(slot)
         
         # Apply slippage (buying to close)
         fill_price = self._apply_slippage(price, "BUY")
@@ -308,7 +470,7 @@ class Portfolio:
         
         # Calculate cost to close
         notional = pos.size * fill_price
-        fees = self._calculate_fees(notional)
+        fees = notional * self.commission
         
         # Calculate PnL (for short: profit when price goes down)
         entry_proceeds = pos.size * pos.entry_price
@@ -332,7 +494,7 @@ class Portfolio:
         })
         
         # Remove position
-        del self.positions[symbol]
+        self._remove_position(symbol)
         
         logger.info(f"Closed SHORT {pos.size:.6f} {symbol} @ ${fill_price:.2f} (PnL: ${pnl:.2f})")
         
@@ -348,25 +510,59 @@ class Portfolio:
         Returns:
             List of positions that should be closed
         """
-        to_close = []
-        
-        for symbol, pos in list(self.positions.items()):
-            price = current_prices.get(symbol)
+        n = len(self._symbols)
+        if n == 0:
+            return []
+        if n < VECTOR_MIN_POSITIONS:
+            return self._check_stops_and_tps_loop(current_prices)
+
+        sign = self._side_sign[:n]
+        prices = self._prices(current_prices)
+        if NUMBA_AVAILABLE:
+            codes = _stop_tp_codes(sign, prices, self._stop[:n], self._tp[:n])
+            hit_stop = codes == 1
+            hits = np.flatnonzero(codes)
+        else:
+            # Signed distance: positive when price moved in the position's
+            # favour. NaN (no price, or no stop/tp) fails both comparisons.
+            hit_stop = sign * (prices - self._stop[:n]) <= 0
+            hit_tp = ~hit_stop & (sign * (prices - self._tp[:n]) >= 0)
+            hits = np.flatnonzero(hit_stop | hit_tp)
+        # Report in the order positions were opened
+        hits = hits[np.argsort(self._id[hits])]
+        return [
+            {
+                "symbol": self._symbols[i],
+                "reason": "stop_loss" if hit_stop[i] else "take_profit",
+                "price": current_prices[self._symbols[i]],
+            }
+            for i in hits
+        ]
+
+    def _check_stops_and_tps_loop(self, current_prices: dict[str, float]) -> list[dict]:
+        """check_stops_and_tps for small portfolios, one position at a time."""
+        n = len(self._symbols)
+        get = current_prices.get
+        hits = []
+        for symbol, position_id, sign, stop, tp in zip(
+            self._symbols,
+            self._id[:n].tolist(),
+            self._side_sign[:n].tolist(),
+            self._stop[:n].tolist(),
+            self._tp[:n].tolist(),
+        ):
+            price = get(symbol)
             if price is None:
                 continue
-            
-            if pos.side == "LONG":
-                if pos.stop and price <= pos.stop:
-                    to_close.append({"symbol": symbol, "reason": "stop_loss", "price": price})
-                elif pos.tp and price >= pos.tp:
-                    to_close.append({"symbol": symbol, "reason": "take_profit", "price": price})
-            else:  # SHORT
-                if pos.stop and price >= pos.stop:
-                    to_close.append({"symbol": symbol, "reason": "stop_loss", "price": price})
-                elif pos.tp and price <= pos.tp:
-                    to_close.append({"symbol": symbol, "reason": "take_profit", "price": price})
-        
-        return to_close
+            if sign * (price - stop) <= 0:
+                reason = "stop_loss"
+            elif sign * (price - tp) >= 0:
+                reason = "take_profit"
+            else:
+                continue
+            hits.append((position_id, {"symbol": symbol, "reason": reason, "price": price}))
+        hits.sort(key=lambda hit: hit[0])
+        return [hit for _, hit in hits]
 
     def get_status(self, current_prices: dict[str, float]) -> dict:
         """Get current portfolio status."""
@@ -376,6 +572,6 @@ class Portfolio:
             "equity": equity,
             "initial_cash": self.initial_cash,
             "return_pct": (equity - self.initial_cash) / self.initial_cash * 100,
-            "open_positions": len(self.positions),
+            "open_positions": len(self._symbols),
             "total_trades": len(self.trade_history),
         }
@@ -28,8 +28,14 @@ class RateLimiter:
         limiter.acquire(weight=1)
         response = exchange.some_api_call()
 
-    The limiter tracks timestamps and blocks (sleeps) if the bucket
-    is exhausted within the current window.
+        # Or take the non-blocking fast path first:
+        if not limiter.try_acquire(weight=1):
+            limiter.acquire(weight=1)
+
+    The bucket holds up to ``max_requests`` tokens and refills at
+    ``max_requests / window_seconds`` tokens per second. ``acquire``
+    takes its tokens immediately, going into debt if needed, and then
+    sleeps (outside the lock) until the debt is repaid.
     """
 
     def __init__(
@@ -41,15 +47,24 @@ class RateLimiter:
         """
         Args:
             max_requests: Total request budget per window.
-            window_seconds: Sliding window size in seconds.
+            window_seconds: Time for an empty bucket to refill completely.
             safety_margin: Use only this fraction of max_requests (default 90%)
                            to leave headroom for unexpected bursts.
         """
         self.max_requests = int(max_requests * safety_margin)
         self.window_seconds = window_seconds
-        self._timestamps: list[float] = []
+        self.capacity = float(self.max_requests)
+        self.rate = self.max_requests / window_seconds  # tokens per second
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
         self._lock = threading.Lock()
 
+    def _refill(self, now: float) -> None:
+        """Credit tokens earned since the last refill. Caller holds the lock."""
+        elapsed = max(0.0, now - self._last_refill)
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._last_refill = now
+
     def acquire(self, weight: int = 1) -> float:
         """
         Acquire ``weight`` tokens from the bucket. Blocks if exhausted.
@@ -61,54 +76,58 @@ class RateLimiter:
         Returns:
             Time spent waiting (seconds). 0.0 if no wait was needed.
         """
-        wait_total = 0.0
-
-        for _ in range(weight):
-            with self._lock:
-                now = time.monotonic()
-                # Purge timestamps outside the window
-                cutoff = now - self.window_seconds
-                self._timestamps = [t for t in self._timestamps if t > cutoff]
-
-                if len(self._timestamps) >= self.max_requests:
-                    # Need to wait until the oldest timestamp expires
-                    oldest = self._timestamps[0]
-                    sleep_time = (oldest + self.window_seconds) - now + 0.01
-                    if sleep_time > 0:
-                        logger.debug(
-                            "Rate limit: sleeping %.2fs (%d/%d used)",
-                            sleep_time,
-                            len(self._timestamps),
-                            self.max_requests,
-                        )
-                        wait_total += sleep_time
-                        time.sleep(sleep_time)
-                        # Re-purge after sleep
-                        now = time.monotonic()
-                        cutoff = now - self.window_seconds
-                        self._timestamps = [
-                            t for t in self._timestamps if t > cutoff
-                        ]
-
-                self._timestamps.append(time.monotonic())
-
-        return wait_total
+        with self._lock:
+            self._refill(time.monotonic())
+            # Reserve now; later callers queue behind the debt
+            self._tokens -= weight
+            deficit = -self._tokens
+
+        if deficit <= 0:
+            return 0.0
+
+        sleep_time = deficit / self.rate
+        logger.debug(
+            "Rate limit: sleeping %.2fs (%.0f tokens short of %d)",
+            sleep_time,
+            deficit,
+            self.max_requests,
+        )
+        time.sleep(sleep_time)
+        return sleep_time
+
+    def try_acquire(self, weight: int = 1) -> bool:
+        """
+        Take ``weight`` tokens only if they are all available right now.
+
+        Never sleeps: the whole weight is checked and deducted under a
+        single lock acquisition. Callers fall back to ``acquire`` when
+        this returns False.
+
+        Returns:
+            True if the tokens were taken, False if the bucket is too empty.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens < weight:
+                return False
+            self._tokens -= weight
+            return True
 
     @property
     def available(self) -> int:
         """Number of tokens currently available."""
         with self._lock:
-            cutoff = time.monotonic() - self.window_seconds
-            active = sum(1 for t in self._timestamps if t > cutoff)
-            return max(0, self.max_requests - active)
+            self._refill(time.monotonic())
+            return max(0, int(self._tokens))
 
     @property
     def usage_pct(self) -> float:
         """Current usage as a percentage of capacity."""
         with self._lock:
-            cutoff = time.monotonic() - self.window_seconds
-            active = sum(1 for t in self._timestamps if t > cutoff)
-            return active / self.max_requests if self.max_requests > 0 else 0.0
+            self._refill(time.monotonic())
+            if self.capacity <= 0:
+                return 0.0
+            return 1.0 - self._tokens / self.capacity
 
     def get_status(self) -> dict:
         """Get rate limiter status."""
@@ -12,6 +12,7 @@ Reference: doc/research_images/image12.png (Regime Classification Table)
 
 from __future__ import annotations
 
+import functools
 import logging
 from dataclasses import dataclass
 from enum import Enum
@@ -20,6 +21,8 @@ from typing import Optional
 import numpy as np
 import pandas as pd
 
+from ._njit import NUMBA_AVAILABLE, njit
+
 logger = logging.getLogger(__name__)
 
 
@@ -81,6 +84,82 @@ class RegimeState:
 # Hurst Exponent (Rescaled Range method)
 # ---------------------------------------------------------------------------
 
+@njit(cache=True)
+def _rs(returns, start, size):
+    """
+    R/S of ``returns[start:start + size]`` in two passes, no allocation.
+
+    Returns NaN for a chunk without variance.
+    """
+    total = 0.0
+    for i in range(start, start + size):
+        total += returns[i]
+    mean = total / size
+
+    # Cumulative deviation range and sum of squares in one pass
+    cs = 0.0
+    cmin = 0.0
+    cmax = 0.0
+    ss = 0.0
+    for i in range(start, start + size):
+        d = returns[i] - mean
+        cs += d
+        if cs < cmin:
+            cmin = cs
+        if cs > cmax:
+            cmax = cs
+        ss += d * d
+    s = np.sqrt(ss / (size - 1))
+    if s <= 1e-12:
+        return np.nan
+    return (cmax - cmin) / s
+
+
+@njit(cache=True)
+def _hurst_rs(returns, sizes):
+    """Mean R/S over the chunks of each size (NaN if no chunk has variance)."""
+    out = np.full(sizes.size, np.nan)
+    for k in range(sizes.size):
+        size = sizes[k]
+        total = 0.0
+        count = 0
+        for i in range(returns.size // size):
+            rs = _rs(returns, i * size, size)
+            if rs == rs:  # skip NaN
+                total += rs
+                count += 1
+        if count > 0:
+            out[k] = total / count
+    return out
+
+
+def _hurst_rs_numpy(returns: np.ndarray, sizes: np.ndarray) -> np.ndarray:
+    """_hurst_rs without numba: all chunks of one size per array pass."""
+    out = np.full(sizes.size, np.nan)
+    for k, size in enumerate(sizes):
+        n_chunks = len(returns) // size
+        # One row per chunk: R/S for all chunks of this size at once
+        chunks = returns[: n_chunks * size].reshape(n_chunks, size)
+        centred = chunks - chunks.mean(axis=1, keepdims=True)
+        deviate = np.cumsum(centred, axis=1)
+        r = deviate.max(axis=1) - deviate.min(axis=1)
+        s = chunks.std(axis=1, ddof=1)
+        valid = s > 1e-12
+        if valid.any():
+            out[k] = np.mean(r[valid] / s[valid])
+    return out
+
+
+@functools.lru_cache(maxsize=8)
+def _hurst_grid(n_returns: int) -> tuple[np.ndarray, np.ndarray]:
+    """Chunk sizes for ``n_returns`` returns and their logs (read-only)."""
+    sizes = np.arange(10, min(n_returns // 2, 50) + 1, 2)
+    log_sizes = np.log(sizes.astype(np.float64))
+    sizes.flags.writeable = False
+    log_sizes.flags.writeable = False
+    return sizes, log_sizes
+
+
 def compute_hurst(series: pd.Series, window: int = 100) -> float:
     """
     Compute the Hurst Exponent using the Rescaled Range (R/S) method.
@@ -96,7 +175,13 @@ def compute_hurst(series: pd.Series, window: int = 100) -> float:
     Returns:
         Hurst exponent as a float, or 0.5 on failure.
     """
-    ts = series.dropna().values[-window:]
+    # Only the last ``window`` valid bars are used: slice before dropping
+    # NaNs, and only fall back to a full dropna() if the tail has gaps
+    tail = series.iloc[-window:].to_numpy(dtype=np.float64, na_value=np.nan)
+    if np.isnan(tail).any():
+        ts = series.dropna().to_numpy(dtype=np.float64)[-window:]
+    else:
+        ts = tail
     if len(ts) < 20:
         logger.warning("Insufficient data for Hurst (%d bars)", len(ts))
         return 0.5  # assume random walk when data is scarce
@@ -107,41 +192,24 @@ def compute_hurst(series: pd.Series, window: int = 100) -> float:
         return 0.5
 
     # Divide into sub-series of different sizes
-    max_k = min(len(returns) // 2, 50)
-    sizes = []
-    rs_values = []
+    sizes, log_sizes = _hurst_grid(len(returns))
+    if NUMBA_AVAILABLE:
+        rs_values = _hurst_rs(returns, sizes)
+    else:
+        rs_values = _hurst_rs_numpy(returns, sizes)
 
-    for size in range(10, max_k + 1, 2):
-        n_chunks = len(returns) // size
-        if n_chunks < 1:
-            continue
-
-        rs_chunk = []
-        for i in range(n_chunks):
-            chunk = returns[i * size : (i + 1) * size]
-            mean_chunk = np.mean(chunk)
-            deviate = np.cumsum(chunk - mean_chunk)
-            r = np.max(deviate) - np.min(deviate)
-            s = np.std(chunk, ddof=1)
-            if s > 1e-12:
-                rs_chunk.append(r / s)
-
-        if rs_chunk:
-            sizes.append(size)
-            rs_values.append(np.mean(rs_chunk))
-
-    if len(sizes) < 3:
+    # Drop sizes where no chunk had any variance
+    valid = ~np.isnan(rs_values)
+    if np.count_nonzero(valid) < 3:
         return 0.5
 
     # Linear regression of log(R/S) on log(size) → slope = Hurst exponent
-    log_sizes = np.log(sizes)
-    log_rs = np.log(rs_values)
-
-    try:
-        coeffs = np.polyfit(log_sizes, log_rs, 1)
-        hurst = float(coeffs[0])
-    except (np.linalg.LinAlgError, ValueError):
-        return 0.5
+    # (closed-form least squares; the sizes are distinct, so the
+    # denominator is positive)
+    x = log_sizes[valid]
+    y = np.log(rs_values[valid])
+    dx = x - x.mean()
+    hurst = float((dx * (y - y.mean())).sum() / (dx * dx).sum())
 
     # Clamp to [0, 1]
     return float(np.clip(hurst, 0.0, 1.0))
@@ -151,6 +219,95 @@ def compute_hurst(series: pd.Series, window: int = 100) -> float:
 # ADX (Average Directional Index)
 # ---------------------------------------------------------------------------
 
+@njit(cache=True)
+def _ewm_update(weighted, old_wt, nobs, j, cur, alpha):
+    """
+    Feed ``cur`` into smoother ``j``; return its output (NaN before ``nobs``
+    reaches the period).
+
+    One step of pandas' ``ewm(alpha=..., adjust=False)`` recursion,
+    including its NaN handling (``ignore_na=False``).
+    """
+    is_obs = cur == cur
+    if is_obs:
+        nobs[j] += 1
+    w = weighted[j]
+    if w == w:
+        old_wt[j] *= 1.0 - alpha
+        if is_obs:
+            if w != cur:
+                # pandas special-cases com == 1 (alpha 0.5), as in
+                # indicator_kernels.ema
+                new_wt = 1.0 - old_wt[j] if alpha == 0.5 else alpha
+                weighted[j] = (old_wt[j] * w + new_wt * cur) / (old_wt[j] + new_wt)
+            old_wt[j] = 1.0
+    elif is_obs:
+        weighted[j] = cur
+    return weighted[j]
+
+
+@njit(cache=True)
+def _div(a, b):
+    """a / b with NumPy semantics (inf or NaN instead of an exception)."""
+    if b == 0.0:
+        if a == 0.0 or a != a:
+            return np.nan
+        return np.inf if a > 0.0 else -np.inf
+    return a / b
+
+
+@njit(cache=True)
+def _adx(high, low, close, period):
+    """
+    Latest ADX in one pass, matching the pandas formulation.
+
+    TR, +DM and -DM are computed bar by bar and fed through Wilder
+    smoothers (``ewm(alpha=1/period, min_periods=period, adjust=False)``)
+    held as scalar state; DX is smoothed the same way. Returns NaN if no
+    ADX value is ever defined.
+    """
+    alpha = 1.0 / period
+    # Smoother state: 0 = TR, 1 = +DM, 2 = -DM, 3 = DX
+    weighted = np.full(4, np.nan)
+    old_wt = np.ones(4)
+    nobs = np.zeros(4, np.int64)
+    latest = np.nan
+
+    for i in range(close.size):
+        tr = high[i] - low[i]
+        plus_dm = 0.0
+        minus_dm = 0.0
+        if i > 0:
+            # Row-wise max skipping NaN, as DataFrame.max(axis=1) does
+            for v in (abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1])):
+                if tr != tr or v > tr:
+                    tr = v
+            up_move = high[i] - high[i - 1]
+            down_move = low[i - 1] - low[i]
+            if up_move > down_move and up_move > 0:
+                plus_dm = up_move
+            if down_move > up_move and down_move > 0:
+                minus_dm = down_move
+
+        atr = _ewm_update(weighted, old_wt, nobs, 0, tr, alpha)
+        smooth_plus = _ewm_update(weighted, old_wt, nobs, 1, plus_dm, alpha)
+        smooth_minus = _ewm_update(weighted, old_wt, nobs, 2, minus_dm, alpha)
+        ready = nobs[0] >= period and nobs[1] >= period and nobs[2] >= period
+
+        dx = np.nan
+        if ready:
+            plus_di = 100.0 * _div(smooth_plus, atr)
+            minus_di = 100.0 * _div(smooth_minus, atr)
+            total = plus_di + minus_di
+            if total != 0.0:
+                dx = 100.0 * _div(abs(plus_di - minus_di), total)
+
+        adx = _ewm_update(weighted, old_wt, nobs, 3, dx, alpha)
+        if nobs[3] >= period and adx == adx:
+            latest = adx
+    return latest
+
+
 def compute_adx(
     high: pd.Series,
     low: pd.Series,
@@ -175,49 +332,109 @@ def compute_adx(
     if len(close) < period + 1:
         return 0.0
 
-    # True Range
-    prev_close = close.shift(1)
-    tr1 = high - low
-    tr2 = (high - prev_close).abs()
-    tr3 = (low - prev_close).abs()
-    tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+    h = high.to_numpy(np.float64)
+    l = low.to_numpy(np.float64)
+    c = close.to_numpy(np.float64)
+    if NUMBA_AVAILABLE:
+        adx = _adx(h, l, c, period)
+        return float(adx) if adx == adx else 0.0
+
+    # True Range (fmax skips NaN, like a row-wise max)
+    prev_close = np.concatenate(([np.nan], c[:-1]))
+    tr = np.fmax(h - l, np.fmax(np.abs(h - prev_close), np.abs(l - prev_close)))
 
     # Directional Movement
-    up_move = high - high.shift(1)
-    down_move = low.shift(1) - low
+    up_move = np.concatenate(([np.nan], np.diff(h)))
+    down_move = np.concatenate(([np.nan], -np.diff(l)))
     plus_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0.0)
     minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0.0)
 
-    plus_dm = pd.Series(plus_dm, index=close.index)
-    minus_dm = pd.Series(minus_dm, index=close.index)
-
-    # Smoothed using Wilder's method (EMA with alpha=1/period)
-    atr = tr.ewm(alpha=1 / period, min_periods=period, adjust=False).mean()
-    smooth_plus = plus_dm.ewm(alpha=1 / period, min_periods=period, adjust=False).mean()
-    smooth_minus = minus_dm.ewm(alpha=1 / period, min_periods=period, adjust=False).mean()
-
-    # Directional Indicators
-    plus_di = 100 * smooth_plus / atr
-    minus_di = 100 * smooth_minus / atr
-
-    # DX and ADX
-    dx = 100 * (plus_di - minus_di).abs() / (plus_di + minus_di).replace(0, np.nan)
-    adx = dx.ewm(alpha=1 / period, min_periods=period, adjust=False).mean()
-
-    latest = adx.dropna()
-    if latest.empty:
+    # Smoothed using Wilder's method (EMA with alpha=1/period), all three
+    # in one ewm call
+    smoothed = pd.DataFrame({"tr": tr, "plus": plus_dm, "minus": minus_dm}).ewm(
+        alpha=1 / period, min_periods=period, adjust=False
+    ).mean().to_numpy()
+    atr, smooth_plus, smooth_minus = smoothed.T
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Directional Indicators
+        plus_di = 100 * smooth_plus / atr
+        minus_di = 100 * smooth_minus / atr
+
+        # DX and ADX
+        total = plus_di + minus_di
+        total[total == 0] = np.nan
+        dx = 100 * np.abs(plus_di - minus_di) / total
+    adx = pd.Series(dx).ewm(alpha=1 / period, min_periods=period, adjust=False).mean()
+
+    latest = adx.to_numpy()
+    latest = latest[~np.isnan(latest)]
+    if latest.size == 0:
         return 0.0
-    return float(latest.iloc[-1])
+    return float(latest[-1])
 
 
 # ---------------------------------------------------------------------------
 # Regime classifier
 # ---------------------------------------------------------------------------
 
+# Research thresholds as bins (NaN lands in bin 1, i.e. random walk):
+#   Hurst: 0 = H < 0.45, 1 = 0.45 ≤ H ≤ 0.55, 2 = 0.55 < H ≤ 0.60, 3 = H > 0.60
+#   ADX:   0 = ADX < 20, 1 = ADX == 20,       2 = 20 < ADX ≤ 25,   3 = ADX > 25
+def _hurst_bin(hurst: float) -> int:
+    return 1 + (hurst > 0.55) + (hurst > 0.60) - (hurst < 0.45)
+
+
+def _adx_bin(adx: float) -> int:
+    return 1 + (adx > 20) + (adx > 25) - (adx < 20)
+
+
+_RW = Regime.RANDOM_WALK
+# _REGIME_TABLE[hurst_bin][adx_bin]
+_REGIME_TABLE: tuple[tuple[Regime, ...], ...] = (
+    (Regime.MEAN_REVERTING, _RW, _RW, _RW),
+    (_RW, _RW, _RW, _RW),
+    (_RW, _RW, Regime.TRENDING_WEAK, Regime.TRENDING_WEAK),
+    (_RW, _RW, Regime.TRENDING_WEAK, Regime.TRENDING_STRONG),
+)
+
+# Confidence: how far into the zone (normalised); (hurst, adx) -> 0.0–1.0
+_REGIME_CONFIDENCE = {
+    Regime.TRENDING_STRONG:
+        lambda h, a: min(1.0, (h - 0.60) / 0.15 * 0.5 + (a - 25) / 25 * 0.5),
+    Regime.TRENDING_WEAK:
+        lambda h, a: min(1.0, (h - 0.55) / 0.10 * 0.5 + (a - 20) / 10 * 0.5),
+    Regime.MEAN_REVERTING:
+        lambda h, a: min(1.0, (0.45 - h) / 0.15 * 0.5 + (20 - a) / 20 * 0.5),
+    # In the ambiguous zone → low confidence
+    Regime.RANDOM_WALK:
+        lambda h, a: max(0.0, 1.0 - abs(h - 0.50) / 0.10),
+}
+
+
+# Last classification per symbol: symbol -> (bar key, state)
+_REGIME_CACHE: dict[str, tuple[tuple, RegimeState]] = {}
+
+
+def clear_regime_cache() -> None:
+    """Forget cached classify_regime results."""
+    _REGIME_CACHE.clear()
+
+
+def _bar_key(df: pd.DataFrame, hurst_window: int, adx_period: int) -> tuple:
+    """Identifies the latest bar; changes on a new bar or a revised last bar."""
+    last = df[["high", "low", "close"]].iloc[-1]
+    return (
+        len(df), df.index[-1], float(last["high"]), float(last["low"]),
+        float(last["close"]), hurst_window, adx_period,
+    )
+
+
 def classify_regime(
     df: pd.DataFrame,
     hurst_window: int = 100,
     adx_period: int = 14,
+    symbol: Optional[str] = None,
 ) -> RegimeState:
     """
     Classify the current market regime for a symbol.
@@ -229,28 +446,24 @@ def classify_regime(
         df: OHLCV DataFrame (must contain 'high', 'low', 'close' columns).
         hurst_window: Window for Hurst Exponent (default 100).
         adx_period: Period for ADX (default 14).
+        symbol: If given, the result is cached for the symbol and reused
+            until the latest bar changes.
 
     Returns:
         RegimeState with the detected regime and supporting metrics.
     """
+    if symbol is not None and len(df):
+        key = _bar_key(df, hurst_window, adx_period)
+        cached = _REGIME_CACHE.get(symbol)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
     hurst = compute_hurst(df["close"], window=hurst_window)
     adx = compute_adx(df["high"], df["low"], df["close"], period=adx_period)
 
     # Classify using the research-defined thresholds
-    if hurst > 0.60 and adx > 25:
-        regime = Regime.TRENDING_STRONG
-        # Confidence: how far into the zone (normalised)
-        confidence = min(1.0, (hurst - 0.60) / 0.15 * 0.5 + (adx - 25) / 25 * 0.5)
-    elif hurst > 0.55 and adx > 20:
-        regime = Regime.TRENDING_WEAK
-        confidence = min(1.0, (hurst - 0.55) / 0.10 * 0.5 + (adx - 20) / 10 * 0.5)
-    elif hurst < 0.45 and adx < 20:
-        regime = Regime.MEAN_REVERTING
-        confidence = min(1.0, (0.45 - hurst) / 0.15 * 0.5 + (20 - adx) / 20 * 0.5)
-    else:
-        regime = Regime.RANDOM_WALK
-        # In the ambiguous zone → low confidence
-        confidence = max(0.0, 1.0 - abs(hurst - 0.50) / 0.10)
+    regime = _REGIME_TABLE[_hurst_bin(hurst)][_adx_bin(adx)]
+    confidence = _REGIME_CONFIDENCE[regime](hurst, adx)
 
     state = RegimeState(
         regime=regime,
@@ -265,4 +478,6 @@ def classify_regime(
         "Regime detected: %s  (H=%.3f, ADX=%.1f, conf=%.2f)",
         regime.value, hurst, adx, confidence,
     )
+    if symbol is not None and len(df):
+        _REGIME_CACHE[symbol] = (key, state)
     return state
@@ -103,8 +103,17 @@ class RiskManager:
         self.consecutive_losses = 0
         self.last_reset_date: Optional[datetime] = None
 
-        # Trade history for rolling Kelly computation
+        # Trade history for logging/status
         self.trade_history: list[dict] = []  # [{pnl, pnl_pct, symbol, ts}]
+        # PnL of the last kelly_lookback trades (ring buffer) for Kelly
+        self._pnl_buf = np.zeros(max(1, kelly_lookback))
+        self._pnl_head = 0  # next slot to write
+        self._pnl_len = 0   # filled slots
+        # Running win/loss counts and sums over the ring's contents
+        self._n_win = 0
+        self._sum_win = 0.0
+        self._n_loss = 0
+        self._sum_loss = 0.0  # of abs(pnl)
         
     def update_equity(self, equity: float) -> None:
         """Update current equity and peak."""
@@ -190,19 +199,15 @@ class RiskManager:
         Returns:
             Kelly-adjusted fraction, or None if insufficient history.
         """
-        recent = self.trade_history[-self.kelly_lookback:]
-        if len(recent) < 10:  # need minimum 10 trades
+        if self._pnl_len < 10:  # need minimum 10 trades
             return None
 
-        wins = [t["pnl"] for t in recent if t["pnl"] > 0]
-        losses = [abs(t["pnl"]) for t in recent if t["pnl"] < 0]
-
-        if not wins or not losses:
+        if not self._n_win or not self._n_loss:
             return None
 
-        win_rate = len(wins) / len(recent)
-        avg_win = np.mean(wins)
-        avg_loss = np.mean(losses)
+        win_rate = self._n_win / self._pnl_len
+        avg_win = self._sum_win / self._n_win
+        avg_loss = self._sum_loss / self._n_loss
 
         if avg_win <= 0:
             return None
@@ -252,19 +257,26 @@ class RiskManager:
             return 1.0
 
         # Compute pairwise correlations
-        syms = list(returns.keys())
+        series = list(returns.values())
         max_corr = 0.0
-        for i in range(len(syms)):
-            for j in range(i + 1, len(syms)):
-                min_len = min(len(returns[syms[i]]), len(returns[syms[j]]))
-                if min_len < 5:
-                    continue
-                corr = np.corrcoef(
-                    returns[syms[i]][-min_len:],
-                    returns[syms[j]][-min_len:],
-                )[0, 1]
-                if not np.isnan(corr):
-                    max_corr = max(max_corr, abs(corr))
+        if len({len(r) for r in series}) == 1:
+            # Equal lengths (the usual case): one correlation matrix
+            if len(series[0]) >= 5:
+                corr = np.corrcoef(np.vstack(series))
+                pairs = np.abs(corr[np.triu_indices(len(series), k=1)])
+                pairs = pairs[~np.isnan(pairs)]
+                if pairs.size:
+                    max_corr = float(pairs.max())
+        else:
+            # Each pair over its common tail
+            for i in range(len(series)):
+                for j in range(i + 1, len(series)):
+                    min_len = min(len(series[i]), len(series[j]))
+                    if min_len < 5:
+                        continue
+                    corr = np.corrcoef(series[i][-min_len:], series[j][-min_len:])[0, 1]
+                    if not np.isnan(corr):
+                        max_corr = max(max_corr, abs(corr))
 
         if max_corr > self.correlation_threshold:
             # Linearly reduce from 1.0 at threshold to 0.5 at correlation=1.0
@@ -380,6 +392,37 @@ class RiskManager:
         self.open_positions += 1
         logger.debug(f"Position opened. Open positions: {self.open_positions}")
 
+    def _tally(self, pnl: float, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) a PnL from the win/loss sums."""
+        if pnl > 0:
+            self._n_win += sign
+            self._sum_win += sign * pnl
+        elif pnl < 0:
+            self._n_loss += sign
+            self._sum_loss -= sign * pnl
+
+    def _push_pnl(self, pnl: float) -> None:
+        """Record a PnL in the Kelly window, evicting the oldest when full."""
+        size = self._pnl_buf.size
+        head = self._pnl_head
+        if self._pnl_len == size:
+            self._tally(float(self._pnl_buf[head]), -1)
+        else:
+            self._pnl_len += 1
+        self._pnl_buf[head] = pnl
+        self._tally(pnl, 1)
+        self._pnl_head = (head + 1) % size
+        if self._pnl_head == 0:
+            # Re-sum once per lap so add/subtract rounding cannot drift
+            self._resum()
+
+    def _resum(self) -> None:
+        recent = self._pnl_buf[:self._pnl_len]
+        wins = recent[recent > 0]
+        losses = recent[recent < 0]
+        self._n_win, self._sum_win = wins.size, float(wins.sum())
+        self._n_loss, self._sum_loss = losses.size, float(-losses.sum())
+
     def register_trade_close(
         self, pnl: float, symbol: str = "UNKNOWN", pnl_pct: Optional[float] = None
     ) -> None:
@@ -405,6 +448,7 @@ class RiskManager:
         # Keep only the rolling window
         if len(self.trade_history) > self.kelly_lookback * 2:
             self.trade_history = self.trade_history[-self.kelly_lookback:]
+        self._push_pnl(pnl)
 
         if pnl >= 0:
             self.consecutive_losses = 0
@@ -68,6 +68,11 @@ def init_db(db_url: Optional[str] = None):
     
     engine = create_engine(url, echo=False)
     Base.metadata.create_all(engine)
+    # create_all skips tables that already exist, indexes included, so
+    # indexes added to a model later have to be created one by one
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
     
     logger.info("Database tables created successfully")
     return engine
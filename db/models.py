@@ -259,11 +259,37 @@ class LiveOrder(Base):
     __table_args__ = (
         Index("ix_live_orders_status", "status"),
         Index("ix_live_orders_symbol", "symbol", "status"),
+        # Reconciliation scans "actionable orders, oldest first"
+        Index("ix_live_orders_status_created", "status", "created_at"),
     )
 
     def __repr__(self) -> str:
         return f"<LiveOrder {self.client_order_id} {self.side} {self.symbol} [{self.status}]>"
 
+    @classmethod
+    def upsert_stmt(cls, values: list[dict]):
+        """
+        Create SQLite INSERT ... ON CONFLICT DO UPDATE statement.
+
+        Args:
+            values: List of dicts with live order data
+
+        Returns:
+            SQLAlchemy insert statement with on_conflict_do_update
+        """
+        from sqlalchemy.dialects.sqlite import insert
+
+        stmt = insert(cls).values(values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["client_order_id"],
+            set_={
+                col: stmt.excluded[col]
+                for col in values[0]
+                if col not in ("client_order_id", "created_at")
+            },
+        )
+        return stmt
+
 
 class CircuitBreakerState(Base):
     """
@@ -11,6 +11,7 @@ from datetime import datetime
 from typing import Any, Optional
 
 import pandas as pd
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from .init_db import get_engine
@@ -19,34 +20,15 @@ from .models import BacktestRun, BacktestTrade
 logger = logging.getLogger(__name__)
 
 
-def save_backtest_to_db(
+def _run_record(
     stats: Any,
-    trades_df: pd.DataFrame,
     symbol: str,
     timeframe: str,
     strategy_name: str,
     initial_cash: float,
-    exchange: str = "kraken",
-    db_url: Optional[str] = None,
-) -> int:
-    """
-    Save a backtest run and its trades to the database.
-
-    Args:
-        stats: Backtesting.py stats Series
-        trades_df: DataFrame of trades from bt._trades
-        symbol: Trading pair (e.g., "BTC/USDT")
-        timeframe: Candle timeframe (e.g., "4h")
-        strategy_name: Name of the strategy
-        initial_cash: Starting capital
-        exchange: Exchange name
-        db_url: Database URL override
-
-    Returns:
-        The ID of the saved BacktestRun
-    """
-    engine = get_engine(db_url)
-    
+    exchange: str,
+) -> BacktestRun:
+    """Build the BacktestRun row for a Backtesting.py stats Series."""
     # Extract key stats
     final_equity = float(stats["Equity Final [$]"]) if not pd.isna(stats["Equity Final [$]"]) else initial_cash
     max_drawdown = float(stats["Max. Drawdown [%]"]) if not pd.isna(stats["Max. Drawdown [%]"]) else 0.0
@@ -71,46 +53,129 @@ def save_backtest_to_db(
             stats_dict[key] = str(val)
     
     stats_json = json.dumps(stats_dict, default=str)
+
+    return BacktestRun(
+        exchange=exchange,
+        symbol=symbol,
+        timeframe=timeframe,
+        strategy_name=strategy_name,
+        initial_cash=initial_cash,
+        final_equity=final_equity,
+        max_drawdown_pct=max_drawdown,
+        sharpe_ratio=sharpe,
+        trades_count=trades_count,
+        stats_json=stats_json,
+    )
+
+
+def _trade_rows(
+    trades_df: Optional[pd.DataFrame], run_id: int, symbol: str, strategy_name: str
+) -> list[dict]:
+    """BacktestTrade column values for each row of a Backtesting.py trades frame."""
+    rows = []
+    if trades_df is None or trades_df.empty:
+        return rows
+    for _, trade in trades_df.iterrows():
+        # Backtesting.py trade columns: Size, EntryBar, ExitBar, EntryPrice, ExitPrice,
+        # PnL, ReturnPct, EntryTime, ExitTime, Duration
+        rows.append({
+            "backtest_run_id": run_id,
+            "symbol": symbol,
+            "strategy_name": strategy_name,
+            "side": "LONG" if trade.get("Size", 0) > 0 else "SHORT",
+            "size": abs(float(trade.get("Size", 0))),
+            "entry_ts": pd.to_datetime(trade.get("EntryTime")),
+            "exit_ts": pd.to_datetime(trade.get("ExitTime")) if trade.get("ExitTime") is not None else None,
+            "entry_price": float(trade.get("EntryPrice", 0)),
+            "exit_price": float(trade.get("ExitPrice", 0)) if trade.get("ExitPrice") is not None else None,
+            "pnl": float(trade.get("PnL", 0)) if trade.get("PnL") is not None else None,
+            "pnl_pct": float(trade.get("ReturnPct", 0)) * 100 if trade.get("ReturnPct") is not None else None,
+        })
+    return rows
+
+
+def save_backtest_to_db(
+    stats: Any,
+    trades_df: Optional[pd.DataFrame],
+    symbol: str,
+    timeframe: str,
+    strategy_name: str,
+    initial_cash: float,
+    exchange: str = "kraken",
+    db_url: Optional[str] = None,
+) -> int:
+    """
+    Save a backtest run and its trades to the database.
+
+    Args:
+        stats: Backtesting.py stats Series
+        trades_df: DataFrame of trades from bt._trades, or None for no trades
+        symbol: Trading pair (e.g., "BTC/USDT")
+        timeframe: Candle timeframe (e.g., "4h")
+        strategy_name: Name of the strategy
+        initial_cash: Starting capital
+        exchange: Exchange name
+        db_url: Database URL override
+
+    Returns:
+        The ID of the saved BacktestRun
+    """
+    return save_backtest_batch(
+        [{
+            "stats": stats,
+            "trades_df": trades_df,
+            "symbol": symbol,
+            "timeframe": timeframe,
+            "strategy_name": strategy_name,
+            "initial_cash": initial_cash,
+            "exchange": exchange,
+        }],
+        db_url=db_url,
+    )[0]
+
+
+def save_backtest_batch(runs: list[dict], db_url: Optional[str] = None) -> list[int]:
+    """
+    Save several backtest runs and their trades in one transaction.
+
+    Args:
+        runs: One dict per run, holding save_backtest_to_db's arguments
+            (stats, trades_df, symbol, timeframe, strategy_name,
+            initial_cash and optionally exchange)
+        db_url: Database URL override
+
+    Returns:
+        The IDs of the saved BacktestRuns, in the order of ``runs``
+    """
+    if not runs:
+        return []
+    engine = get_engine(db_url)
     
     with Session(engine) as session:
-        # Create run record
-        run = BacktestRun(
-            exchange=exchange,
-            symbol=symbol,
-            timeframe=timeframe,
-            strategy_name=strategy_name,
-            initial_cash=initial_cash,
-            final_equity=final_equity,
-            max_drawdown_pct=max_drawdown,
-            sharpe_ratio=sharpe,
-            trades_count=trades_count,
-            stats_json=stats_json,
-        )
-        session.add(run)
-        session.flush()  # Get the run ID
-        run_id = run.id
+        records = [
+            _run_record(
+                r["stats"], r["symbol"], r["timeframe"], r["strategy_name"],
+                r["initial_cash"], r.get("exchange", "kraken"),
+            )
+            for r in runs
+        ]
+        session.add_all(records)
+        session.flush()  # Get the run IDs
         
         # Save trades
-        if not trades_df.empty:
-            for _, trade in trades_df.iterrows():
-                # Backtesting.py trade columns: Size, EntryBar, ExitBar, EntryPrice, ExitPrice,
-                # PnL, ReturnPct, EntryTime, ExitTime, Duration
-                trade_record = BacktestTrade(
-                    backtest_run_id=run_id,
-                    symbol=symbol,
-                    strategy_name=strategy_name,
-                    side="LONG" if trade.get("Size", 0) > 0 else "SHORT",
-                    size=abs(float(trade.get("Size", 0))),
-                    entry_ts=pd.to_datetime(trade.get("EntryTime")),
-                    exit_ts=pd.to_datetime(trade.get("ExitTime")) if trade.get("ExitTime") is not None else None,
-                    entry_price=float(trade.get("EntryPrice", 0)),
-                    exit_price=float(trade.get("ExitPrice", 0)) if trade.get("ExitPrice") is not None else None,
-                    pnl=float(trade.get("PnL", 0)) if trade.get("PnL") is not None else None,
-                    pnl_pct=float(trade.get("ReturnPct", 0)) * 100 if trade.get("ReturnPct") is not None else None,
-                )
-                session.add(trade_record)
+        trade_rows = []
+        for r, record in zip(runs, records):
+            trade_rows.extend(
+                _trade_rows(r["trades_df"], record.id, r["symbol"], r["strategy_name"])
+            )
+        if trade_rows:
+            session.execute(insert(BacktestTrade), trade_rows)
         
+        run_ids = [record.id for record in records]
+        trade_counts = [record.trades_count for record in records]
         session.commit()
-        logger.info(f"Saved backtest run #{run_id}: {strategy_name} on {symbol} ({trades_count} trades)")
     
-    return run_id
+    for r, run_id, trades_count in zip(runs, run_ids, trade_counts):
+        logger.info(f"Saved backtest run #{run_id}: {r['strategy_name']} on {r['symbol']} ({trades_count} trades)")
+    
+    return run_ids
@@ -8,6 +8,14 @@ to ensure consistent indicator calculations.
 import numpy as np
 import pandas as pd
 
+from core import indicator_kernels as kernels
+from core._njit import NUMBA_AVAILABLE
+
+
+def _kernel_series(like: pd.Series, values: np.ndarray) -> pd.Series:
+    """Wrap a kernel result as a Series aligned with ``like``."""
+    return pd.Series(values, index=like.index)
+
 
 def EMA(arr: pd.Series, period: int) -> pd.Series:
     """
@@ -20,7 +28,10 @@ def EMA(arr: pd.Series, period: int) -> pd.Series:
     Returns:
         EMA series
     """
-    return pd.Series(arr).ewm(span=period, adjust=False).mean()
+    arr = pd.Series(arr)
+    if NUMBA_AVAILABLE:
+        return _kernel_series(arr, kernels.ema(arr.to_numpy(np.float64), period))
+    return arr.ewm(span=period, adjust=False).mean()
 
 
 def SMA(arr: pd.Series, period: int) -> pd.Series:
@@ -68,6 +79,14 @@ def ATR(high: pd.Series, low: pd.Series, close: pd.Series, period: int) -> pd.Se
     low = pd.Series(low)
     close = pd.Series(close)
     
+    if NUMBA_AVAILABLE:
+        return _kernel_series(close, kernels.atr(
+            high.to_numpy(np.float64),
+            low.to_numpy(np.float64),
+            close.to_numpy(np.float64),
+            period,
+        ))
+    
     tr1 = high - low
     tr2 = abs(high - close.shift(1))
     tr3 = abs(low - close.shift(1))
@@ -217,6 +236,9 @@ def RSI(close: pd.Series, period: int = 14) -> pd.Series:
         RSI series (0-100)
     """
     close = pd.Series(close)
+    if NUMBA_AVAILABLE:
+        return _kernel_series(close, kernels.rsi(close.to_numpy(np.float64), period))
+    
     delta = close.diff()
     
     gain = delta.where(delta > 0, 0.0)
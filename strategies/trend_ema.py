@@ -14,25 +14,18 @@ import pandas as pd
 from backtesting import Strategy
 from backtesting.lib import crossover
 
+from . import indicators
 from .base import BaseStrategy, StrategySignal
 
 
 def EMA(arr: pd.Series, n: int) -> pd.Series:
     """Exponential Moving Average."""
-    return pd.Series(arr).ewm(span=n, adjust=False).mean()
+    return indicators.EMA(arr, n)
 
 
 def ATR(high: pd.Series, low: pd.Series, close: pd.Series, n: int) -> pd.Series:
     """Average True Range."""
-    high = pd.Series(high)
-    low = pd.Series(low)
-    close = pd.Series(close)
-    
-    tr1 = high - low
-    tr2 = abs(high - close.shift(1))
-    tr3 = abs(low - close.shift(1))
-    tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-    return tr.rolling(n).mean()
+    return indicators.ATR(high, low, close, n)
 
 
 class TrendEmaBacktest(Strategy):
@@ -0,0 +1,201 @@
+"""
+Tests for core/backtester.py — OHLCV preparation for Backtesting.py.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.backtester import prepare_ohlcv_for_backtesting
+
+
+def _make_ohlcv(n: int = 5, tz: str = "UTC") -> pd.DataFrame:
+    idx = pd.date_range("2024-01-01", periods=n, freq="4h", tz=tz)
+    close = np.linspace(100.0, 104.0, n)
+    return pd.DataFrame(
+        {
+            "open": close - 0.5,
+            "high": close + 1.0,
+            "low": close - 1.0,
+            "close": close,
+            "volume": np.full(n, 10.0),
+        },
+        index=idx,
+    )
+
+
+class TestPrepareOhlcv:
+    def test_columns_capitalized(self):
+        out = prepare_ohlcv_for_backtesting(_make_ohlcv())
+        assert list(out.columns) == ["Open", "High", "Low", "Close", "Volume"]
+
+    def test_extra_columns_dropped(self):
+        df = _make_ohlcv()
+        df["trades"] = 3
+        out = prepare_ohlcv_for_backtesting(df)
+        assert list(out.columns) == ["Open", "High", "Low", "Close", "Volume"]
+        assert "trades" in df.columns
+
+    def test_timezone_stripped(self):
+        out = prepare_ohlcv_for_backtesting(_make_ohlcv())
+        assert out.index.tz is None
+
+    def test_input_not_modified(self):
+        df = _make_ohlcv()
+        prepare_ohlcv_for_backtesting(df)
+        assert list(df.columns) == ["open", "high", "low", "close", "volume"]
+        assert df.index.tz is not None
+
+    def test_repeat_prepare_is_cached(self):
+        df = _make_ohlcv()
+        first = prepare_ohlcv_for_backtesting(df)
+        assert prepare_ohlcv_for_backtesting(df) is first
+        # A different dtype or a different frame is prepared afresh
+        assert prepare_ohlcv_for_backtesting(df, dtype=np.float32) is not first
+        assert prepare_ohlcv_for_backtesting(_make_ohlcv()) is not first
+
+    def test_cache_entry_dropped_with_input(self):
+        from core import backtester
+
+        df = _make_ohlcv()
+        prepare_ohlcv_for_backtesting(df)
+        key = id(df)
+        assert key in backtester._prep_cache
+        del df
+        assert key not in backtester._prep_cache
+
+    def test_requires_datetime_index(self):
+        df = _make_ohlcv().reset_index(drop=True)
+        with pytest.raises(ValueError):
+            prepare_ohlcv_for_backtesting(df)
+
+
+class TestStrategyRegistry:
+    def test_get_strategy_imports_class(self):
+        from core.backtester import _get_strategy
+        from strategies.trend_ema import TrendEmaBacktest
+
+        assert _get_strategy("TREND_EMA") is TrendEmaBacktest
+
+    def test_all_registered_strategies_resolve(self):
+        from core.backtester import _STRATEGY_PATHS, _get_strategy
+
+        for name in _STRATEGY_PATHS:
+            assert isinstance(_get_strategy(name), type)
+
+    def test_unknown_strategy(self):
+        from core.backtester import _get_strategy
+
+        with pytest.raises(ValueError, match="Unknown strategy"):
+            _get_strategy("NOPE")
+
+
+class TestParallelBacktests:
+    def test_runs_each_config_in_order(self, monkeypatch):
+        import core.backtester as backtester
+
+        calls = []
+
+        def fake_load(symbol, timeframe, limit, use_sql, db_url):
+            calls.append(symbol)
+            return prepare_ohlcv_for_backtesting(_make_ohlcv(n=200))
+
+        monkeypatch.setattr(backtester, "_load_ohlcv", fake_load)
+        backtester.clear_ohlcv_cache()
+        configs = [
+            {"strategy_name": "trend_ema", "symbol": "BTC/USDT"},
+            {"strategy_name": "MR_BB", "symbol": "BTC/USDT", "cash": 5000.0},
+        ]
+        results = backtester.run_backtests_parallel(configs, max_workers=2)
+
+        # Data fetched once for the shared symbol
+        assert calls == ["BTC/USDT"]
+        assert len(results) == 2
+        assert results[0][0]["_strategy"].__class__.__name__ == "TrendEmaBacktest"
+        assert results[1][0]["Equity Final [$]"] == pytest.approx(5000.0, rel=0.5)
+        backtester.clear_ohlcv_cache()
+
+    def test_unknown_strategy_rejected_before_fetch(self):
+        import core.backtester as backtester
+
+        with pytest.raises(ValueError):
+            backtester.run_backtests_parallel([{"strategy_name": "NOPE", "symbol": "X"}])
+
+
+class TestOhlcvCache:
+    def test_fetch_cached_until_cleared(self, monkeypatch):
+        import core.backtester as backtester
+
+        calls = []
+
+        def fake_load(symbol, timeframe, limit, use_sql, db_url):
+            calls.append((symbol, timeframe, limit))
+            return prepare_ohlcv_for_backtesting(_make_ohlcv(n=200))
+
+        monkeypatch.setattr(backtester, "_load_ohlcv", fake_load)
+        backtester.clear_ohlcv_cache()
+        try:
+            backtester.run_single_backtest("TREND_EMA", "BTC/USDT", limit=200)
+            backtester.run_single_backtest("MR_BB", "BTC/USDT", limit=200)
+            assert len(calls) == 1
+
+            backtester.clear_ohlcv_cache()
+            backtester.run_single_backtest("TREND_EMA", "BTC/USDT", limit=200)
+            assert len(calls) == 2
+        finally:
+            backtester.clear_ohlcv_cache()
+
+
+class TestConfiguredStrategy:
+    def test_class_cached_per_params(self):
+        from core.backtester import _configured_strategy
+        from strategies.trend_ema import TrendEmaBacktest
+
+        a = _configured_strategy(TrendEmaBacktest, "ConfiguredTrendEma", (("ema_fast", 10),))
+        b = _configured_strategy(TrendEmaBacktest, "ConfiguredTrendEma", (("ema_fast", 10),))
+        c = _configured_strategy(TrendEmaBacktest, "ConfiguredTrendEma", (("ema_fast", 12),))
+        assert a is b
+        assert a is not c
+        assert issubclass(a, TrendEmaBacktest)
+        assert a.ema_fast == 10 and c.ema_fast == 12
+
+
+class TestFloat32Ohlcv:
+    def test_dtype_applied(self):
+        out = prepare_ohlcv_for_backtesting(_make_ohlcv(), dtype=np.float32)
+        assert (out.dtypes == np.float32).all()
+
+    def test_stats_match_float64(self):
+        from backtesting.lib import FractionalBacktest
+        from strategies.trend_ema import TrendEmaBacktest
+
+        rng = np.random.default_rng(42)
+        n = 500
+        close = 30000.0 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+        idx = pd.date_range("2024-01-01", periods=n, freq="4h", tz="UTC")
+        raw = pd.DataFrame(
+            {
+                "open": close * (1 + rng.normal(0, 0.001, n)),
+                "high": close * 1.005,
+                "low": close * 0.995,
+                "close": close,
+                "volume": rng.uniform(1, 10, n),
+            },
+            index=idx,
+        )
+
+        results = {}
+        for dtype in (np.float64, np.float32):
+            bt = FractionalBacktest(
+                prepare_ohlcv_for_backtesting(raw, dtype=dtype),
+                TrendEmaBacktest,
+                cash=10000.0,
+                commission=0.0005,
+                exclusive_orders=True,
+            )
+            results[dtype] = bt.run()
+
+        assert results[np.float32]["# Trades"] == results[np.float64]["# Trades"]
+        assert results[np.float32]["Return [%]"] == pytest.approx(
+            results[np.float64]["Return [%]"], abs=0.05
+        )
@@ -35,6 +35,13 @@ class TestAssetLevelBreaker:
         assert not allowed
         assert "Circuit breaker active" in reason
 
+    def test_trip_is_per_symbol(self):
+        cb = CircuitBreaker(asset_drop_pct=0.15, flash_crash_pct=0.99)
+        cb.record_price("BTC/USDT", 100.0)
+        cb.check("BTC/USDT", 84.0)  # triggers trip on BTC only
+        allowed, _ = cb.check("ETH/USDT", 3000.0)
+        assert allowed
+
 
 class TestPortfolioKillSwitch:
     def test_no_kill_within_threshold(self):
@@ -58,6 +65,25 @@ class TestPortfolioKillSwitch:
         allowed, reason = cb.check("ETH/USDT", 3000.0, portfolio_value=8900)
         assert not allowed
 
+    def test_active_kill_switch_skips_detection(self):
+        cb = CircuitBreaker(portfolio_kill_pct=0.10)
+        cb.reset_daily(10000.0)
+        cb.check("BTC/USDT", 100.0, portfolio_value=8900)  # triggers
+        for _ in range(5):
+            allowed, reason = cb.check("BTC/USDT", 100.0, portfolio_value=8000)
+            assert not allowed
+            assert "Circuit breaker active" in reason
+        # No duplicate trips while the kill switch is in force
+        assert len(cb.get_active_trips()) == 1
+
+    def test_global_trip_keeps_longest(self):
+        cb = CircuitBreaker(consecutive_loss_limit=1, consecutive_cooldown_minutes=30)
+        cb.reset_daily(10000.0)
+        cb.check("BTC/USDT", 100.0, portfolio_value=8900)  # 24h portfolio trip
+        cb.register_trade_result(-10.0)  # 30m consecutive trip
+        assert cb._global_trip.breaker_type == "portfolio"
+        assert len(cb.get_active_trips()) == 2
+
 
 class TestConsecutiveLossBreaker:
     def test_no_trip_below_limit(self):
@@ -93,6 +119,13 @@ class TestFlashCrashDetector:
         allowed, reason = cb.check("BTC/USDT", 97.0)  # 3% move
         assert allowed
 
+    def test_uses_explicit_timestamps(self):
+        cb = CircuitBreaker(flash_crash_pct=0.05, flash_crash_window_seconds=60, asset_drop_pct=0.99)
+        cb.record_price("BTC/USDT", 100.0, now=time.time() - 120)
+        # The only other tick is outside the 60s window
+        allowed, _ = cb.check("BTC/USDT", 90.0)
+        assert allowed
+
     def test_trip_on_flash_crash(self):
         cb = CircuitBreaker(flash_crash_pct=0.05, flash_crash_window_seconds=60, asset_drop_pct=0.99)
         cb.record_price("BTC/USDT", 100.0)
@@ -122,6 +155,19 @@ class TestBreakerTrip:
         )
         assert not trip.is_active
 
+    def test_trip_uses_monotonic_deadline(self):
+        now = datetime.now(timezone.utc)
+        trip = BreakerTrip(
+            breaker_type="test",
+            symbol=None,
+            triggered_at=now,
+            expires_at=now + timedelta(hours=1),
+            reason="monotonic",
+            expires_mono=time.monotonic() - 1.0,
+        )
+        # The monotonic deadline wins over the wall-clock expiry
+        assert not trip.is_active
+
 
 class TestBreakerStatus:
     def test_get_status(self):
@@ -130,6 +176,102 @@ class TestBreakerStatus:
         assert "active_trips" in status
         assert "consecutive_losses" in status
 
+    def test_expired_trips_pruned_on_check(self):
+        cb = CircuitBreaker()
+        cb._add_trip("asset", "ETH/USDT", timedelta(hours=1), "old")
+        cb._trips[0].expires_mono = time.monotonic() - 1.0
+        cb.check("BTC/USDT", 100.0)
+        assert len(cb._trips) == 0
+
+    def test_trip_records_bounded(self):
+        from core.circuit_breaker import _MAX_TRIPS
+
+        cb = CircuitBreaker()
+        for i in range(_MAX_TRIPS + 5):
+            cb._add_trip("flash", f"SYM{i}", timedelta(minutes=15), "test")
+        assert len(cb._trips) == _MAX_TRIPS
+
     def test_get_active_trips_empty(self):
         cb = CircuitBreaker()
         assert len(cb.get_active_trips()) == 0
+
+
+class TestPriceHistory:
+    def test_history_grows_past_capacity(self):
+        from core.circuit_breaker import _HISTORY_CAPACITY
+
+        cb = CircuitBreaker()
+        for _ in range(_HISTORY_CAPACITY + 10):
+            cb.record_price("BTC/USDT", 100.0)
+        assert len(cb._price_history["BTC/USDT"]) == _HISTORY_CAPACITY + 10
+
+    def test_prune_advances_head(self):
+        from core.circuit_breaker import PriceRing
+
+        ring = PriceRing.empty(capacity=8)
+        for ts in range(20):
+            ring.append(float(ts), 100.0, keep_after=ts - 3.0)
+        # Only ticks newer than ts - 3 survive; compaction kept capacity at 8
+        assert list(ring.t[ring.head:ring.tail]) == [17.0, 18.0, 19.0]
+        assert ring.cap == 8
+
+    def test_window_queries(self):
+        from core.circuit_breaker import PriceRing
+
+        ring = PriceRing.empty(capacity=8)
+        for ts, price in enumerate([120.0, 100.0, 110.0, 105.0], start=1):
+            ring.append(float(ts), price, keep_after=0.0)
+        assert ring.window_high(0.0) == 120.0
+        assert ring.window_high(1.5) == 110.0
+        assert ring.p[ring.flash_start(1.5)] == 100.0
+        assert ring.flash_start(10.0) == ring.tail
+        assert ring.window_high(10.0) == 0.0
+
+    def test_running_max_matches_rescan(self):
+        import numpy as np
+        from core.circuit_breaker import PriceRing
+
+        rng = np.random.default_rng(0)
+        prices = rng.uniform(50.0, 150.0, 600)
+        ring = PriceRing.empty(capacity=16)
+        window, keep = 20.0, 50.0
+        for ts in range(300):
+            ring.append(float(ts), prices[ts], keep_after=ts - keep)
+            expected = prices[max(0, int(ts - window) + 1):ts + 1].max()
+            assert ring.window_high(ts - window) == expected
+            start = ring.flash_start(ts - window)
+            assert ring.t[start] == max(0, int(ts - window) + 1)
+        # Batches keep the same invariant
+        for ts in range(300, 600, 30):
+            ring.extend(np.arange(ts, ts + 30, dtype=np.float64), prices[ts:ts + 30], ts + 29 - keep)
+            last = ts + 29
+            expected = prices[int(last - window) + 1:last + 1].max()
+            assert ring.window_high(last - window) == expected
+
+    def test_record_prices_batch(self):
+        import numpy as np
+
+        cb = CircuitBreaker(asset_drop_pct=0.15, flash_crash_pct=0.99)
+        now = time.time()
+        ts = now - np.arange(5000, 0, -1, dtype=np.float64)
+        prices = np.full(ts.shape, 100.0)
+        cb.record_prices("BTC/USDT", ts, prices)
+        ring = cb._price_history["BTC/USDT"]
+        assert len(ring) == 5000
+        assert ring.cap >= 5000
+        allowed, reason = cb.check("BTC/USDT", 84.0)
+        assert not allowed
+
+    def test_record_prices_prunes_old_ticks(self):
+        import numpy as np
+
+        cb = CircuitBreaker()
+        now = time.time()
+        cb.record_prices("BTC/USDT", np.array([now - 8000, now - 10]), np.array([1.0, 2.0]))
+        ring = cb._price_history["BTC/USDT"]
+        assert list(ring.p[ring.head:ring.tail]) == [2.0]
+
+    def test_record_prices_shape_mismatch(self):
+        cb = CircuitBreaker()
+        with pytest.raises(ValueError):
+            cb.record_prices("BTC/USDT", [1.0, 2.0], [1.0])
@@ -3,10 +3,11 @@ Tests for core/ensemble.py — regime-aware signal aggregation.
 """
 
 from dataclasses import dataclass, field
+from enum import Enum, StrEnum
 
 import pytest
 
-from core.ensemble import Ensemble, EnsembleSignal
+from core.ensemble import Ensemble, EnsembleSignal, StrategyVote
 from core.regime_detector import Regime, RegimeState
 
 
@@ -21,6 +22,17 @@ class MockSignal:
     extra: dict = field(default_factory=dict)
 
 
+class StrAction(StrEnum):
+    OPEN_LONG = "OPEN_LONG"
+    HOLD = "HOLD"
+
+
+class MixinAction(str, Enum):
+    """str() gives "MixinAction.OPEN_LONG", unlike StrEnum."""
+    OPEN_LONG = "OPEN_LONG"
+    HOLD = "HOLD"
+
+
 def _make_regime(regime: Regime) -> RegimeState:
     return RegimeState(
         regime=regime,
@@ -79,6 +91,19 @@ class TestConsensusRule:
         assert result.action == "HOLD"
         assert result.votes_for == 0
 
+    def test_hold_votes_recorded_without_weight(self):
+        ensemble = Ensemble(consensus_threshold=2)
+        signals = {
+            "trend_ema": MockSignal(action="HOLD"),
+            "supertrend": MockSignal(action="OPEN_LONG"),
+        }
+        result = ensemble.aggregate(signals, _make_regime(Regime.TRENDING_STRONG))
+        assert [v.strategy_name for v in result.strategy_votes] == [
+            "trend_ema", "supertrend",
+        ]
+        assert result.strategy_votes[0].score == 0.0
+        assert result.strategy_votes[1].regime_weight == 1.0
+
 
 class TestConflictResolution:
     def test_buy_vs_sell_conflict_hold(self):
@@ -106,6 +131,20 @@ class TestConflictResolution:
         result = ensemble.aggregate(signals, regime)
         assert result.action == "OPEN_LONG"
 
+    def test_overwhelming_sell_prefers_close_long(self):
+        """Dominant sell side picks CLOSE_LONG over OPEN_SHORT."""
+        ensemble = Ensemble(consensus_threshold=1)
+        signals = {
+            "trend_ema": MockSignal(action="OPEN_LONG", confidence=0.2),
+            "mean_reversion_bb": MockSignal(action="CLOSE_LONG", confidence=0.9),
+            "rsi_divergence": MockSignal(action="OPEN_SHORT", confidence=0.9),
+        }
+        regime = _make_regime(Regime.MEAN_REVERTING)
+        result = ensemble.aggregate(signals, regime)
+        assert result.action == "CLOSE_LONG"
+        assert result.votes_for == 1
+        assert result.votes_total == 3
+
 
 class TestRegimeWeighting:
     def test_trend_strategies_weighted_higher_in_trending(self):
@@ -121,6 +160,47 @@ class TestRegimeWeighting:
         # With threshold=1 and trending regime, trend_ema should pass
         assert result.consensus_met
 
+    def test_zero_affinity_selects_no_action(self):
+        """Votes with zero regime weight never become the best action."""
+        ensemble = Ensemble(consensus_threshold=1)
+        signals = {"trend_ema": MockSignal(action="OPEN_LONG", confidence=0.9)}
+        result = ensemble.aggregate(signals, _make_regime(Regime.RANDOM_WALK))
+        assert result.action == "HOLD"
+        assert result.votes_for == 0
+        assert result.votes_total == 1
+
+    def test_custom_affinity_map(self):
+        ensemble = Ensemble(
+            consensus_threshold=1,
+            affinity_map={Regime.RANDOM_WALK: {"trend_ema": 0.9}},
+        )
+        signals = {
+            "TrendEmaLive": MockSignal(action="OPEN_LONG", confidence=1.0),
+            "unknown": MockSignal(action="HOLD"),
+        }
+        result = ensemble.aggregate(signals, _make_regime(Regime.RANDOM_WALK))
+        assert result.strategy_votes[0].regime_weight == 0.9
+        assert result.strategy_votes[1].regime_weight == 0.0  # HOLD
+        assert result.action == "OPEN_LONG"
+
+    @pytest.mark.parametrize("action_cls", [StrAction, MixinAction])
+    def test_str_subclass_actions_and_names(self, action_cls):
+        class Name(str):
+            pass
+
+        ensemble = Ensemble(
+            consensus_threshold=1,
+            affinity_map={Regime.RANDOM_WALK: {Name("trend_ema"): 0.9}},
+        )
+        signals = {
+            "trend_ema": MockSignal(action=action_cls.OPEN_LONG, confidence=1.0),
+            "supertrend": MockSignal(action=action_cls.HOLD),
+        }
+        result = ensemble.aggregate(signals, _make_regime(Regime.RANDOM_WALK))
+        assert result.action == "OPEN_LONG"
+        assert result.votes_for == 1
+        assert result.strategy_votes[0].regime_weight == 0.9
+
     def test_no_strategies_yields_hold(self):
         ensemble = Ensemble(consensus_threshold=2)
         result = ensemble.aggregate({}, _make_regime(Regime.RANDOM_WALK))
@@ -148,6 +228,33 @@ class TestEnsembleSignalOutput:
         assert "stop" in result.extra
         assert result.extra["stop"] == 49000
 
+    def test_extra_prefers_first_voter(self):
+        ensemble = Ensemble(consensus_threshold=2)
+        signals = {
+            "trend_ema": MockSignal(action="OPEN_LONG", extra={"stop": 49000}),
+            "supertrend": MockSignal(
+                action="OPEN_LONG", extra={"stop": 48000, "tp": 52000},
+            ),
+        }
+        result = ensemble.aggregate(signals, _make_regime(Regime.TRENDING_STRONG))
+        assert result.extra == {"stop": 49000, "tp": 52000}
+
+
+class TestStrategyVote:
+    def test_score_precomputed(self):
+        vote = StrategyVote("trend_ema", "OPEN_LONG", 0.8, 0.5)
+        assert vote.score == pytest.approx(0.4)
+
+    def test_weighted_score_tracks_fields(self):
+        vote = StrategyVote("trend_ema", "OPEN_LONG", 0.8, 0.5)
+        assert vote.weighted_score == pytest.approx(0.4)
+        vote.regime_weight = 1.0
+        assert vote.weighted_score == pytest.approx(0.8)
+
+    def test_slotted(self):
+        vote = StrategyVote("trend_ema", "OPEN_LONG", 0.8, 0.5)
+        assert not hasattr(vote, "__dict__")
+
 
 class TestStrategyNameNormalization:
     def test_camel_case_conversion(self):
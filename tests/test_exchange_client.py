@@ -0,0 +1,224 @@
+"""
+Tests for core/exchange_client.py — ccxt wrapper (no network access).
+"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+
+from core.exchange_client import (
+    DEFAULT_MIN_NOTIONAL,
+    LIVE_OHLCV_TTL,
+    ExchangeClient,
+)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+_BAR_MS = 4 * 3600 * 1000
+_T0 = 1_700_000_000_000 - (1_700_000_000_000 % _BAR_MS)
+
+
+def _candles(n: int = 5) -> list[list[float]]:
+    return [
+        [_T0 + i * _BAR_MS, 100.0 + i, 101.0 + i, 99.0 + i, 100.5 + i, 10.0 * i]
+        for i in range(n)
+    ]
+
+
+def _make_client() -> ExchangeClient:
+    client = ExchangeClient(exchange_name="kraken")
+    client.exchange = MagicMock()
+    client.exchange.fetch_ohlcv.return_value = _candles()
+    client.exchange.parse_timeframe.return_value = 4 * 3600
+    return client
+
+
+# ---------------------------------------------------------------------------
+# OHLCV fetch
+# ---------------------------------------------------------------------------
+
+class TestFetchOhlcvFrame:
+    def test_columns_and_index(self):
+        client = _make_client()
+        df = client.fetch_ohlcv("BTC/USD", "4h", limit=5)
+        assert list(df.columns) == ["open", "high", "low", "close", "volume"]
+        assert df.index.name == "timestamp"
+        assert str(df.index.tz) == "UTC"
+        assert df.index[0] == pd.Timestamp(_T0, unit="ms", tz="UTC")
+        assert (df.dtypes == np.float64).all()
+        assert df["close"].iloc[-1] == 104.5
+
+    def test_integer_volumes_become_float(self):
+        client = _make_client()
+        client.exchange.fetch_ohlcv.return_value = [
+            [_T0, 1, 2, 0, 1, 5], [_T0 + _BAR_MS, 1, 2, 0, 1, 6],
+        ]
+        df = client.fetch_ohlcv("BTC/USD", "4h", limit=2)
+        assert (df.dtypes == np.float64).all()
+
+
+class TestFetchOhlcvCache:
+    def test_repeat_fetch_hits_cache(self):
+        client = _make_client()
+        first = client.fetch_ohlcv("BTC/USD", "4h", limit=5)
+        second = client.fetch_ohlcv("BTC/USD", "4h", limit=5)
+        assert client.exchange.fetch_ohlcv.call_count == 1
+        assert first.equals(second)
+
+    def test_cached_frame_is_copied(self):
+        client = _make_client()
+        df = client.fetch_ohlcv("BTC/USD", "4h", limit=5)
+        df["close"] = 0.0
+        again = client.fetch_ohlcv("BTC/USD", "4h", limit=5)
+        assert (again["close"] > 0).all()
+
+    def test_distinct_keys_fetch_separately(self):
+        client = _make_client()
+        client.fetch_ohlcv("BTC/USD", "4h", limit=5)
+        client.fetch_ohlcv("BTC/USD", "4h", limit=5, since=_T0)
+        client.fetch_ohlcv("ETH/USD", "4h", limit=5)
+        assert client.exchange.fetch_ohlcv.call_count == 3
+
+    def test_ttl_expiry(self, monkeypatch):
+        client = _make_client()
+        clock = [1000.0]
+        monkeypatch.setattr(
+            "core.exchange_client.time.monotonic", lambda: clock[0]
+        )
+        client.fetch_ohlcv("BTC/USD", "4h", limit=5)
+        clock[0] += LIVE_OHLCV_TTL - 1
+        client.fetch_ohlcv("BTC/USD", "4h", limit=5)
+        assert client.exchange.fetch_ohlcv.call_count == 1
+        clock[0] += 2
+        client.fetch_ohlcv("BTC/USD", "4h", limit=5)
+        assert client.exchange.fetch_ohlcv.call_count == 2
+
+    def test_historical_window_lives_one_bar(self, monkeypatch):
+        client = _make_client()
+        clock = [1000.0]
+        monkeypatch.setattr(
+            "core.exchange_client.time.monotonic", lambda: clock[0]
+        )
+        client.fetch_ohlcv("BTC/USD", "4h", limit=5, since=_T0)
+        clock[0] += 3600
+        client.fetch_ohlcv("BTC/USD", "4h", limit=5, since=_T0)
+        assert client.exchange.fetch_ohlcv.call_count == 1
+
+    def test_clear_cache(self):
+        client = _make_client()
+        client.fetch_ohlcv("BTC/USD", "4h", limit=5)
+        client.clear_ohlcv_cache()
+        client.fetch_ohlcv("BTC/USD", "4h", limit=5)
+        assert client.exchange.fetch_ohlcv.call_count == 2
+
+    def test_empty_result_not_cached(self):
+        client = _make_client()
+        client.exchange.fetch_ohlcv.return_value = []
+        df = client.fetch_ohlcv("BTC/USD", "4h", limit=5)
+        assert df.empty
+        client.fetch_ohlcv("BTC/USD", "4h", limit=5)
+        assert client.exchange.fetch_ohlcv.call_count == 2
+
+
+class _FakeAsyncExchange:
+    def __init__(self):
+        self.calls = []
+        self.closed = False
+
+    async def fetch_ohlcv(self, symbol, timeframe, since=None, limit=None):
+        self.calls.append(symbol)
+        await asyncio.sleep(0)
+        return [] if symbol == "EMPTY/USD" else _candles()
+
+    async def close(self):
+        self.closed = True
+
+
+class TestFetchOhlcvMany:
+    def _client(self):
+        client = _make_client()
+        fake = _FakeAsyncExchange()
+        client._make_exchange = lambda module: fake
+        return client, fake
+
+    def test_fetches_each_symbol(self):
+        client, fake = self._client()
+        out = asyncio.run(
+            client.fetch_ohlcv_many(["BTC/USD", "ETH/USD", "BTC/USD"], "4h", limit=5)
+        )
+        assert list(out) == ["BTC/USD", "ETH/USD"]
+        assert sorted(fake.calls) == ["BTC/USD", "ETH/USD"]
+        assert len(out["ETH/USD"]) == 5
+        assert fake.closed
+
+    def test_shares_cache_with_sync_fetch(self):
+        client, fake = self._client()
+        client.fetch_ohlcv("BTC/USD", "4h", limit=5)
+        asyncio.run(client.fetch_ohlcv_many(["BTC/USD", "ETH/USD"], "4h", limit=5))
+        assert fake.calls == ["ETH/USD"]
+        client.fetch_ohlcv("ETH/USD", "4h", limit=5)
+        assert client.exchange.fetch_ohlcv.call_count == 1
+
+    def test_empty_symbol(self):
+        client, _ = self._client()
+        out = asyncio.run(client.fetch_ohlcv_many(["EMPTY/USD"], "4h", limit=5))
+        assert out["EMPTY/USD"].empty
+
+
+# ---------------------------------------------------------------------------
+# Minimum notional
+# ---------------------------------------------------------------------------
+
+class TestMinNotional:
+    def _client(self):
+        client = _make_client()
+        client.exchange.markets = {
+            "BTC/USD": {"limits": {"cost": {"min": 5.0}}},
+            "ETH/USD": {"limits": {"cost": {"min": None}}},
+        }
+        return client
+
+    def test_cache_filled_from_markets(self):
+        client = self._client()
+        assert client.get_min_notional("BTC/USD") == 5.0
+        assert client.get_min_notional("ETH/USD") == DEFAULT_MIN_NOTIONAL
+        assert client.exchange.load_markets.call_count == 1
+        assert client._min_notional_cache["ETH/USD"] == DEFAULT_MIN_NOTIONAL
+
+    def test_malformed_market_entries_default(self):
+        client = self._client()
+        client.exchange.markets.update({
+            "XRP/USD": {"limits": None},
+            "SOL/USD": {"limits": {"cost": {"min": "n/a"}}},
+            "ADA/USD": None,
+        })
+        assert client.get_min_notional("BTC/USD") == 5.0
+        for symbol in ("XRP/USD", "SOL/USD", "ADA/USD"):
+            assert client.get_min_notional(symbol) == DEFAULT_MIN_NOTIONAL
+
+    def test_unknown_symbol_defaults(self):
+        client = self._client()
+        assert client.get_min_notional("DOGE/USD") == DEFAULT_MIN_NOTIONAL
+
+    def test_failed_market_load_defaults(self):
+        client = self._client()
+        client.exchange.load_markets.side_effect = RuntimeError("down")
+        assert client.get_min_notional("BTC/USD") == DEFAULT_MIN_NOTIONAL
+        assert client.get_min_notional("BTC/USD") == DEFAULT_MIN_NOTIONAL
+        assert client.exchange.load_markets.call_count == 1
+
+
+class TestClock:
+    def test_now_is_utc_aware(self):
+        assert ExchangeClient.now().tzinfo is not None
+        assert ExchangeClient.now().utcoffset().total_seconds() == 0
+
+    def test_now_ms_matches_now(self):
+        ms = ExchangeClient.now_ms()
+        assert isinstance(ms, int)
+        assert abs(ms / 1000 - ExchangeClient.now().timestamp()) < 5
@@ -91,6 +91,15 @@ class TestClientOrderId:
         ids = {generate_client_order_id("trend", "ETH/USDT") for _ in range(100)}
         assert len(ids) == 100, "Generated IDs should be unique"
 
+    def test_sequence_increases(self):
+        first = generate_client_order_id("trend", "ETH/USDT")
+        second = generate_client_order_id("trend", "ETH/USDT")
+        prefix, _, seq1 = first.rpartition("_")
+        prefix2, _, seq2 = second.rpartition("_")
+        assert prefix == prefix2
+        assert prefix.startswith("HOT_TREND_ETHUSDT_")
+        assert int(seq2, 16) > int(seq1, 16)
+
 
 # ---------------------------------------------------------------------------
 # Paper mode execution
@@ -121,6 +130,15 @@ class TestPaperExecution:
         assert result["qty"] > 0
         assert len(executor.orders) == 1
 
+    def test_paper_fill_shares_signal_timestamp(self):
+        executor = Executor(mode="paper", portfolio=MockPortfolio())
+        signal = MockSignal(action="OPEN_LONG")
+        executor.execute_signal("BTC/USDT", signal, {"close": 50000}, "test")
+        order = next(iter(executor.orders.values()))
+        assert order.created_at is order.filled_at
+        assert order.updated_at is order.created_at
+        assert order.created_at.tzinfo is not None
+
     def test_hold_signal_returns_none(self):
         executor = Executor(mode="paper", portfolio=MockPortfolio())
         signal = MockSignal(action="HOLD")
@@ -214,6 +232,32 @@ class TestOrderStateMachine:
         assert d["side"] == "buy"
         assert d["type"] == "market"
 
+    def test_to_dict_reflects_state_changes(self):
+        order = ManagedOrder(
+            client_order_id="HOT_TEST_004",
+            symbol="BTC/USDT",
+            side=OrderSide.SELL,
+            order_type=OrderType.LIMIT,
+            qty=0.5,
+            price=50000.0,
+            strategy="trend",
+        )
+        assert order.to_dict()["status"] == "pending"
+        order.status = OrderStatus.FILLED
+        order.filled_qty = 0.5
+        order.price = 49900.0
+        d = order.to_dict()
+        assert d["status"] == "filled"
+        assert d["filled_qty"] == 0.5
+        assert d["price"] == 49900.0
+        assert d["created_at"] == order.created_at.isoformat()
+        assert not hasattr(order, "__dict__")
+
+    def test_enums_are_strings(self):
+        assert OrderStatus.FILLED == "filled"
+        assert f"{OrderSide.BUY}" == "buy"
+        assert isinstance(OrderType.LIMIT, str)
+
 
 # ---------------------------------------------------------------------------
 # Executor status
@@ -245,3 +289,417 @@ class TestExecutorStatus:
         status = executor.get_status()
         assert status["total_orders"] == 1
         assert status["filled"] == 1
+        assert status["pending"] == 0
+
+    def test_status_counts_follow_transitions(self):
+        client = MagicMock()
+        client.get_open_orders.return_value = [
+            {"clientOrderId": "A", "status": "open", "filled": 0},
+        ]
+        executor = Executor(mode="live", exchange_client=client)
+        a, b = _live_order("A"), _live_order("B")
+        executor._track(a)
+        executor._track(b)
+        assert executor.get_status()["pending"] == 2
+
+        executor._reconcile_order(a)   # still open -> SUBMITTED
+        executor._transition(b, OrderStatus.ERROR)
+        status = executor.get_status()
+        assert status["pending"] == 1
+        assert status["errors"] == 1
+        assert status["filled"] == 0
+
+    def test_duplicate_registration_is_idempotent(self):
+        executor = Executor(mode="live")
+        first, dup = _live_order("A"), _live_order("A")
+        assert executor._track(first) is first
+        assert executor._track(dup) is first
+        assert executor.orders["A"] is first
+        assert executor.get_status()["total_orders"] == 1
+        assert executor.get_status()["pending"] == 1
+
+
+# ---------------------------------------------------------------------------
+# Live reconciliation
+# ---------------------------------------------------------------------------
+
+def _live_order(cid: str, symbol: str = "BTC/USDT") -> ManagedOrder:
+    return ManagedOrder(
+        client_order_id=cid,
+        symbol=symbol,
+        side=OrderSide.BUY,
+        order_type=OrderType.LIMIT,
+        qty=0.01,
+        price=50000.0,
+        strategy="test",
+    )
+
+
+class TestLiveReconciliation:
+    def _executor(self, open_orders):
+        client = MagicMock()
+        client.get_open_orders.return_value = open_orders
+        return Executor(mode="live", exchange_client=client), client
+
+    def test_open_orders_snapshot_shared(self):
+        executor, client = self._executor([
+            {"clientOrderId": "A", "status": "open", "filled": 0},
+            {"clientOrderId": "B", "status": "open", "filled": 0.005},
+        ])
+        assert executor._reconcile_order(_live_order("A"))["action"] == "SUBMITTED"
+        assert executor._reconcile_order(_live_order("B"))["action"] == "PARTIAL"
+        assert executor._reconcile_order(_live_order("C"))["action"] == "ORPHANED"
+        assert client.get_open_orders.call_count == 1
+
+    def test_submit_invalidates_snapshot(self):
+        import ccxt
+
+        executor, client = self._executor([])
+        executor._reconcile_order(_live_order("A"))
+        client.create_order.side_effect = ccxt.RequestTimeout("timeout")
+        client.get_open_orders.return_value = [
+            {"clientOrderId": "X", "status": "open", "filled": 0},
+        ]
+        order = _live_order("X")
+        result = executor._execute_live_open(order, None, None)
+        assert result["action"] == "SUBMITTED"
+        assert client.get_open_orders.call_count == 2
+
+
+class TestRateLimitRetry:
+    def test_retries_then_succeeds(self):
+        import ccxt
+
+        client = MagicMock()
+        client.create_order.side_effect = [
+            ccxt.RateLimitExceeded("429"),
+            ccxt.RateLimitExceeded("429"),
+            {"id": "X1", "status": "open"},
+        ]
+        executor = Executor(mode="live", exchange_client=client)
+        with patch("core.execution.time.sleep") as sleep:
+            result = executor._execute_live_open(_live_order("R"), None, None)
+        assert result["action"] == "SUBMITTED"
+        assert client.create_order.call_count == 3
+        delays = [c.args[0] for c in sleep.call_args_list]
+        assert len(delays) == 2
+        assert 0 <= delays[0] <= 0.1 and 0 <= delays[1] <= 0.2
+
+    def test_gives_up_after_retries(self):
+        import ccxt
+
+        from core.execution import ORDER_RETRIES
+
+        client = MagicMock()
+        client.create_order.side_effect = ccxt.RateLimitExceeded("429")
+        executor = Executor(mode="live", exchange_client=client)
+        order = _live_order("R")
+        with patch("core.execution.time.sleep"):
+            result = executor._execute_live_open(order, None, None)
+        assert result["action"] == "ERROR"
+        assert order.status == OrderStatus.ERROR
+        assert client.create_order.call_count == ORDER_RETRIES + 1
+
+    def test_backoff_is_capped(self):
+        import ccxt
+
+        from core.execution import _retry_with_backoff
+
+        fn = MagicMock(side_effect=[ccxt.RateLimitExceeded("429")] * 6 + ["ok"])
+        with patch("core.execution.time.sleep") as sleep:
+            assert _retry_with_backoff(fn, retries=6, base=1.0, cap=2.0) == "ok"
+        assert max(c.args[0] for c in sleep.call_args_list) <= 2.0
+
+
+class TestBracketOrders:
+    def _executor(self, has):
+        client = MagicMock()
+        client.exchange.has = has
+        client.create_order.return_value = {"id": "X1", "status": "open"}
+        return Executor(mode="live", exchange_client=client), client
+
+    def test_bracket_attached_when_supported(self):
+        executor, client = self._executor({"createOrderWithTakeProfitAndStopLoss": True})
+        executor._execute_live_open(_live_order("B"), 49000.0, 52000.0)
+        params = client.create_order.call_args.kwargs["params"]
+        assert params["stopLoss"] == {"triggerPrice": 49000.0}
+        assert params["takeProfit"] == {"triggerPrice": 52000.0}
+        assert params["clientOrderId"] == "B"
+        assert client.create_order.call_count == 1
+
+    def test_plain_entry_when_unsupported(self):
+        executor, client = self._executor({"createOrderWithTakeProfitAndStopLoss": False})
+        executor._execute_live_open(_live_order("B"), 49000.0, 52000.0)
+        params = client.create_order.call_args.kwargs["params"]
+        assert "stopLoss" not in params and "takeProfit" not in params
+
+
+class TestCancelAll:
+    def test_cancels_every_open_order(self):
+        client = MagicMock()
+        client.get_open_orders.return_value = [
+            {"id": str(i), "symbol": "BTC/USDT"} for i in range(12)
+        ]
+        executor = Executor(mode="live", exchange_client=client)
+        assert executor.cancel_all_open_orders() == 12
+        cancelled = sorted(c.args[0] for c in client.cancel_order.call_args_list)
+        assert cancelled == sorted(str(i) for i in range(12))
+
+    def test_failed_cancels_not_counted(self):
+        client = MagicMock()
+        client.get_open_orders.return_value = [
+            {"id": "1", "symbol": "BTC/USDT"}, {"id": "2", "symbol": "ETH/USDT"},
+        ]
+        client.cancel_order.side_effect = [RuntimeError("boom"), {"id": "2"}]
+        executor = Executor(mode="live", exchange_client=client)
+        assert executor.cancel_all_open_orders() == 1
+
+    def test_paper_mode_noop(self):
+        assert Executor(mode="paper").cancel_all_open_orders() == 0
+
+
+class _FakeOrderStream:
+    """Replays batches from watch_orders(), then blocks like an idle stream."""
+
+    def __init__(self, batches):
+        self.batches = list(batches)
+
+    async def watch_orders(self, symbol=None):
+        import asyncio
+
+        if not self.batches:
+            await asyncio.Event().wait()
+        batch = self.batches.pop(0)
+        if isinstance(batch, Exception):
+            raise batch
+        return batch
+
+
+class TestOrderUpdates:
+    def _executor(self, *orders, batches=()):
+        executor = Executor(mode="live", ws_client=_FakeOrderStream(batches))
+        for order in orders:
+            executor._track(order)
+            executor._transition(order, OrderStatus.SUBMITTED)
+        return executor
+
+    def _run(self, coro):
+        import asyncio
+
+        return asyncio.run(coro)
+
+    def test_fill_update(self):
+        order = _live_order("A")
+        executor = self._executor(order)
+        result = self._run(executor._on_order_update({
+            "clientOrderId": "A", "id": "X1", "status": "closed",
+            "filled": 0.01, "average": 49990.0,
+        }))
+        assert result["action"] == "FILLED"
+        assert order.avg_fill_price == 49990.0
+        assert order.exchange_order_id == "X1"
+        assert executor.get_status()["filled"] == 1
+
+    def test_fill_update_without_average(self):
+        order = _live_order("A")
+        executor = self._executor(order)
+        result = self._run(executor._on_order_update({
+            "clientOrderId": "A", "status": "closed", "filled": None, "average": None,
+        }))
+        assert result["action"] == "FILLED"
+        assert order.filled_qty == order.qty
+        assert order.avg_fill_price == order.price
+
+    def test_update_persists_off_the_event_loop(self):
+        import asyncio
+        import threading
+
+        order = _live_order("A")
+        executor = self._executor(order)
+        executor.order_store = MagicMock()
+        saved_on = []
+        executor.order_store.save.side_effect = lambda o: saved_on.append(
+            (o.status, threading.get_ident())
+        )
+
+        async def apply():
+            await executor._on_order_update({"clientOrderId": "A", "status": "closed"})
+            return threading.get_ident()
+
+        loop_thread = asyncio.run(apply())
+        assert [status for status, _ in saved_on] == [OrderStatus.FILLED]
+        assert saved_on[0][1] != loop_thread
+
+    def test_cancel_and_unknown_updates(self):
+        order = _live_order("A")
+        executor = self._executor(order)
+        assert self._run(executor._on_order_update({"clientOrderId": "Z", "status": "closed"})) is None
+        result = self._run(executor._on_order_update({"clientOrderId": "A", "status": "canceled"}))
+        assert result["action"] == "CANCELLED"
+        # Terminal orders ignore late updates
+        assert self._run(executor._on_order_update({"clientOrderId": "A", "status": "closed"})) is None
+        assert order.status == OrderStatus.CANCELLED
+
+    def test_stream_drives_updates(self):
+        import asyncio
+
+        a, b = _live_order("A"), _live_order("B")
+        executor = self._executor(a, b, batches=[
+            [{"clientOrderId": "A", "status": "open", "filled": 0.004}],
+            ConnectionError("socket closed"),
+            [{"clientOrderId": "B", "status": "closed", "filled": 0.01}],
+        ])
+
+        async def run():
+            task = asyncio.create_task(executor.watch_order_updates())
+            for _ in range(100):
+                await asyncio.sleep(0)
+                if b.status == OrderStatus.FILLED:
+                    break
+            task.cancel()
+
+        with patch("core.execution.WS_RETRY_SECONDS", 0):
+            self._run(run())
+        assert a.status == OrderStatus.PARTIAL
+        assert b.status == OrderStatus.FILLED
+
+    def test_bad_update_does_not_stop_stream(self):
+        import asyncio
+
+        a, b = _live_order("A"), _live_order("B")
+        executor = self._executor(a, b, batches=[
+            [
+                {"clientOrderId": "A", "status": "closed", "filled": "n/a"},
+                {"clientOrderId": "B", "status": "closed", "filled": 0.01},
+            ],
+        ])
+
+        async def run():
+            task = asyncio.create_task(executor.watch_order_updates())
+            for _ in range(100):
+                await asyncio.sleep(0)
+                if b.status == OrderStatus.FILLED:
+                    break
+            task.cancel()
+
+        self._run(run())
+        assert b.status == OrderStatus.FILLED
+
+
+class TestOrderStore:
+    @pytest.fixture
+    def store(self, tmp_path):
+        from core.order_store import OrderStore
+
+        return OrderStore(f"sqlite:///{tmp_path / 'orders.db'}")
+
+    def test_round_trip(self, store):
+        order = _live_order("RT")
+        order.status = OrderStatus.PARTIAL
+        order.filled_qty = 0.004
+        store.save(order)
+        loaded = store.get("RT")
+        assert loaded.status == OrderStatus.PARTIAL
+        assert loaded.filled_qty == 0.004
+        assert loaded.created_at == order.created_at
+        assert store.get("missing") is None
+
+    def test_index_added_to_existing_table(self, tmp_path):
+        from sqlalchemy import create_engine, inspect, text
+
+        from core.order_store import OrderStore
+
+        url = f"sqlite:///{tmp_path / 'old.db'}"
+        OrderStore(url)
+        engine = create_engine(url)
+        with engine.begin() as conn:
+            conn.execute(text("DROP INDEX ix_live_orders_status_created"))
+
+        OrderStore(url)
+        names = {ix["name"] for ix in inspect(engine).get_indexes("live_orders")}
+        assert "ix_live_orders_status_created" in names
+
+    def test_save_updates_existing_row(self, store):
+        order = _live_order("UP")
+        store.save(order)
+        order.status = OrderStatus.FILLED
+        store.save(order)
+        assert store.get("UP").status == OrderStatus.FILLED
+        assert store.get_pending() == []
+
+    def test_pending_paginated_oldest_first(self, store):
+        from datetime import timedelta
+
+        base = _live_order("base").created_at
+        for i, status in enumerate([
+            OrderStatus.SUBMITTED, OrderStatus.FILLED, OrderStatus.PARTIAL,
+            OrderStatus.CANCELLED, OrderStatus.PENDING,
+        ]):
+            order = _live_order(f"P{i}")
+            order.status = status
+            order.created_at = base - timedelta(minutes=i)
+            store.save(order)
+        ids = [o.client_order_id for o in store.get_pending(limit=2)]
+        ids += [o.client_order_id for o in store.get_pending(limit=2, offset=2)]
+        assert ids == ["P4", "P2", "P0"]
+
+    def test_executor_writes_through(self, store):
+        executor = Executor(
+            mode="paper", portfolio=MockPortfolio(), order_store=store
+        )
+        result = executor.execute_signal(
+            "BTC/USDT", MockSignal(action="OPEN_LONG"), {"close": 50000}, "test"
+        )
+        assert store.get(result["client_order_id"]).status == OrderStatus.FILLED
+
+    def test_startup_reconciles_stored_orders(self, store):
+        stale = _live_order("STALE")
+        stale.status = OrderStatus.SUBMITTED
+        store.save(stale)
+        client = MagicMock()
+        client.get_open_orders.return_value = [
+            {"clientOrderId": "STALE", "status": "open", "filled": 0.01},
+        ]
+        executor = Executor(mode="live", exchange_client=client, order_store=store)
+        executor.reconcile_on_startup()
+        assert executor.orders["STALE"].status == OrderStatus.PARTIAL
+        assert store.get("STALE").status == OrderStatus.PARTIAL
+
+
+class TestConcurrentExecution:
+    def test_live_signals_overlap(self):
+        import asyncio
+        import threading
+
+        batch = [
+            (sym, MockSignal(action="OPEN_LONG"), {"close": 100.0}, "test")
+            for sym in ("BTC/USDT", "ETH/USDT", "SOL/USDT", "ADA/USDT")
+        ]
+        # Every order request waits until all of them are in flight, so
+        # this only passes if the exchange calls run concurrently
+        in_flight = threading.Barrier(len(batch), timeout=5)
+
+        def slow_create(**kwargs):
+            in_flight.wait()
+            return {"id": kwargs["params"]["clientOrderId"], "status": "closed",
+                    "filled": kwargs["amount"], "average": kwargs["price"]}
+
+        client = MagicMock()
+        client.create_order.side_effect = slow_create
+        executor = Executor(mode="live", exchange_client=client)
+
+        results = asyncio.run(executor.execute_signals(batch))
+
+        assert not in_flight.broken
+        assert [r["symbol"] for r in results] == [b[0] for b in batch]
+        assert all(r["action"] == "FILLED" for r in results)
+        assert executor.get_status()["filled"] == 4
+
+    def test_paper_signals_run_inline(self):
+        import asyncio
+
+        executor = Executor(mode="paper", portfolio=MockPortfolio())
+        result = asyncio.run(executor.execute_signal_async(
+            "BTC/USDT", MockSignal(action="OPEN_LONG"), {"close": 100.0}, "test",
+        ))
+        assert result["action"] == "FILLED"
@@ -0,0 +1,102 @@
+"""
+Tests for core/indicator_kernels.py — kernels must match the pandas formulations.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core import indicator_kernels as kernels
+
+
+@pytest.fixture
+def ohlc():
+    rng = np.random.default_rng(7)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0, 0.01, 400)))
+    high = close * (1 + rng.uniform(0, 0.01, 400))
+    low = close * (1 - rng.uniform(0, 0.01, 400))
+    return high, low, close
+
+
+class TestEma:
+    def test_matches_pandas(self, ohlc):
+        _, _, close = ohlc
+        expected = pd.Series(close).ewm(span=20, adjust=False).mean().to_numpy()
+        np.testing.assert_allclose(kernels.ema(close, 20), expected, rtol=1e-12)
+
+    def test_empty(self):
+        assert kernels.ema(np.empty(0), 5).size == 0
+
+    @pytest.mark.parametrize("span", [3, 20])
+    def test_nan_gaps_match_pandas(self, ohlc, span):
+        _, _, close = ohlc
+        close = close.copy()
+        close[[0, 3, 50, 51, 52, 300]] = np.nan
+        expected = pd.Series(close).ewm(span=span, adjust=False).mean().to_numpy()
+        out = kernels.ema(close, span)
+        np.testing.assert_allclose(out, expected, rtol=1e-12)
+        assert np.isfinite(out).sum() == np.isfinite(expected).sum() == 399
+
+    def test_span_3_gap(self):
+        # span 3 is com == 1, which pandas weights differently after a gap
+        x = np.array([1.0, 2.0, np.nan, 4.0, 5.0])
+        expected = pd.Series(x).ewm(span=3, adjust=False).mean().to_numpy()
+        np.testing.assert_allclose(kernels.ema(x, 3), expected, rtol=1e-12)
+        np.testing.assert_allclose(expected, [1.0, 1.5, 1.5, 3.375, 4.1875])
+
+
+class TestAtr:
+    def test_matches_pandas(self, ohlc):
+        high, low, close = ohlc
+        h, l, c = pd.Series(high), pd.Series(low), pd.Series(close)
+        tr = pd.concat(
+            [h - l, (h - c.shift(1)).abs(), (l - c.shift(1)).abs()], axis=1
+        ).max(axis=1)
+        expected = tr.rolling(14).mean().to_numpy()
+        np.testing.assert_allclose(kernels.atr(high, low, close, 14), expected, rtol=1e-9)
+
+    def test_nan_gaps_match_pandas(self, ohlc):
+        high, low, close = (a.copy() for a in ohlc)
+        close[[10, 200]] = np.nan
+        high[100] = np.nan
+        low[[100, 300]] = np.nan
+        h, l, c = pd.Series(high), pd.Series(low), pd.Series(close)
+        tr = pd.concat(
+            [h - l, (h - c.shift(1)).abs(), (l - c.shift(1)).abs()], axis=1
+        ).max(axis=1)
+        expected = tr.rolling(14).mean().to_numpy()
+        out = kernels.atr(high, low, close, 14)
+        np.testing.assert_allclose(out, expected, rtol=1e-9)
+        assert np.isfinite(out[-50:]).all()
+
+
+class TestRsi:
+    def test_matches_pandas(self, ohlc):
+        _, _, close = ohlc
+        delta = pd.Series(close).diff()
+        gain = delta.where(delta > 0, 0.0)
+        loss = (-delta).where(delta < 0, 0.0)
+        avg_gain = gain.ewm(alpha=1 / 14, min_periods=14).mean()
+        avg_loss = loss.ewm(alpha=1 / 14, min_periods=14).mean()
+        expected = (100 - 100 / (1 + avg_gain / avg_loss)).to_numpy()
+        np.testing.assert_allclose(kernels.rsi(close, 14), expected, rtol=1e-9)
+
+    def test_nan_gaps_match_pandas(self, ohlc):
+        _, _, close = ohlc
+        close = close.copy()
+        close[[5, 120, 121]] = np.nan
+        delta = pd.Series(close).diff()
+        gain = delta.where(delta > 0, 0.0)
+        loss = (-delta).where(delta < 0, 0.0)
+        avg_gain = gain.ewm(alpha=1 / 14, min_periods=14).mean()
+        avg_loss = loss.ewm(alpha=1 / 14, min_periods=14).mean()
+        expected = (100 - 100 / (1 + avg_gain / avg_loss)).to_numpy()
+        np.testing.assert_allclose(kernels.rsi(close, 14), expected, rtol=1e-9)
+
+    def test_only_gains_is_100(self):
+        out = kernels.rsi(np.arange(1.0, 30.0), 14)
+        assert np.isnan(out[:13]).all()
+        assert (out[13:] == 100.0).all()
+
+    def test_flat_is_nan(self):
+        assert np.isnan(kernels.rsi(np.full(30, 5.0), 14)).all()
@@ -0,0 +1,138 @@
+"""
+Tests for core/moonshot.py — CoinGecko small-cap scanner (no network access).
+"""
+
+import threading
+
+import pytest
+
+from core.moonshot import MoonshotScanner
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _coin(symbol: str, mcap: float, volume: float) -> dict:
+    return {
+        "symbol": symbol.lower(),
+        "name": symbol.title(),
+        "current_price": 1.0,
+        "market_cap": mcap,
+        "total_volume": volume,
+        "price_change_percentage_24h": 5.0,
+    }
+
+
+class _Response:
+    def __init__(self, data, status_code: int = 200):
+        self._data = data
+        self.status_code = status_code
+
+    def json(self):
+        return self._data
+
+
+class FakeSession:
+    """Serves canned pages of /coins/markets keyed by page number."""
+
+    def __init__(self, pages: dict[int, list], status: dict[int, int] = None):
+        self.pages = pages
+        self.status = status or {}
+        self.requested: list[int] = []
+        self._lock = threading.Lock()
+
+    def get(self, url, params=None, timeout=None):
+        page = params["page"]
+        with self._lock:
+            self.requested.append(page)
+        return _Response(self.pages.get(page, []), self.status.get(page, 200))
+
+
+def _scanner(session: FakeSession) -> MoonshotScanner:
+    scanner = MoonshotScanner()
+    scanner.session = session
+    return scanner
+
+
+# ---------------------------------------------------------------------------
+# Scan
+# ---------------------------------------------------------------------------
+
+class TestFindMoonshots:
+    def test_filters_and_ranks(self):
+        session = FakeSession({
+            1: [
+                _coin("big", 5e9, 1e9),        # mcap too large
+                _coin("hot", 5e7, 4e7),        # ratio 0.8
+                _coin("cold", 5e7, 1e6),       # ratio 0.02
+            ],
+            2: [_coin("warm", 2e7, 6e6)],      # ratio 0.3
+            3: [_coin("zero", 0, 1e6)],        # no market cap
+        })
+        gems = _scanner(session).find_moonshots()
+        assert [g["symbol"] for g in gems] == ["HOT", "WARM"]
+        assert gems[0]["ratio"] == pytest.approx(0.8)
+        assert sorted(session.requested) == [1, 2, 3]
+
+    def test_stops_at_failed_page(self):
+        session = FakeSession(
+            {1: [_coin("hot", 5e7, 4e7)], 3: [_coin("late", 5e7, 4e7)]},
+            status={2: 429},
+        )
+        gems = _scanner(session).find_moonshots()
+        assert [g["symbol"] for g in gems] == ["HOT"]
+
+    def test_returns_top_ten(self):
+        coins = [_coin(f"c{i}", 1e7, 1e6 * (i + 2)) for i in range(25)]
+        gems = _scanner(FakeSession({1: coins})).find_moonshots()
+        assert len(gems) == 10
+        assert gems[0]["symbol"] == "C24"
+        assert [g["symbol"] for g in gems] == [f"C{i}" for i in range(24, 14, -1)]
+
+    def test_errors_return_empty(self):
+        class Broken:
+            def get(self, *args, **kwargs):
+                raise ConnectionError("offline")
+
+        assert _scanner(Broken()).find_moonshots() == []
+
+
+class TestScanCache:
+    def test_repeat_scan_reuses_snapshot(self):
+        session = FakeSession({1: [_coin("hot", 5e7, 4e7)]})
+        scanner = _scanner(session)
+        first = scanner.find_moonshots()
+        second = scanner.find_moonshots()
+        assert first == second
+        assert len(session.requested) == scanner.pages
+
+    def test_zero_ttl_forces_rescan(self):
+        session = FakeSession({1: [_coin("hot", 5e7, 4e7)]})
+        scanner = _scanner(session)
+        scanner.find_moonshots()
+        scanner.find_moonshots(ttl_s=0)
+        assert len(session.requested) == 2 * scanner.pages
+
+    def test_changed_thresholds_rescan(self):
+        session = FakeSession({1: [_coin("hot", 5e7, 4e7)]})
+        scanner = _scanner(session)
+        assert scanner.find_moonshots()
+        scanner.max_mcap = 1e6
+        assert scanner.find_moonshots() == []
+        assert len(session.requested) == 2 * scanner.pages
+
+    def test_failures_not_cached(self):
+        class Flaky(FakeSession):
+            fail = True
+
+            def get(self, url, params=None, timeout=None):
+                if self.fail:
+                    raise ConnectionError("offline")
+                return super().get(url, params, timeout)
+
+        session = Flaky({1: [_coin("hot", 5e7, 4e7)]})
+        scanner = _scanner(session)
+        assert scanner.find_moonshots() == []
+        session.fail = False
+        assert [g["symbol"] for g in scanner.find_moonshots()] == ["HOT"]
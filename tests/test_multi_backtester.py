@@ -0,0 +1,161 @@
+"""
+Tests for core/multi_backtester.py — multi-strategy comparison runs (no network access).
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import core.multi_backtester as mb
+from strategies.mean_reversion_bb import MeanReversionBBBacktest
+from strategies.trend_ema import TrendEmaBacktest
+
+
+def _make_ohlcv(n: int = 200) -> pd.DataFrame:
+    idx = pd.date_range("2024-01-01", periods=n, freq="4h", tz="UTC")
+    close = 100.0 + 5.0 * np.sin(np.linspace(0, 12, n)) + np.linspace(0, 10, n)
+    return pd.DataFrame(
+        {
+            "open": close - 0.5,
+            "high": close + 1.0,
+            "low": close - 1.0,
+            "close": close,
+            "volume": np.full(n, 10.0),
+        },
+        index=idx,
+    )
+
+
+@pytest.fixture
+def fake_source(monkeypatch):
+    import core.backtester as backtester
+
+    calls = []
+
+    def fake_load(symbol, timeframe, limit, use_sql, db_url):
+        calls.append(symbol)
+        if symbol == "BAD/USDT":
+            raise RuntimeError("no data")
+        return backtester.prepare_ohlcv_for_backtesting(_make_ohlcv())
+
+    monkeypatch.setattr(backtester, "_load_ohlcv", fake_load)
+    monkeypatch.setattr(mb, "STRATEGIES", {
+        "TREND_EMA": TrendEmaBacktest,
+        "MR_BB": MeanReversionBBBacktest,
+    })
+    backtester.clear_ohlcv_cache()
+    yield calls
+    backtester.clear_ohlcv_cache()
+
+
+class _InlineExecutor:
+    """ProcessPoolExecutor stand-in that runs tasks in this process."""
+
+    def __init__(self, max_workers=None, initializer=None, initargs=()):
+        initializer(*initargs)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def submit(self, fn, *args):
+        from concurrent.futures import Future
+
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+class TestRunAllBacktests:
+    def test_every_pair_runs_across_workers(self, fake_source):
+        df = mb.run_all_backtests(["BTC/USDT", "ETH/USDT"], max_workers=2)
+        assert len(df) == 4
+        assert set(zip(df["symbol"], df["strategy"])) == {
+            (s, n) for s in ("BTC/USDT", "ETH/USDT") for n in ("TREND_EMA", "MR_BB")
+        }
+        assert df["final_equity"].is_monotonic_decreasing
+        assert (df["start_date"] == "2024-01-01").all()
+
+    def test_failed_symbol_skipped(self, fake_source):
+        df = mb.run_all_backtests(["BAD/USDT", "BTC/USDT"], max_workers=1)
+        assert set(df["symbol"]) == {"BTC/USDT"}
+        assert fake_source == ["BAD/USDT", "BTC/USDT"]
+
+    def test_repeat_runs_reuse_fetch(self, fake_source):
+        first = mb.run_all_backtests(["BTC/USDT"], max_workers=1)
+        second = mb.run_all_backtests(["BTC/USDT"], max_workers=1)
+        assert fake_source == ["BTC/USDT"]
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_float32_frames(self, fake_source, monkeypatch):
+        dtypes = []
+
+        def fake_run_one(symbol, strategy_class, cash, commission):
+            dtypes.append(set(mb._WORKER_FRAMES[symbol].dtypes))
+            raise RuntimeError("not run")
+
+        monkeypatch.setattr(mb, "_run_one", fake_run_one)
+        monkeypatch.setattr(mb, "ProcessPoolExecutor", _InlineExecutor)
+        mb.run_all_backtests(["BTC/USDT"], use_float32=True)
+        assert dtypes == [{np.dtype(np.float32)}] * 2
+
+    def test_persist_saves_every_run(self, fake_source, tmp_path):
+        from sqlalchemy import func, select
+        from sqlalchemy.orm import Session
+
+        from db.init_db import init_db
+        from db.models import BacktestRun
+
+        url = f"sqlite:///{tmp_path / 'bt.db'}"
+        engine = init_db(url)
+        mb.run_all_backtests(["BTC/USDT", "ETH/USDT"], persist=True, db_url=url,
+                             max_workers=1)
+        with Session(engine) as session:
+            runs = session.execute(
+                select(BacktestRun.symbol, func.count()).group_by(BacktestRun.symbol)
+            ).all()
+        assert dict(runs) == {"BTC/USDT": 2, "ETH/USDT": 2}
+
+
+class TestFormatResultsTable:
+    def test_formats_without_mutating(self):
+        df = pd.DataFrame([{
+            "symbol": "BTC/USDT", "strategy": "TREND_EMA", "final_equity": 1234.5,
+            "return_pct": 23.456, "max_drawdown_pct": -5.0, "sharpe_ratio": 1.23456,
+            "trades_count": 3, "win_rate": 66.666,
+        }])
+        before = df.copy()
+        table = mb.format_results_table(df)
+        for text in ("$1,234.50", "23.46%", "-5.00%", "1.235", "66.7%"):
+            assert text in table
+        pd.testing.assert_frame_equal(df, before)
+
+    def test_empty(self):
+        assert mb.format_results_table(pd.DataFrame()) == "No results to display"
+
+
+class TestSaveBacktest:
+    def test_no_trades_frame(self, tmp_path):
+        from sqlalchemy import func, select
+        from sqlalchemy.orm import Session
+
+        from db.init_db import init_db
+        from db.models import BacktestRun, BacktestTrade
+        from db.persistence import save_backtest_to_db
+
+        url = f"sqlite:///{tmp_path / 'bt.db'}"
+        engine = init_db(url)
+        stats = pd.Series({
+            "Equity Final [$]": 1000.0, "Max. Drawdown [%]": 0.0,
+            "Sharpe Ratio": float("nan"), "# Trades": 0, "_trades": None,
+        })
+        run_id = save_backtest_to_db(stats, None, "BTC/USDT", "4h", "TREND_EMA", 1000.0,
+                                     db_url=url)
+        with Session(engine) as session:
+            assert session.get(BacktestRun, run_id).sharpe_ratio == 0.0
+            assert session.scalar(select(func.count()).select_from(BacktestTrade)) == 0
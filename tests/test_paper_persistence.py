@@ -0,0 +1,90 @@
+"""
+Tests for core/paper_persistence.py — paper trading records (SQLite).
+"""
+
+import json
+
+import pytest
+from sqlalchemy import func, select
+
+from core import paper_persistence as pp
+from db.init_db import init_db
+from db.models import PaperEvent
+
+
+@pytest.fixture
+def db_url(tmp_path):
+    url = f"sqlite:///{tmp_path / 'paper.db'}"
+    init_db(url)
+    return url
+
+
+class TestPaperRecords:
+    def test_run_trade_round_trip(self, db_url):
+        run_id = pp.create_paper_run(["BTC/USDT"], "4h", 1000.0, db_url=db_url)
+        pp.log_trade(run_id, "BTC/USDT", "TREND", "LONG", 0.01, 50000.0, 50010.0,
+                     fees=0.5, db_url=db_url)
+        pp.log_event(run_id, "SIGNAL", "open long", symbol="BTC/USDT", db_url=db_url)
+        pp.update_paper_run(run_id, status="stopped", final_equity=990.0, db_url=db_url)
+
+        trades = pp.get_run_trades(run_id, db_url=db_url)
+        assert len(trades) == 1
+        assert trades[0]["fill_price"] == 50010.0
+        assert trades[0]["side"] == "LONG"
+        assert set(trades[0]) == {
+            "id", "ts", "symbol", "strategy", "side", "qty", "price", "fill_price", "fees",
+        }
+
+    def test_get_run_trades_filters_run(self, db_url):
+        run_a = pp.create_paper_run(["BTC/USDT"], "4h", 1000.0, db_url=db_url)
+        run_b = pp.create_paper_run(["BTC/USDT"], "4h", 1000.0, db_url=db_url)
+        for i in range(5):
+            pp.log_trade(run_a, "BTC/USDT", "TREND", "LONG", 0.01, 100.0 + i, 100.0 + i,
+                         db_url=db_url)
+        pp.log_trade(run_b, "BTC/USDT", "TREND", "SHORT", 0.01, 1.0, 1.0, db_url=db_url)
+        trades = pp.get_run_trades(run_a, db_url=db_url)
+        assert sorted(t["price"] for t in trades) == [100.0, 101.0, 102.0, 103.0, 104.0]
+
+    def test_engine_shared_per_url(self, db_url, tmp_path):
+        with pp._session(db_url) as a, pp._session(db_url) as b:
+            assert a.get_bind() is b.get_bind()
+        other = f"sqlite:///{tmp_path / 'other.db'}"
+        with pp._session(other) as c:
+            assert c.get_bind() is not a.get_bind()
+
+
+def _event_count(db_url: str) -> int:
+    with pp._session(db_url) as session:
+        return session.scalar(select(func.count()).select_from(PaperEvent))
+
+
+class TestEventBatching:
+    def test_flush_writes_queued_events(self, db_url):
+        run_id = pp.create_paper_run(["BTC/USDT"], "4h", 1000.0, db_url=db_url)
+        for i in range(pp.EVENT_BATCH_SIZE * 2 + 5):
+            pp.log_event(run_id, "HOLD", f"tick {i}", extra={"i": i}, db_url=db_url)
+        pp.flush()
+        assert _event_count(db_url) == pp.EVENT_BATCH_SIZE * 2 + 5
+
+    def test_log_event_returns_stored_id(self, db_url):
+        run_id = pp.create_paper_run(["BTC/USDT"], "4h", 1000.0, db_url=db_url)
+        first = pp.log_event(run_id, "CLOSE", "closed", extra={"pnl": 1.5}, db_url=db_url)
+        second = pp.log_event(run_id, "HOLD", "no signal", db_url=db_url)
+        assert first != second
+        pp.flush()
+        with pp._session(db_url) as session:
+            blobs = [json.loads(b) for b in session.scalars(
+                select(PaperEvent.json_blob).order_by(PaperEvent.id)
+            )]
+        assert blobs == [{"pnl": 1.5, "event_id": first}, {"event_id": second}]
+
+    def test_stopping_run_flushes_events(self, db_url):
+        run_id = pp.create_paper_run(["BTC/USDT"], "4h", 1000.0, db_url=db_url)
+        pp.log_event(run_id, "SIGNAL", "last words", db_url=db_url)
+        pp.update_paper_run(run_id, status="stopped", db_url=db_url)
+        assert _event_count(db_url) == 1
+
+    def test_write_failure_does_not_block_flush(self, tmp_path):
+        missing = f"sqlite:///{tmp_path / 'no_tables.db'}"
+        pp.log_event(1, "SIGNAL", "lost", db_url=missing)
+        pp.flush()
@@ -0,0 +1,199 @@
+"""
+Tests for core/portfolio.py — paper trading portfolio.
+"""
+
+import pytest
+
+from core.portfolio import Portfolio
+
+
+def _portfolio(**kwargs) -> Portfolio:
+    kwargs.setdefault("initial_cash", 100_000.0)
+    kwargs.setdefault("commission", 0.0)
+    kwargs.setdefault("slippage_bps", 0.0)
+    return Portfolio(**kwargs)
+
+
+class TestEquity:
+    def test_long_and_short_mark_to_market(self):
+        p = _portfolio()
+        p.open_long("BTC/USDT", 1.0, 100.0)
+        p.open_short("ETH/USDT", 2.0, 50.0)
+        cash = p.cash
+        # Long +10, short -2 * 5
+        assert p.get_equity({"BTC/USDT": 110.0, "ETH/USDT": 55.0}) == pytest.approx(cash)
+        assert p.get_equity({"BTC/USDT": 90.0, "ETH/USDT": 40.0}) == pytest.approx(cash - 10 + 20)
+
+    def test_missing_price_marks_at_entry(self):
+        p = _portfolio()
+        p.open_long("BTC/USDT", 1.0, 100.0)
+        assert p.get_equity({}) == pytest.approx(p.cash)
+
+    def test_kernel_and_numpy_paths_agree(self, monkeypatch):
+        import core.portfolio as portfolio
+
+        p = _portfolio()
+        for i in range(10):
+            (p.open_long if i % 2 else p.open_short)(f"C{i}", 1.0 + i, 100.0)
+        prices = {f"C{i}": 95.0 + i for i in range(0, 10, 3)}
+        equity = p.get_equity(prices)
+        monkeypatch.setattr(portfolio, "NUMBA_AVAILABLE", not portfolio.NUMBA_AVAILABLE)
+        assert p.get_equity(prices) == pytest.approx(equity)
+
+    def test_memo_reused_until_trade(self, monkeypatch):
+        p = _portfolio()
+        p.open_long("BTC/USDT", 1.0, 100.0)
+        prices = {"BTC/USDT": 110.0, "ETH/USDT": 50.0}
+        calls = []
+        unrealized = p._unrealized
+        monkeypatch.setattr(p, "_unrealized", lambda cp: calls.append(1) or unrealized(cp))
+
+        equity = p.get_equity(prices)
+        assert p.get_equity(prices) == equity
+        assert p.get_equity(dict(prices)) == equity
+        # Only the open symbols' prices matter
+        assert p.get_equity({**prices, "ETH/USDT": 60.0}) == equity
+        assert len(calls) == 1
+
+        p.open_short("ETH/USDT", 1.0, 40.0)
+        assert p.get_equity(prices) == pytest.approx(p.cash + 10.0 - 10.0)
+        assert len(calls) == 2
+
+    def test_memo_sees_in_place_price_update(self):
+        p = _portfolio()
+        p.open_long("BTC/USDT", 1.0, 100.0)
+        prices = {"BTC/USDT": 110.0}
+        assert p.get_equity(prices) == pytest.approx(p.cash + 10.0)
+        prices["BTC/USDT"] = 90.0
+        assert p.get_equity(prices) == pytest.approx(p.cash - 10.0)
+
+    def test_empty_portfolio(self):
+        p = _portfolio()
+        assert p.get_equity({"BTC/USDT": 1.0}) == 100_000.0
+
+
+class TestPositions:
+    def test_get_position_snapshot(self):
+        p = _portfolio()
+        p.open_short("ETH/USDT", 2.0, 50.0, stop=55.0, strategy="S")
+        pos = p.get_position("ETH/USDT")
+        assert (pos.side, pos.size, pos.entry_price, pos.stop, pos.tp) == (
+            "SHORT", 2.0, 50.0, 55.0, None
+        )
+        assert pos.strategy == "S"
+        assert not hasattr(pos, "__dict__")
+        assert p.get_position("BTC/USDT") is None
+
+    def test_entry_time_is_naive_utc(self):
+        from datetime import datetime
+
+        p = _portfolio()
+        p.open_long("BTC/USDT", 1.0, 100.0)
+        entry_time = p.get_position("BTC/USDT").entry_time
+        assert entry_time.tzinfo is None
+        assert abs((datetime.utcnow() - entry_time).total_seconds()) < 5
+
+    def test_close_frees_slot_and_keeps_others(self):
+        p = _portfolio()
+        for i in range(12):  # past the initial slot count
+            p.open_long(f"C{i}/USDT", 1.0, 10.0 + i)
+        p.close_long("C0/USDT", 10.0)
+        p.close_long("C5/USDT", 15.0)
+        assert not p.has_position("C0/USDT")
+        assert list(p.positions) == [f"C{i}/USDT" for i in range(12) if i not in (0, 5)]
+        assert p.get_position("C11/USDT").entry_price == 21.0
+        assert p.get_status({})["open_positions"] == 10
+
+    def test_reopen_after_close(self):
+        p = _portfolio()
+        p.open_long("BTC/USDT", 1.0, 100.0)
+        p.close_long("BTC/USDT", 100.0)
+        p.open_short("BTC/USDT", 1.0, 100.0)
+        assert p.get_position("BTC/USDT").side == "SHORT"
+        with pytest.raises(ValueError):
+            p.close_long("BTC/USDT", 100.0)
+
+    def test_side_values_are_signs(self):
+        from core.portfolio import Side
+
+        assert Side.LONG * (110.0 - 100.0) == 10.0
+        assert Side.SHORT * (110.0 - 100.0) == -10.0
+        p = _portfolio()
+        p.open_long("BTC/USDT", 1.0, 100.0)
+        with pytest.raises(ValueError, match="not SHORT"):
+            p.close_short("BTC/USDT", 100.0)
+
+    def test_close_pnl(self):
+        p = _portfolio()
+        p.open_long("BTC/USDT", 2.0, 100.0)
+        _, pnl, _, _ = p.close_long("BTC/USDT", 110.0)
+        assert pnl == pytest.approx(20.0)
+        p.open_short("BTC/USDT", 2.0, 100.0)
+        _, pnl, _, _ = p.close_short("BTC/USDT", 110.0)
+        assert pnl == pytest.approx(-20.0)
+        assert p.cash == pytest.approx(100_000.0)
+
+
+class TestCosts:
+    def test_slippage_and_fees(self):
+        p = _portfolio(slippage_bps=10.0, commission=0.001)
+        fill, fees, slippage = p.open_long("BTC/USDT", 1.0, 100.0)
+        assert fill == pytest.approx(100.1)
+        assert slippage == pytest.approx(0.1)
+        assert fees == pytest.approx(0.1001)
+        fill, _, _, _ = p.close_long("BTC/USDT", 100.0)
+        assert fill == pytest.approx(99.9)
+
+    def test_slippage_change_applies(self):
+        p = _portfolio(slippage_bps=10.0)
+        p.slippage_bps = 0.0
+        fill, _, _ = p.open_short("BTC/USDT", 1.0, 100.0)
+        assert fill == 100.0
+
+
+class TestStopsAndTps:
+    def test_hits_reported_in_open_order(self):
+        p = _portfolio()
+        p.open_long("A", 1.0, 100.0, stop=95.0, tp=110.0)
+        p.open_short("B", 1.0, 100.0, stop=105.0, tp=90.0)
+        p.open_long("C", 1.0, 100.0, stop=95.0)
+        p.open_short("D", 1.0, 100.0)
+        hits = p.check_stops_and_tps({"A": 111.0, "B": 106.0, "C": 100.0, "D": 1.0})
+        assert hits == [
+            {"symbol": "A", "reason": "take_profit", "price": 111.0},
+            {"symbol": "B", "reason": "stop_loss", "price": 106.0},
+        ]
+
+    def test_short_take_profit_and_long_stop(self):
+        p = _portfolio()
+        p.open_long("A", 1.0, 100.0, stop=95.0, tp=110.0)
+        p.open_short("B", 1.0, 100.0, stop=105.0, tp=90.0)
+        hits = p.check_stops_and_tps({"A": 95.0, "B": 90.0})
+        assert [(h["symbol"], h["reason"]) for h in hits] == [
+            ("A", "stop_loss"), ("B", "take_profit"),
+        ]
+
+    def test_missing_price_skipped(self):
+        p = _portfolio()
+        p.open_long("A", 1.0, 100.0, stop=95.0)
+        assert p.check_stops_and_tps({"B": 1.0}) == []
+
+    def test_vector_path_matches_loop(self, monkeypatch):
+        import core.portfolio as portfolio
+
+        p = _portfolio()
+        prices = {}
+        for i in range(20):
+            sym = f"C{i}"
+            if i % 2:
+                p.open_long(sym, 1.0, 100.0, stop=95.0, tp=105.0 if i % 3 else None)
+            else:
+                p.open_short(sym, 1.0, 100.0, stop=105.0 if i % 4 else None, tp=95.0)
+            prices[sym] = 90.0 + i
+        p.close_short("C0", 100.0)
+        loop = p.check_stops_and_tps(prices)
+        monkeypatch.setattr(portfolio, "VECTOR_MIN_POSITIONS", 1)
+        assert p.check_stops_and_tps(prices) == loop
+        monkeypatch.setattr(portfolio, "NUMBA_AVAILABLE", not portfolio.NUMBA_AVAILABLE)
+        assert p.check_stops_and_tps(prices) == loop
+        assert loop
@@ -0,0 +1,82 @@
+"""
+Tests for core/rate_limiter.py — token-bucket request budget.
+"""
+
+import pytest
+
+from core.rate_limiter import RateLimiter
+
+
+class _Clock:
+    def __init__(self, start: float = 1000.0):
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    c = _Clock()
+    monkeypatch.setattr("core.rate_limiter.time.monotonic", c)
+    return c
+
+
+class TestTryAcquire:
+    def test_takes_tokens_when_available(self, clock):
+        limiter = RateLimiter(max_requests=10, window_seconds=60, safety_margin=1.0)
+        assert limiter.try_acquire(4)
+        assert limiter.available == 6
+
+    def test_refuses_without_partial_take(self, clock):
+        limiter = RateLimiter(max_requests=10, window_seconds=60, safety_margin=1.0)
+        assert limiter.try_acquire(8)
+        assert not limiter.try_acquire(3)
+        assert limiter.available == 2
+
+    def test_window_expiry_frees_tokens(self, clock):
+        limiter = RateLimiter(max_requests=10, window_seconds=60, safety_margin=1.0)
+        assert limiter.try_acquire(10)
+        assert not limiter.try_acquire(1)
+        clock.now += 61
+        assert limiter.try_acquire(10)
+
+    def test_shares_budget_with_acquire(self, clock):
+        limiter = RateLimiter(max_requests=10, window_seconds=60, safety_margin=1.0)
+        assert limiter.acquire(weight=7) == 0.0
+        assert limiter.try_acquire(3)
+        assert not limiter.try_acquire(1)
+
+
+@pytest.fixture
+def sleeps(monkeypatch, clock):
+    slept = []
+
+    def fake_sleep(seconds):
+        slept.append(seconds)
+        clock.now += seconds
+
+    monkeypatch.setattr("core.rate_limiter.time.sleep", fake_sleep)
+    return slept
+
+
+class TestTokenBucket:
+    def test_refills_at_window_rate(self, clock):
+        limiter = RateLimiter(max_requests=10, window_seconds=60, safety_margin=1.0)
+        limiter.acquire(weight=10)
+        clock.now += 30
+        assert limiter.available == 5
+        assert limiter.usage_pct == pytest.approx(0.5)
+        clock.now += 600
+        assert limiter.available == 10
+
+    def test_acquire_sleeps_for_deficit(self, clock, sleeps):
+        limiter = RateLimiter(max_requests=10, window_seconds=60, safety_margin=1.0)
+        assert limiter.acquire(weight=8) == 0.0
+        assert limiter.acquire(weight=4) == pytest.approx(12.0)
+        assert sleeps == [pytest.approx(12.0)]
+        assert limiter.available == 0
+
+    def test_weight_above_capacity(self, clock, sleeps):
+        limiter = RateLimiter(max_requests=10, window_seconds=60, safety_margin=1.0)
+        assert limiter.acquire(weight=15) == pytest.approx(30.0)
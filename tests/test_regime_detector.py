@@ -12,6 +12,7 @@ from core.regime_detector import (
     compute_hurst,
     compute_adx,
     classify_regime,
+    clear_regime_cache,
 )
 
 
@@ -59,6 +60,49 @@ def _make_ohlcv(close_series: pd.Series) -> pd.DataFrame:
     })
 
 
+def _reference_hurst(series: pd.Series, window: int = 100) -> float:
+    """Chunk-by-chunk R/S Hurst estimate the optimised version must match."""
+    ts = series.dropna().values[-window:]
+    if len(ts) < 20:
+        return 0.5
+    returns = np.diff(np.log(ts))
+    sizes, rs_values = [], []
+    for size in range(10, min(len(returns) // 2, 50) + 1, 2):
+        rs_chunk = []
+        for i in range(len(returns) // size):
+            chunk = returns[i * size : (i + 1) * size]
+            deviate = np.cumsum(chunk - np.mean(chunk))
+            s = np.std(chunk, ddof=1)
+            if s > 1e-12:
+                rs_chunk.append((np.max(deviate) - np.min(deviate)) / s)
+        if rs_chunk:
+            sizes.append(size)
+            rs_values.append(np.mean(rs_chunk))
+    if len(sizes) < 3:
+        return 0.5
+    slope = np.polyfit(np.log(sizes), np.log(rs_values), 1)[0]
+    return float(np.clip(slope, 0.0, 1.0))
+
+
+def _reference_adx(high, low, close, period=14) -> float:
+    """Pandas ADX formulation the optimised versions must match."""
+    prev_close = close.shift(1)
+    tr = pd.concat(
+        [high - low, (high - prev_close).abs(), (low - prev_close).abs()], axis=1
+    ).max(axis=1)
+    up_move = high - high.shift(1)
+    down_move = low.shift(1) - low
+    plus_dm = pd.Series(np.where((up_move > down_move) & (up_move > 0), up_move, 0.0))
+    minus_dm = pd.Series(np.where((down_move > up_move) & (down_move > 0), down_move, 0.0))
+    ewm = dict(alpha=1 / period, min_periods=period, adjust=False)
+    atr = tr.reset_index(drop=True).ewm(**ewm).mean()
+    plus_di = 100 * plus_dm.ewm(**ewm).mean() / atr
+    minus_di = 100 * minus_dm.ewm(**ewm).mean() / atr
+    dx = 100 * (plus_di - minus_di).abs() / (plus_di + minus_di).replace(0, np.nan)
+    latest = dx.ewm(**ewm).mean().dropna()
+    return float(latest.iloc[-1]) if not latest.empty else 0.0
+
+
 # ---------------------------------------------------------------------------
 # Hurst Exponent tests
 # ---------------------------------------------------------------------------
@@ -85,6 +129,28 @@ class TestHurstExponent:
         # Flat series has 0 variance — should gracefully return 0.5
         assert 0.0 <= h <= 1.0
 
+    @pytest.mark.parametrize("make", [
+        _trending_series, _mean_reverting_series, _random_walk_series,
+    ])
+    @pytest.mark.parametrize("window", [30, 100, 150])
+    @pytest.mark.parametrize("kernel", [True, False])
+    def test_matches_reference(self, make, window, kernel, monkeypatch):
+        import core.regime_detector as rd
+
+        monkeypatch.setattr(rd, "NUMBA_AVAILABLE", kernel)
+        series = make(200)
+        assert compute_hurst(series, window=window) == pytest.approx(
+            _reference_hurst(series, window=window), abs=1e-9
+        )
+
+    def test_nan_gaps_use_last_valid_bars(self):
+        series = _trending_series(200)
+        gappy = series.copy()
+        gappy.iloc[[150, 190]] = np.nan
+        assert compute_hurst(gappy, window=100) == pytest.approx(
+            _reference_hurst(gappy, window=100), abs=1e-9
+        )
+
     def test_output_clamped_to_0_1(self):
         series = _trending_series(200)
         h = compute_hurst(series, window=100)
@@ -107,6 +173,39 @@ class TestADX:
         adx = compute_adx(df["high"], df["low"], df["close"], period=14)
         assert adx == 0.0
 
+    @pytest.mark.parametrize("case", ["trend", "random", "flat", "gaps", "short"])
+    def test_matches_reference(self, case, monkeypatch):
+        import core.regime_detector as rd
+
+        if case == "trend":
+            df = _make_ohlcv(_trending_series(300, drift=0.004))
+        elif case == "flat":
+            df = _make_ohlcv(pd.Series([100.0] * 60))
+        elif case == "short":
+            df = _make_ohlcv(_random_walk_series(20))
+        else:
+            df = _make_ohlcv(_random_walk_series(300))
+        if case == "gaps":
+            df.iloc[[5, 40, 41, 200], df.columns.get_loc("close")] = np.nan
+            df.iloc[120, df.columns.get_loc("high")] = np.nan
+
+        expected = _reference_adx(df["high"], df["low"], df["close"], period=14)
+        for kernel in (False, True):
+            monkeypatch.setattr(rd, "NUMBA_AVAILABLE", kernel)
+            adx = compute_adx(df["high"], df["low"], df["close"], period=14)
+            assert adx == pytest.approx(expected, rel=1e-9, abs=1e-12)
+
+    @pytest.mark.parametrize("alpha", [0.5, 1 / 14])
+    def test_smoother_nan_gaps_match_pandas(self, alpha):
+        from core.regime_detector import _ewm_update
+
+        # alpha 0.5 (period 2) is pandas' com == 1 special case
+        x = np.array([np.nan, 1.0, 2.0, np.nan, 4.0, np.nan, np.nan, 5.0, 6.0])
+        expected = pd.Series(x).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+        weighted, old_wt, nobs = np.full(1, np.nan), np.ones(1), np.zeros(1, np.int64)
+        out = [_ewm_update(weighted, old_wt, nobs, 0, cur, alpha) for cur in x]
+        np.testing.assert_allclose(out, expected, rtol=1e-12)
+
     def test_adx_returns_positive(self):
         df = _make_ohlcv(_random_walk_series(200))
         adx = compute_adx(df["high"], df["low"], df["close"], period=14)
@@ -144,3 +243,54 @@ class TestRegimeClassification:
         df = _make_ohlcv(_trending_series(200))
         state = classify_regime(df)
         assert 0.0 <= state.confidence <= 1.0
+
+
+class TestRegimeCache:
+    @pytest.fixture(autouse=True)
+    def _clean_cache(self):
+        clear_regime_cache()
+        yield
+        clear_regime_cache()
+
+    def test_same_bar_reuses_result(self, monkeypatch):
+        import core.regime_detector as rd
+
+        df = _make_ohlcv(_trending_series(200))
+        calls = []
+        hurst = rd.compute_hurst
+        monkeypatch.setattr(rd, "compute_hurst", lambda *a, **k: calls.append(1) or hurst(*a, **k))
+        first = classify_regime(df, symbol="BTC/USDT")
+        assert classify_regime(df.copy(), symbol="BTC/USDT") is first
+        assert len(calls) == 1
+        classify_regime(df)
+        assert len(calls) == 2
+
+    def test_new_or_revised_bar_recomputes(self):
+        df = _make_ohlcv(_trending_series(201))
+        first = classify_regime(df.iloc[:200], symbol="BTC/USDT")
+        assert classify_regime(df, symbol="BTC/USDT") is not first
+        revised = df.copy()
+        revised.iloc[-1, revised.columns.get_loc("close")] *= 1.01
+        assert classify_regime(revised, symbol="BTC/USDT") is not first
+        assert classify_regime(df.iloc[:200], symbol="ETH/USDT") is not first
+
+
+def _branchy_regime(h: float, a: float) -> Regime:
+    if h > 0.60 and a > 25:
+        return Regime.TRENDING_STRONG
+    if h > 0.55 and a > 20:
+        return Regime.TRENDING_WEAK
+    if h < 0.45 and a < 20:
+        return Regime.MEAN_REVERTING
+    return Regime.RANDOM_WALK
+
+
+class TestRegimeTable:
+    def test_matches_threshold_cascade(self):
+        from core.regime_detector import _REGIME_TABLE, _adx_bin, _hurst_bin
+
+        hursts = [0.0, 0.44, 0.45, 0.5, 0.55, 0.56, 0.60, 0.61, 1.0, float("nan")]
+        adxs = [0.0, 19.9, 20.0, 20.1, 25.0, 25.1, 60.0, float("nan")]
+        for h in hursts:
+            for a in adxs:
+                assert _REGIME_TABLE[_hurst_bin(h)][_adx_bin(a)] is _branchy_regime(h, a), (h, a)
@@ -51,6 +51,34 @@ class TestHalfKelly:
         kelly_f = rm._compute_kelly_fraction()
         assert kelly_f is None  # needs both wins and losses
 
+    def test_kelly_uses_last_lookback_trades(self):
+        rm = RiskManager(initial_equity=10000, kelly_lookback=20, kelly_fraction=0.5,
+                         risk_per_trade=0.2)
+        # Old losing streak falls out of the window
+        self._seed_trades(rm, n_wins=0, n_losses=40, avg_loss=30.0)
+        for i in range(20):
+            rm.register_trade_close(50.0 if i % 4 else -30.0, symbol="TEST")
+        # W = 0.75: f* = 0.5 * (0.75 * 50 - 0.25 * 30) / 50
+        assert rm._compute_kelly_fraction() == pytest.approx(0.5 * 30.0 / 50.0)
+
+    def test_running_sums_match_window(self):
+        rm = RiskManager(initial_equity=1e6, kelly_lookback=15, kelly_fraction=0.5,
+                         risk_per_trade=1.0)
+        rng = np.random.default_rng(11)
+        for pnl in np.round(rng.normal(5, 40, 100), 2):
+            rm.register_trade_close(float(pnl), symbol="TEST")
+            recent = [t["pnl"] for t in rm.trade_history[-15:]]
+            wins = [p for p in recent if p > 0]
+            losses = [-p for p in recent if p < 0]
+            if len(recent) < 10 or not wins or not losses:
+                assert rm._compute_kelly_fraction() is None
+                continue
+            w = len(wins) / len(recent)
+            kelly = (w * np.mean(wins) - (1 - w) * np.mean(losses)) / np.mean(wins)
+            assert rm._compute_kelly_fraction() == pytest.approx(
+                float(np.clip(0.5 * kelly, 0.0, 2.0)), abs=1e-12
+            )
+
     def test_kelly_with_mixed_history(self):
         rm = RiskManager(initial_equity=10000, kelly_lookback=50, kelly_fraction=0.5,
                          risk_per_trade=0.01)
@@ -123,6 +151,22 @@ class TestCorrelationGuard:
         scale = rm.compute_correlation_guard(prices)
         assert scale < 1.0, f"Correlated assets should reduce scale, got {scale}"
 
+    def test_matrix_matches_pairwise(self):
+        rm = RiskManager(correlation_threshold=0.50)
+        rng = np.random.default_rng(3)
+        base = np.cumsum(rng.normal(0, 1, 60))
+        prices = {
+            "A": list(200 + base),
+            "B": list(200 + base + np.cumsum(rng.normal(0, 0.8, 60))),
+            "C": list(200 + np.cumsum(rng.normal(0, 1, 60))),
+        }
+        equal = rm.compute_correlation_guard(prices)
+        # A longer history for one symbol takes the pairwise path; only its
+        # tail is compared, so the result is the same
+        prices["C"] = list(200 + np.cumsum(rng.normal(0, 1, 20))) + prices["C"]
+        assert rm.compute_correlation_guard(prices) == pytest.approx(equal)
+        assert equal < 1.0
+
     def test_single_asset_no_reduction(self):
         rm = RiskManager(correlation_threshold=0.80)
         prices = {"BTC/USDT": list(range(100, 150))}